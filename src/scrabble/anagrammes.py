@@ -0,0 +1,123 @@
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import combinations_with_replacement, product
+
+from .chevalet import SYMBOLE_JOKER
+from .lexique import ALPHABET
+
+
+def signature(lettres: str) -> str:
+    """Renvoie la signature d'un ensemble de lettres: ses lettres triées.
+
+    Examples:
+        >>> signature("MONDE")
+        'DEMNO'
+    """
+    return "".join(sorted(lettres))
+
+
+def _sans_jokers(lettres: str) -> Iterator[str]:
+    """Énumère les signatures des lettres données où chaque joker ("?") est remplacé
+    par une lettre, de toutes les manières possibles.
+
+    Examples:
+        >>> len(list(_sans_jokers("A??")))
+        351
+    """
+    jokers = lettres.count(SYMBOLE_JOKER)
+    lettres = lettres.replace(SYMBOLE_JOKER, "")
+    for remplacement in combinations_with_replacement(ALPHABET, jokers):
+        yield signature(lettres + "".join(remplacement))
+
+
+class IndexAnagrammes:
+    """Index des mots du dictionnaire par signature. Tous les mots qui s'écrivent avec
+    exactement les mêmes lettres partagent une entrée.
+    """
+
+    def __init__(self) -> None:
+        self._mots: dict[str, list[str]] = {}
+
+    @classmethod
+    def depuis_mots(cls, mots: Iterable[str]) -> "IndexAnagrammes":
+        """Construit l'index des mots donnés (par exemple un Lexique)."""
+        index = cls()
+        for mot in mots:
+            index.ajouter(mot)
+        return index
+
+    @classmethod
+    def depuis_fichier(cls, nom_fichier_dictionnaire: str) -> "IndexAnagrammes":
+        """Construit l'index à partir du même fichier texte que list_dico."""
+        with open(nom_fichier_dictionnaire, encoding="utf-8") as fichier:
+            return cls.depuis_mots(t for ligne in fichier if (t := ligne.strip()))
+
+    def ajouter(self, mot: str) -> None:
+        """Ajoute un mot à l'index."""
+        mots = self._mots.setdefault(signature(mot), [])
+        if mot not in mots:
+            mots.append(mot)
+
+    def __len__(self) -> int:
+        return len(self._mots)
+
+    def anagrammes(self, lettres: str) -> list[str]:
+        """Renvoie les mots qui utilisent exactement toutes les lettres données. Un
+        joker ("?") peut y prendre la place de n'importe quelle lettre.
+
+        Examples:
+            >>> IndexAnagrammes.depuis_mots(["MONDE", "DEMON"]).anagrammes("NOMED")
+            ['MONDE', 'DEMON']
+            >>> IndexAnagrammes.depuis_mots(["MONDE", "DEMON"]).anagrammes("NOM?D")
+            ['MONDE', 'DEMON']
+        """
+        mots = []
+        for cle in _sans_jokers(lettres):
+            mots.extend(self._mots.get(cle, ()))
+        return mots
+
+    def sous_ensembles(self, chevalet: str) -> Iterator[str]:
+        """Énumère les signatures de tous les sous-multi-ensembles non vides du
+        chevalet, chacune une seule fois (au plus 128 pour 7 lettres distinctes).
+        Chaque joker ("?") y est remplacé par chacune des 26 lettres.
+        """
+        compte = sorted(Counter(chevalet).items())
+        vues = set()
+        for choix in product(*(range(n + 1) for _, n in compte)):
+            lettres = "".join(
+                lettre * n for (lettre, _), n in zip(compte, choix, strict=True)
+            )
+            for sous_ensemble in _sans_jokers(lettres):
+                if sous_ensemble and sous_ensemble not in vues:
+                    vues.add(sous_ensemble)
+                    yield sous_ensemble
+
+    def mots_formables(
+        self, chevalet: str, lettres_plateau: str = "", longueur_min: int = 1
+    ) -> list[str]:
+        """Renvoie les mots qui s'écrivent avec au moins une lettre du chevalet et toutes
+        les lettres du plateau données, triés du plus long au plus court puis par ordre
+        alphabétique. Un joker ("?") du chevalet peut remplacer n'importe quelle lettre.
+
+        Args:
+            chevalet (str): Les lettres du joueur.
+            lettres_plateau (str): Les lettres déjà posées que le mot doit utiliser.
+            longueur_min (int): La longueur minimale des mots renvoyés.
+
+        Returns:
+            list[str]: Les mots formables.
+
+        Examples:
+            >>> index = IndexAnagrammes.depuis_mots(["DES", "MES", "DEMONS", "ON"])
+            >>> index.mots_formables("SEDX")
+            ['DES']
+            >>> index.mots_formables("SEDX", "MON")
+            ['DEMONS']
+        """
+        mots = []
+        for sous_ensemble in self.sous_ensembles(chevalet):
+            lettres = sous_ensemble + lettres_plateau
+            if len(lettres) >= longueur_min:
+                mots.extend(self._mots.get(signature(lettres), ()))
+        mots.sort(key=lambda mot: (-len(mot), mot))
+        return mots
@@ -0,0 +1,145 @@
+from collections.abc import Container, Iterable, Sequence
+
+from .lexique import ALPHABET
+
+# Disposition des cases bonus, une chaine par ligne du plateau:
+#   "." case normale, "d" lettre compte double, "t" lettre compte triple,
+#   "D" mot compte double, "T" mot compte triple.
+DISPOSITION_STANDARD = (
+    "T..d...T...d..T",
+    ".D...t...t...D.",
+    "..D...d.d...D..",
+    "d..D...d...D..d",
+    "....D.....D....",
+    ".t...t...t...t.",
+    "..d...d.d...d..",
+    "T..d...D...d..T",
+    "..d...d.d...d..",
+    ".t...t...t...t.",
+    "....D.....D....",
+    "d..D...d...D..d",
+    "..D...d.d...D..",
+    ".D...t...t...D.",
+    "T..d...T...d..T",
+)
+
+# Multiplicateurs (lettre, mot) de chaque symbole de la disposition.
+SYMBOLES_BONUS = {
+    ".": (1, 1),
+    "d": (2, 1),
+    "t": (3, 1),
+    "D": (1, 2),
+    "T": (1, 3),
+}
+
+
+class Multiplicateurs:
+    """Tables des multiplicateurs de lettre et de mot de chaque case du plateau,
+    rangées ligne par ligne (la case (li, c) est à l'indice li * colonnes + c).
+    """
+
+    __slots__ = ("colonnes", "lettre", "lignes", "mot")
+
+    def __init__(self, disposition: Sequence[str] = DISPOSITION_STANDARD) -> None:
+        """
+        Args:
+            disposition (Sequence[str]): Une chaine par ligne du plateau, chaque
+                caractère étant un symbole de SYMBOLES_BONUS.
+
+        Raises:
+            ValueError: Si les lignes n'ont pas toutes la même longueur ou si un
+                symbole est inconnu.
+        """
+        self.lignes = len(disposition)
+        self.colonnes = len(disposition[0]) if disposition else 0
+        self.lettre: list[int] = []
+        self.mot: list[int] = []
+        for li, ligne in enumerate(disposition):
+            if len(ligne) != self.colonnes:
+                raise ValueError(
+                    f"la ligne {li} de la disposition n'a pas la bonne longueur"
+                )
+            for c, symbole in enumerate(ligne):
+                if symbole not in SYMBOLES_BONUS:
+                    raise ValueError(
+                        f"symbole de case bonus inconnu en ({li}, {c}): {symbole!r}"
+                    )
+                lettre, mot = SYMBOLES_BONUS[symbole]
+                self.lettre.append(lettre)
+                self.mot.append(mot)
+
+    @classmethod
+    def depuis_fichier(cls, nom_fichier: str) -> "Multiplicateurs":
+        """Lit la disposition d'un fichier texte (une ligne du plateau par ligne, les
+        lignes vides sont ignorées).
+        """
+        with open(nom_fichier, encoding="utf-8") as fichier:
+            return cls([t for ligne in fichier if (t := ligne.strip())])
+
+    def case(self, ligne: int, colonne: int) -> tuple[int, int]:
+        """Renvoie les multiplicateurs (lettre, mot) d'une case."""
+        indice = ligne * self.colonnes + colonne
+        return self.lettre[indice], self.mot[indice]
+
+
+class Bareme:
+    """Calcule les points d'un coup avec les cases bonus. Seules les lettres nouvellement
+    posées profitent des multiplicateurs de leur case, si bien qu'un bonus ne compte
+    qu'une fois. Compter un mot ne coûte qu'un passage sur ses lettres.
+
+    Une lettre posée avec un joker (écrite en minuscule) ne rapporte aucun point:
+    valeurs lui donne 0, comme au joker "?" lui-même.
+    """
+
+    __slots__ = ("multiplicateurs", "valeurs")
+
+    def __init__(
+        self,
+        points_lettres: dict[str, int],
+        multiplicateurs: Multiplicateurs | None = None,
+    ) -> None:
+        """
+        Args:
+            points_lettres (dict[str, int]): Les points de chaque lettre, comme les
+                renvoie load_fichier_lettres.
+            multiplicateurs (Multiplicateurs | None): Les cases bonus (la disposition
+                standard si elles ne sont pas fournies).
+        """
+        self.valeurs = dict.fromkeys(ALPHABET.lower() + "?", 0) | points_lettres
+        self.multiplicateurs = multiplicateurs or Multiplicateurs()
+
+    def points_mot(
+        self,
+        mot: str,
+        cases: Iterable[tuple[int, int]],
+        nouvelles: Container[tuple[int, int]],
+    ) -> int:
+        """Renvoie les points d'un mot formé par un coup.
+
+        Args:
+            mot (str): Le mot formé.
+            cases (Iterable[tuple[int, int]]): La position de chaque lettre du mot.
+            nouvelles (Container[tuple[int, int]]): Les cases posées pendant ce coup.
+
+        Returns:
+            int: Les points du mot.
+
+        Examples:
+            >>> bareme = Bareme({"D": 2, "E": 1, "S": 1})
+            >>> bareme.points_mot("DES", [(7, 7), (7, 8), (7, 9)], {(7, 7), (7, 8)})
+            8
+            >>> bareme.points_mot("DeS", [(7, 7), (7, 8), (7, 9)], {(7, 7), (7, 8)})
+            6
+        """
+        colonnes = self.multiplicateurs.colonnes
+        lettre_fois, mot_fois = self.multiplicateurs.lettre, self.multiplicateurs.mot
+        total = 0
+        facteur = 1
+        for lettre, case in zip(mot, cases, strict=True):
+            valeur = self.valeurs[lettre]
+            if case in nouvelles:
+                indice = case[0] * colonnes + case[1]
+                valeur *= lettre_fois[indice]
+                facteur *= mot_fois[indice]
+            total += valeur
+        return total * facteur
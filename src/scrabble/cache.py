@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class CacheLRU:
+    """Cache de taille bornée: quand il est plein, l'entrée lue ou rangée il y a le
+    plus longtemps est retirée. Il compte ses succès et ses échecs.
+
+    Les clés doivent identifier tout ce dont dépend la valeur rangée: pour un
+    résultat qui dépend du plateau, la clé contient Plateau.empreinte, si bien qu'un
+    résultat n'est plus jamais lu une fois le plateau modifié (il finit par être
+    retiré du cache).
+
+    Examples:
+        >>> cache = CacheLRU(2)
+        >>> cache.ranger("a", 1)
+        >>> cache.ranger("b", 2)
+        >>> cache.obtenir("a")
+        1
+        >>> cache.ranger("c", 3)
+        >>> "b" in cache, cache.succes, cache.echecs
+        (False, 1, 0)
+    """
+
+    __slots__ = ("_entrees", "echecs", "succes", "taille_max")
+
+    def __init__(self, taille_max: int = 4096) -> None:
+        """
+        Args:
+            taille_max (int): Le nombre maximum d'entrées (0 désactive le cache).
+        """
+        self.taille_max = taille_max
+        self.succes = 0
+        self.echecs = 0
+        self._entrees: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entrees)
+
+    def __contains__(self, cle: Hashable) -> bool:
+        return cle in self._entrees
+
+    def obtenir(self, cle: Hashable, defaut: Any = None) -> Any:
+        """Renvoie la valeur rangée sous cle, ou defaut si elle n'y est pas."""
+        entrees = self._entrees
+        if cle in entrees:
+            self.succes += 1
+            entrees.move_to_end(cle)
+            return entrees[cle]
+        self.echecs += 1
+        return defaut
+
+    def ranger(self, cle: Hashable, valeur: Any) -> None:
+        """Range une valeur sous cle, en retirant au besoin l'entrée la plus ancienne."""
+        if self.taille_max <= 0:
+            return
+        entrees = self._entrees
+        entrees[cle] = valeur
+        entrees.move_to_end(cle)
+        if len(entrees) > self.taille_max:
+            entrees.popitem(last=False)
+
+    def vider(self) -> None:
+        """Retire toutes les entrées (les compteurs sont gardés)."""
+        self._entrees.clear()
+
+    @property
+    def taux_succes(self) -> float:
+        """La part des lectures qui ont trouvé leur valeur, entre 0 et 1."""
+        lectures = self.succes + self.echecs
+        return self.succes / lectures if lectures else 0.0
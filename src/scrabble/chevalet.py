@@ -0,0 +1,107 @@
+import random
+from functools import cache
+
+from .lexique import ALPHABET
+
+# Un chevalet (ou tout multi-ensemble de jetons) est représenté par un vecteur de 27
+# entiers: compte[i] est le nombre de jetons de la lettre ALPHABET[i] et compte[JOKER]
+# celui des jokers. Les opérations ci-dessous ne font que 27 opérations sur des entiers
+# et, sauf vers_compte, vers_chaine et reste, ne créent aucun objet: elles peuvent
+# servir dans les boucles de génération des coups.
+#
+# Un joker s'écrit "?" sur le chevalet et dans la pioche. Posé, il prend la lettre
+# qu'il remplace écrite en minuscule, dans le mot du coup comme sur le plateau: une
+# lettre minuscule est donc comptée comme un joker.
+
+NB_LETTRES = len(ALPHABET)
+JOKER = NB_LETTRES
+NB_JETONS = NB_LETTRES + 1
+SYMBOLE_JOKER = "?"
+JETONS = ALPHABET + SYMBOLE_JOKER
+# Indice de chaque symbole dans un vecteur de comptes.
+INDICES: dict[str, int] = {jeton: i for i, jeton in enumerate(JETONS)}
+INDICES.update(dict.fromkeys(ALPHABET.lower(), JOKER))
+# Nombre de jetons d'une même lettre au-delà duquel empreinte n'est plus définie.
+COMPTE_MAX = 16
+
+
+def vers_compte(lettres: str) -> list[int]:
+    """Renvoie le vecteur de comptes d'une chaine de lettres.
+
+    Examples:
+        >>> vers_compte("ABA")[:3]
+        [2, 1, 0]
+        >>> vers_compte("?e")[JOKER]
+        2
+    """
+    compte = [0] * NB_JETONS
+    for lettre in lettres:
+        compte[INDICES[lettre]] += 1
+    return compte
+
+
+def vers_chaine(compte: list[int]) -> str:
+    """Renvoie les jetons d'un vecteur de comptes, dans l'ordre alphabétique puis les
+    jokers.
+    """
+    return "".join(jeton * n for jeton, n in zip(JETONS, compte, strict=True))
+
+
+def contient(compte: list[int], besoin: list[int]) -> bool:
+    """Renvoie True si compte contient au moins les lettres de besoin.
+
+    Examples:
+        >>> contient(vers_compte("SEDX"), vers_compte("DES"))
+        True
+    """
+    for i in range(NB_JETONS):
+        if besoin[i] > compte[i]:
+            return False
+    return True
+
+
+def retirer(compte: list[int], lettres: list[int]) -> None:
+    """Retire en place les lettres de compte (sans descendre sous zéro)."""
+    for i in range(NB_JETONS):
+        compte[i] = max(0, compte[i] - lettres[i])
+
+
+def ajouter(compte: list[int], lettres: list[int]) -> None:
+    """Ajoute en place les lettres à compte."""
+    for i in range(NB_JETONS):
+        compte[i] += lettres[i]
+
+
+def reste(compte: list[int], lettres: list[int]) -> list[int]:
+    """Renvoie ce qu'il reste du chevalet une fois les lettres jouées retirées.
+
+    Examples:
+        >>> vers_chaine(reste(vers_compte("SEDXA"), vers_compte("DES")))
+        'AX'
+    """
+    resultat = compte[:]
+    retirer(resultat, lettres)
+    return resultat
+
+
+@cache
+def _cles(joueur: int) -> list[int]:
+    rng = random.Random(f"chevalet {joueur}")
+    return [rng.getrandbits(64) for _ in range(NB_JETONS * COMPTE_MAX)]
+
+
+def empreinte(compte: list[int], joueur: int = 0) -> int:
+    """Renvoie l'empreinte de Zobrist (64 bits) d'un chevalet: elle ne dépend que du
+    nombre de jetons de chaque sorte, pas de leur ordre. joueur distingue les
+    chevalets des différents joueurs d'une même position.
+
+    Examples:
+        >>> empreinte(vers_compte("DES")) == empreinte(vers_compte("SED"))
+        True
+    """
+    cles = _cles(joueur)
+    resultat = 0
+    for i in range(NB_JETONS):
+        if compte[i]:
+            resultat ^= cles[i * COMPTE_MAX + compte[i]]
+    return resultat
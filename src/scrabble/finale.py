@@ -0,0 +1,369 @@
+import random
+import time
+from dataclasses import dataclass
+
+from .bonus import Bareme
+from .chevalet import empreinte, vers_compte
+from .generateur import CacheContraintes, Coup, generer_coups
+from .lexique import Lexique
+from .main import retirer_chevalet
+from .moteur import MoteurPartie
+from .ordinateur import ScoreurCoups
+from .plateau import Plateau, annuler_coup, appliquer_coup
+
+# Bornes des valeurs rangées dans la table de transposition.
+EXACTE, MINORANT, MAJORANT = 0, 1, 2
+# Profondeur rangée pour une valeur qui ne dépend d'aucun horizon de recherche.
+COMPLETE = 1 << 30
+# Place occupée en mémoire par une entrée de la table (clé, tuple et emplacement du
+# dictionnaire compris) et par un coup gardé en mémoire, mesurée avec tracemalloc.
+TAILLE_ENTREE = 330
+TAILLE_COUP = 250
+# Nombre de tours passés de suite qui termine une partie à deux (voir
+# MoteurPartie.passer).
+PASSES_FIN = 4
+
+
+class _Interruption(Exception):
+    """Levée quand le délai de la recherche est écoulé."""
+
+
+def _cles(graine: int, nombre: int) -> list[int]:
+    rng = random.Random(graine)
+    return [rng.getrandbits(64) for _ in range(nombre)]
+
+
+@dataclass(frozen=True)
+class Solution:
+    """Résultat d'une recherche de fin de partie.
+
+    valeur est l'écart de points, du point de vue du joueur qui a la main, que
+    rapporte la suite de la partie si les deux joueurs jouent au mieux; coups est
+    cette suite (None pour un tour passé). Si exacte est False, la recherche s'est
+    arrêtée avant la fin de la partie: valeur ne compte que les profondeur premiers
+    demi-coups.
+    """
+
+    valeur: int
+    coups: list[Coup | None]
+    profondeur: int
+    exacte: bool
+    noeuds: int
+    entrees: int
+    duree: float
+
+
+class SolveurFinale:
+    """Résout les fins de partie à deux joueurs quand la pioche est vide: les deux
+    chevalets sont alors connus et la meilleure suite de coups se calcule exactement.
+
+    La recherche est un alpha-bêta (negamax) par approfondissement itératif. Les coups
+    sont essayés dans cet ordre: le meilleur coup trouvé à l'itération précédente, les
+    coups qui vident le chevalet (leur valeur est connue sans chercher plus loin), les
+    coups "tueurs" qui ont provoqué une coupure à la même profondeur ailleurs dans
+    l'arbre, puis les autres par points décroissants, le tour passé en dernier. Les
+    positions déjà vues sont rangées dans une table de transposition indexée par une
+    empreinte de Zobrist du plateau, des chevalets, du joueur qui a la main et des
+    tours passés, tenue à jour à chaque coup joué ou annulé. Les coups générés pour un
+    plateau et un chevalet sont gardés, si bien qu'une itération ne regénère pas ceux
+    de la précédente. Quand la table ou les coups atteignent la mémoire permise, les
+    entrées les plus anciennes sont retirées.
+
+    La partie suit les règles de MoteurPartie: elle s'arrête quand un joueur vide son
+    chevalet ou après quatre tours passés de suite, et les lettres restées sur les
+    chevalets ne changent pas les points.
+    """
+
+    def __init__(
+        self, lexique: Lexique, bareme: Bareme, memoire: int = 256 * 2**20
+    ) -> None:
+        """
+        Args:
+            lexique (Lexique): Le dictionnaire.
+            bareme (Bareme): Les points des lettres et les cases bonus.
+            memoire (int): La mémoire permise à la table de transposition et aux coups
+                gardés en mémoire, en octets. Elle est convertie en nombres d'entrées
+                et de coups avec les tailles moyennes TAILLE_ENTREE et TAILLE_COUP:
+                la limite n'est tenue qu'approximativement.
+        """
+        self.lexique = lexique
+        self.bareme = bareme
+        # Les trois quarts de la mémoire vont à la table, le reste aux coups déjà
+        # générés, que chaque itération de la recherche redemande.
+        self.entrees_max = max(1, memoire * 3 // 4 // TAILLE_ENTREE)
+        self.coups_max = memoire // 4 // TAILLE_COUP
+        self.table: dict[int, tuple[int, int, int, Coup | None]] = {}
+        self._generes: dict[tuple[int, str], list[tuple[int, Coup, bool]]] = {}
+        self._nombre_generes = 0
+        # Les deux derniers coups qui ont provoqué une coupure, par demi-coup joué
+        # depuis la position résolue.
+        self._tueurs: dict[int, list[Coup]] = {}
+        self._cles_passes = _cles(4, PASSES_FIN)
+        self._cle_trait = _cles(5, 1)[0]
+
+    def _cle(self) -> int:
+        cle = (
+            self._plateau.empreinte ^ self._chevalets_cles[0] ^ self._chevalets_cles[1]
+        )
+        if self._trait:
+            cle ^= self._cle_trait
+        return cle ^ self._cles_passes[self._passes]
+
+    def _ranger(self, cle: int, entree: tuple) -> None:
+        table = self.table
+        if cle not in table and len(table) >= self.entrees_max:
+            del table[next(iter(table))]
+        table[cle] = entree
+
+    def _jouer(self, coup: Coup) -> tuple[list, str]:
+        """Pose un coup du joueur qui a la main et renvoie de quoi l'annuler."""
+        modifications = appliquer_coup(coup, self._plateau)
+        self._cache.mettre_a_jour((li, c) for li, c, _ in modifications)
+        posees = "".join(self._plateau[li][c] for li, c, _ in modifications)
+        joueur = self._trait
+        ancien = self._chevalets[joueur]
+        self._chevalets[joueur] = retirer_chevalet(ancien, posees, "")
+        self._chevalets_cles[joueur] = empreinte(
+            vers_compte(self._chevalets[joueur]), joueur
+        )
+        return modifications, ancien
+
+    def _annuler(self, modifications: list, ancien: str) -> None:
+        annuler_coup(self._plateau, modifications)
+        self._cache.mettre_a_jour((li, c) for li, c, _ in modifications)
+        joueur = self._trait
+        self._chevalets[joueur] = ancien
+        self._chevalets_cles[joueur] = empreinte(vers_compte(ancien), joueur)
+
+    def _coups(self) -> list[tuple[int, Coup, bool]]:
+        """Renvoie les coups du joueur qui a la main par points décroissants, avec
+        leurs points et s'ils vident son chevalet (ce qui termine la partie).
+        """
+        plateau = self._plateau
+        chevalet = self._chevalets[self._trait]
+        cle = (plateau.empreinte, "".join(sorted(chevalet)))
+        coups = self._generes.get(cle)
+        if coups is not None:
+            return coups[:]
+        tour = 1 if plateau.est_vide() else 2
+        scoreur = ScoreurCoups(plateau, self.bareme)
+        coups = []
+        for coup in generer_coups(plateau, chevalet, self.lexique, tour, self._cache):
+            points, posees = scoreur.points(coup)
+            if posees:
+                coups.append((points, coup, posees == len(chevalet)))
+        coups.sort(key=lambda candidat: candidat[0], reverse=True)
+        if len(coups) <= self.coups_max:
+            while self._nombre_generes + len(coups) > self.coups_max:
+                self._nombre_generes -= len(
+                    self._generes.pop(next(iter(self._generes)))
+                )
+            self._generes[cle] = coups
+            self._nombre_generes += len(coups)
+        return coups[:]
+
+    def _negamax(self, profondeur: int, alpha: int, beta: int) -> int:
+        self.noeuds += 1
+        if self._echeance is not None and time.perf_counter() >= self._echeance:
+            raise _Interruption
+        cle = self._cle()
+        entree = self.table.get(cle)
+        coup_table = None
+        if entree is not None:
+            profondeur_table, valeur, borne, coup_table = entree
+            if profondeur_table >= profondeur and (
+                borne == EXACTE
+                or (borne == MINORANT and valeur >= beta)
+                or (borne == MAJORANT and valeur <= alpha)
+            ):
+                if profondeur_table != COMPLETE:
+                    self._horizons += 1
+                return valeur
+        if profondeur == 0:
+            self._horizons += 1
+            return 0
+        candidats: list[tuple[int, Coup | None, bool]] = self._coups()
+        demi_coup = self._profondeur_racine - profondeur
+        tueurs = self._tueurs.get(demi_coup, ())
+        # Le tri est stable: à rang égal, les coups restent par points décroissants.
+        candidats.sort(
+            key=lambda candidat: (
+                candidat[1] != coup_table,
+                not candidat[2],
+                candidat[1] not in tueurs,
+            )
+        )
+        candidats.append((0, None, False))
+        alpha_initial, horizons = alpha, self._horizons
+        meilleur, meilleur_coup = -(1 << 30), None
+        passes = self._passes
+        for points, coup, sortie in candidats:
+            if sortie:
+                # Le joueur vide son chevalet: la partie s'arrête.
+                valeur = points
+            elif coup is not None and profondeur == 1:
+                self._horizons += 1
+                valeur = points
+            elif coup is not None and profondeur == 2 and points <= alpha:
+                # L'adversaire peut toujours passer: à l'horizon, le coup ne vaut
+                # pas plus que ses points et ne peut pas battre alpha.
+                self._horizons += 1
+                meilleur = max(meilleur, points)
+                continue
+            elif coup is None:
+                self._passes += 1
+                if self._passes >= PASSES_FIN:
+                    valeur = 0
+                else:
+                    self._trait ^= 1
+                    valeur = -self._negamax(profondeur - 1, -beta, -alpha)
+                    self._trait ^= 1
+            else:
+                modifications, ancien = self._jouer(coup)
+                self._passes = 0
+                self._trait ^= 1
+                # La fenêtre de l'adversaire tient compte des points du coup: une
+                # borne renvoyée par une coupure ne passe pas pour une valeur.
+                valeur = points - self._negamax(
+                    profondeur - 1, points - beta, points - alpha
+                )
+                self._trait ^= 1
+                self._annuler(modifications, ancien)
+            self._passes = passes
+            if valeur > meilleur:
+                meilleur, meilleur_coup = valeur, coup
+            alpha = max(alpha, valeur)
+            if alpha >= beta:
+                if coup is not None and not sortie:
+                    tueurs = self._tueurs.setdefault(demi_coup, [])
+                    if coup not in tueurs:
+                        tueurs.insert(0, coup)
+                        del tueurs[2:]
+                break
+        if meilleur <= alpha_initial:
+            borne = MAJORANT
+        elif meilleur >= beta:
+            borne = MINORANT
+        else:
+            borne = EXACTE
+        complete = self._horizons == horizons
+        self._ranger(
+            cle, (COMPLETE if complete else profondeur, meilleur, borne, meilleur_coup)
+        )
+        return meilleur
+
+    def _preparer(self, plateau, chevalets: tuple[str, str], passes: int) -> None:
+        if isinstance(plateau, Plateau):
+            plateau = plateau.copie()
+        else:
+            plateau = Plateau.depuis_listes(plateau)
+        self._plateau = plateau
+        self._cache = CacheContraintes(plateau, self.lexique)
+        self._chevalets = list(chevalets)
+        self._trait = 0
+        self._passes = passes
+        self._chevalets_cles = [
+            empreinte(vers_compte(chevalet), joueur)
+            for joueur, chevalet in enumerate(chevalets)
+        ]
+
+    def _variante(self, profondeur: int) -> list[Coup | None]:
+        """Lit dans la table la suite de coups trouvée depuis la position préparée."""
+        coups: list[Coup | None] = []
+        while len(coups) < profondeur and self._passes < PASSES_FIN:
+            entree = self.table.get(self._cle())
+            if entree is None:
+                break
+            coup = entree[3]
+            coups.append(coup)
+            if coup is None:
+                self._passes += 1
+            else:
+                self._jouer(coup)
+                self._passes = 0
+                if not self._chevalets[self._trait]:
+                    break
+            self._trait ^= 1
+        return coups
+
+    def resoudre(
+        self,
+        plateau,
+        chevalets: tuple[str, str],
+        passes: int = 0,
+        delai: float | None = None,
+        profondeur_max: int | None = None,
+    ) -> Solution:
+        """Cherche la meilleure suite de coups d'une fin de partie.
+
+        La profondeur de recherche augmente d'un demi-coup à chaque itération, jusqu'à
+        ce qu'aucune suite de coups ne soit plus coupée par l'horizon (la solution est
+        alors exacte), que profondeur_max soit atteinte ou que le délai soit écoulé. La
+        première itération est toujours menée à son terme.
+
+        Args:
+            plateau (Plateau | list[list[str]]): Le plateau de jeu.
+            chevalets (tuple[str, str]): Le chevalet du joueur qui a la main puis celui
+                de son adversaire.
+            passes (int): Le nombre de tours passés de suite jusqu'ici.
+            delai (float | None): Le temps accordé à la recherche, en secondes.
+            profondeur_max (int | None): Le nombre maximum de demi-coups examinés.
+
+        Returns:
+            Solution: La valeur de la position et la suite de coups qui l'atteint.
+        """
+        debut = time.perf_counter()
+        self.noeuds = 0
+        self._echeance = None
+        self._tueurs = {}
+        resultat: tuple[int, int, bool, list[Coup | None]] = (0, 0, False, [])
+        profondeur = 1
+        while profondeur_max is None or profondeur <= profondeur_max:
+            self._preparer(plateau, chevalets, passes)
+            self._horizons = 0
+            self._profondeur_racine = profondeur
+            try:
+                valeur = self._negamax(profondeur, -(1 << 30), 1 << 30)
+            except _Interruption:
+                break
+            exacte = self._horizons == 0
+            # La suite de coups est lue tout de suite: l'itération suivante peut
+            # retirer ses entrées de la table si celle-ci est pleine.
+            self._preparer(plateau, chevalets, passes)
+            resultat = (valeur, profondeur, exacte, self._variante(profondeur))
+            if exacte:
+                break
+            if delai is not None:
+                self._echeance = debut + delai
+            profondeur += 1
+        valeur, profondeur, exacte, coups = resultat
+        return Solution(
+            valeur,
+            coups,
+            profondeur,
+            exacte,
+            self.noeuds,
+            len(self.table),
+            time.perf_counter() - debut,
+        )
+
+
+def resoudre_finale(
+    moteur: MoteurPartie,
+    delai: float | None = None,
+    memoire: int = 256 * 2**20,
+) -> Solution:
+    """Résout la fin d'une partie à deux joueurs dont la pioche est vide, du point de
+    vue du joueur courant.
+
+    Raises:
+        ValueError: Si la partie n'a pas deux joueurs, si la pioche n'est pas vide ou
+            si la partie est terminée.
+    """
+    etat = moteur.etat
+    if len(etat.joueurs) != 2 or len(etat.pioche) or etat.terminee:
+        raise ValueError("la fin de partie se résout à deux joueurs, pioche vide")
+    adversaire = etat.joueurs[1 - etat.courant]
+    solveur = SolveurFinale(moteur.dictionnaire, moteur.bareme, memoire)
+    chevalets = (moteur.joueur_courant.chevalet, adversaire.chevalet)
+    return solveur.resoudre(etat.plateau, chevalets, min(etat.passes, 3), delai)
@@ -0,0 +1,405 @@
+from collections.abc import Iterable, Sequence
+
+from .chevalet import INDICES, JOKER, vers_compte
+from .lexique import ALPHABET, CODES, DECALAGE, MASQUE_LETTRE, TERMINAL, Lexique
+from .plateau import Plateau
+
+# Contraintes croisées d'une case vide pour une direction de jeu: le bit i est levé si
+# la lettre ALPHABET[i] peut y être posée, le bit FORME si y poser une lettre forme un
+# mot perpendiculaire (au sens de mots_perpendiculaires).
+TOUTES = (1 << 26) - 1
+FORME = 1 << 26
+
+Coup = tuple[str, tuple[int, int], str]
+# Case d'où partent des coups: (direction, indice de la ligne de jeu, première case).
+Depart = tuple[str, int, int]
+# Code de chaque lettre du plateau, posée avec un joker (en minuscule) ou non.
+CODES_CASES = CODES | {lettre.lower(): code for lettre, code in CODES.items()}
+# Pour chaque lettre, les deux jetons qui peuvent la poser et la lettre écrite dans le
+# mot: le jeton de la lettre, puis un joker.
+_POSES = [
+    ((code, lettre), (JOKER, lettre.lower())) for code, lettre in enumerate(ALPHABET)
+]
+
+
+def contraintes_ligne(cellules: Sequence[str], lexique: Lexique) -> list[int]:
+    """Calcule les contraintes des cases vides d'une ligne (ou d'une colonne) pour les
+    mots posés perpendiculairement à celle-ci.
+
+    Le mot perpendiculaire est lu comme le fait mots_perpendiculaires: la lecture ne
+    prend jamais la première ni la dernière case de la ligne. Sur un plateau 15x15, le
+    résultat correspond donc exactement aux mots vérifiés par mot_accepte. Les lettres
+    posées avec un joker (en minuscule) sont lues comme les autres.
+
+    Args:
+        cellules (Sequence[str]): Les cases de la ligne, "_" pour une case vide.
+        lexique (Lexique): Le dictionnaire.
+
+    Returns:
+        list[int]: Les contraintes de chaque case (TOUTES pour les cases occupées).
+
+    Examples:
+        >>> lexique = Lexique.depuis_mots(["MAS", "MES"])
+        >>> bin(contraintes_ligne(["_", "M", "_", "S", "_"], lexique)[2] & TOUTES)
+        '0b10001'
+    """
+    dernier = len(cellules) - 1
+    resultat = [TOUTES] * len(cellules)
+    for j, cellule in enumerate(cellules):
+        if cellule != "_":
+            continue
+        gauche = j
+        while gauche > 0 and cellules[gauche - 1] != "_":
+            gauche -= 1
+        droite = j
+        while droite < dernier and cellules[droite + 1] != "_":
+            droite += 1
+        debut = max(gauche, 1)
+        fin = min(droite, dernier - 1)
+        if fin - debut < 1:
+            continue
+        if debut <= j <= fin:
+            masque = lexique.lettres_possibles(
+                "".join(cellules[debut:j]).upper(),
+                "".join(cellules[j + 1 : fin + 1]).upper(),
+            )
+        elif "".join(cellules[debut : fin + 1]).upper() in lexique:
+            masque = TOUTES
+        else:
+            masque = 0
+        resultat[j] = masque | FORME
+    return resultat
+
+
+class CacheContraintes:
+    """Contraintes croisées et ancres de chaque case du plateau, tenues à jour au fil
+    des coups. Poser des lettres ne modifie que les contraintes de la ligne et des
+    colonnes (ou de la colonne et des lignes) qui passent par les nouvelles lettres:
+    seules celles-ci sont recalculées.
+
+    Les contraintes sont rangées par ligne de jeu: masques["H"][li][c] est la
+    contrainte de la case (li, c) pour un mot horizontal (lue dans la colonne c) et
+    masques["V"][c][li] celle de la même case pour un mot vertical (lue dans la
+    ligne li). ancres[direc][k] est le masque de bits des ancres de la ligne de jeu k.
+    """
+
+    def __init__(self, plateau: list[list[str]], lexique: Lexique) -> None:
+        self.plateau = plateau
+        self.lexique = lexique
+        self.lignes, self.colonnes = len(plateau), len(plateau[0])
+        self.masques = {
+            "H": [[TOUTES] * self.colonnes for _ in range(self.lignes)],
+            "V": [[TOUTES] * self.lignes for _ in range(self.colonnes)],
+        }
+        self.ancres = {"H": [0] * self.lignes, "V": [0] * self.colonnes}
+        for li in range(self.lignes):
+            self._lire_ligne(li)
+        for c in range(self.colonnes):
+            self._lire_colonne(c)
+
+    def _lire_ligne(self, li: int) -> None:
+        """Recalcule les contraintes lues dans la ligne li (celles des mots verticaux)."""
+        cellules = self.ligne_de_jeu("H", li)
+        for c, masque in enumerate(contraintes_ligne(cellules, self.lexique)):
+            self.masques["V"][c][li] = masque
+            if cellules[c] != "_" or masque & FORME:
+                self.ancres["V"][c] |= 1 << li
+            else:
+                self.ancres["V"][c] &= ~(1 << li)
+
+    def _lire_colonne(self, c: int) -> None:
+        """Recalcule les contraintes lues dans la colonne c (celles des mots horizontaux)."""
+        cellules = self.ligne_de_jeu("V", c)
+        for li, masque in enumerate(contraintes_ligne(cellules, self.lexique)):
+            self.masques["H"][li][c] = masque
+            if cellules[li] != "_" or masque & FORME:
+                self.ancres["H"][li] |= 1 << c
+            else:
+                self.ancres["H"][li] &= ~(1 << c)
+
+    def mettre_a_jour(self, cases: Iterable[tuple[int, int]]) -> None:
+        """Met à jour les contraintes après que des lettres ont été posées.
+
+        Args:
+            cases (Iterable[tuple[int, int]]): Les cases qui viennent d'être remplies.
+        """
+        lignes, colonnes = set(), set()
+        for li, c in cases:
+            lignes.add(li)
+            colonnes.add(c)
+        for li in lignes:
+            self._lire_ligne(li)
+        for c in colonnes:
+            self._lire_colonne(c)
+
+    def ligne_de_jeu(self, direc: str, indice: int) -> Sequence[str]:
+        """Renvoie les cases de la ligne (pour "H") ou de la colonne (pour "V") donnée."""
+        if isinstance(self.plateau, Plateau):
+            if direc == "H":
+                return self.plateau.ligne(indice)
+            return self.plateau.colonne(indice)
+        if direc == "H":
+            return list(self.plateau[indice])
+        return [self.plateau[li][indice] for li in range(self.lignes)]
+
+    def accepte(self, coup: Coup, chevalet: str, tour: int) -> bool:
+        """Renvoie True si mot_accepte accepterait le coup, en ne lisant que les cases
+        couvertes par le mot et leurs contraintes.
+
+        Args:
+            coup (Coup): Le coup (mot, (ligne, colonne), direction) à vérifier.
+            chevalet (str): Les lettres du joueur.
+            tour (int): Le numéro du tour (1 pour le premier tour).
+
+        Returns:
+            bool: Si le coup est légal.
+        """
+        mot, (li, c), direc = coup
+        if direc == "H":
+            debut, indice, taille = c, li, self.colonnes
+        elif direc == "V":
+            debut, indice, taille = li, c, self.lignes
+        else:
+            return False
+        if debut < 0 or indice < 0 or debut + len(mot) > taille:
+            return False
+        if mot.upper() not in self.lexique:
+            return False
+        if tour == 1 and (indice != 7 or debut > 7 or debut + len(mot) < 7):
+            return False
+        compte = vers_compte(chevalet)
+        masques = self.masques[direc][indice]
+        couverte = forme = False
+        for j, lettre in enumerate(mot, debut):
+            cellule = (
+                self.plateau[indice][j] if direc == "H" else self.plateau[j][indice]
+            )
+            if cellule != "_":
+                if cellule.upper() != lettre.upper():
+                    return False
+                couverte = True
+                continue
+            code = CODES_CASES[lettre]
+            jeton = INDICES[lettre]
+            if compte[jeton] == 0:
+                return False
+            compte[jeton] -= 1
+            if tour != 1 and (direc == "V" or not couverte):
+                if not masques[j] >> code & 1:
+                    return False
+                forme = forme or bool(masques[j] & FORME)
+        return tour == 1 or couverte or forme
+
+
+def _departs(
+    cellules: Sequence[str], ancres: int, indice: int, tour: int, taille_chevalet: int
+) -> list[int]:
+    """Renvoie les cases d'une ligne de jeu d'où un coup accepté peut commencer: au
+    premier tour celles d'où le mot peut passer par la case centrale, ensuite celles
+    d'où une ancre est atteignable avec les lettres du chevalet.
+    """
+    if tour == 1:
+        return list(range(min(7, len(cellules) - 1) + 1)) if indice == 7 else []
+    departs = []
+    ancres = [j for j in range(len(cellules)) if ancres >> j & 1]
+    a = 0
+    for debut in range(len(cellules)):
+        while a < len(ancres) and ancres[a] < debut:
+            a += 1
+        if a == len(ancres):
+            break
+        vides = sum(1 for j in range(debut, ancres[a] + 1) if cellules[j] == "_")
+        if vides <= taille_chevalet:
+            departs.append(debut)
+    return departs
+
+
+def _parcourir_ligne(
+    lexique: Lexique,
+    cellules: Sequence[str],
+    masques: Sequence[int] | None,
+    ancres: int,
+    compte: list[int],
+    direc: str,
+    indice: int,
+    tour: int,
+    coups: list[Coup],
+    departs: Iterable[int] | None = None,
+    jokers_utiles: bool = False,
+) -> None:
+    """Ajoute à coups tous les coups acceptés qui se trouvent sur une ligne de jeu (une
+    ligne du plateau pour "H", une colonne pour "V"), ou seulement ceux qui commencent
+    sur l'une des cases departs.
+
+    Un joker du chevalet n'est pas essayé lettre par lettre: sur une case vide, chaque
+    arête du DAWG qui sort du noeud courant est suivie une fois avec la lettre du
+    chevalet et une fois avec un joker, écrit en minuscule dans le mot. Les lettres du
+    plateau sont émises en majuscule, qu'elles aient été posées avec un joker ou non.
+
+    Avec jokers_utiles, un coup n'est pas émis si un de ses jokers remplace une lettre
+    qui reste sur le chevalet: le même coup joué avec cette lettre rapporte au moins
+    autant et garde le joker.
+    """
+    dernier = len(cellules) - 1
+    lettres: list[str] = []
+    jokers: list[int] = []
+    # mots_perpendiculaires ne vérifie plus les mots perpendiculaires d'un mot
+    # horizontal après sa première lettre déjà présente sur le plateau.
+    controle_apres_couverte = direc == "V"
+
+    def accepte(debut: int, couverte: bool, forme: bool) -> bool:
+        if tour == 1:
+            return debut + len(lettres) >= 7
+        return couverte or forme
+
+    def emettre(debut: int) -> None:
+        if jokers_utiles and any(compte[code] for code in jokers):
+            return
+        position = (indice, debut) if direc == "H" else (debut, indice)
+        coups.append(("".join(lettres), position, direc))
+
+    def etendre(j: int, noeud: int, debut: int, couverte: bool, forme: bool) -> None:
+        if j > dernier:
+            return
+        cellule = cellules[j]
+        if cellule != "_":
+            code = CODES_CASES[cellule]
+            arete = lexique.arete(noeud, code)
+            if arete == 0:
+                return
+            lettres.append(ALPHABET[code])
+            if arete & TERMINAL and accepte(debut, True, forme):
+                emettre(debut)
+            etendre(j + 1, arete >> DECALAGE, debut, True, forme)
+            lettres.pop()
+            return
+        if masques is None or (couverte and not controle_apres_couverte):
+            masque = TOUTES
+        else:
+            masque = masques[j]
+        nouvelle_forme = forme or bool(masque & FORME)
+        for arete in lexique.aretes(noeud):
+            code = arete & MASQUE_LETTRE
+            if not (compte[code] or compte[JOKER]) or not masque >> code & 1:
+                continue
+            for jeton, lettre in _POSES[code]:
+                if not compte[jeton]:
+                    continue
+                compte[jeton] -= 1
+                lettres.append(lettre)
+                if jeton == JOKER:
+                    jokers.append(code)
+                if arete & TERMINAL and accepte(debut, couverte, nouvelle_forme):
+                    emettre(debut)
+                etendre(j + 1, arete >> DECALAGE, debut, couverte, nouvelle_forme)
+                if jeton == JOKER:
+                    jokers.pop()
+                lettres.pop()
+                compte[jeton] += 1
+
+    if departs is None:
+        departs = _departs(cellules, ancres, indice, tour, sum(compte))
+    for debut in departs:
+        etendre(debut, lexique.racine, debut, False, False)
+
+
+def generer_coups(
+    plateau: list[list[str]],
+    chevalet: str,
+    lexique: Lexique,
+    tour: int,
+    cache: CacheContraintes | None = None,
+    jokers_utiles: bool = False,
+) -> list[Coup]:
+    """Renvoie tous les coups acceptés par mot_accepte pour ce chevalet, sans essayer
+    chaque mot du dictionnaire à chaque position.
+
+    Les mots sont parcourus dans le DAWG depuis chaque case de départ qui peut atteindre
+    une ancre avec les lettres du chevalet. Les lettres posées sur une case vide sont
+    filtrées par les contraintes croisées de la case. Un joker ("?") peut prendre
+    toute lettre permise: il est écrit en minuscule dans le mot du coup.
+
+    Args:
+        plateau (list[list[str]]): Le plateau de jeu.
+        chevalet (str): Les lettres du joueur.
+        lexique (Lexique): Le dictionnaire.
+        tour (int): Le numéro du tour (1 pour le premier tour).
+        cache (CacheContraintes | None): Les contraintes croisées du plateau, tenues à
+            jour par mot_sur_plateau. Elles sont calculées si elles ne sont pas
+            fournies.
+        jokers_utiles (bool): Si True, les coups où un joker remplace une lettre
+            restée sur le chevalet sont omis: ils ne rapportent jamais plus que le
+            même coup joué avec la lettre.
+
+    Returns:
+        list[Coup]: Les coups (mot, (ligne, colonne), direction) légaux.
+
+    Examples:
+        >>> plateau = [["_"] * 15 for _ in range(15)]
+        >>> generer_coups(plateau, "SED", Lexique.depuis_mots(["DES"]), 1)[:2]
+        [('DES', (7, 4), 'H'), ('DES', (7, 5), 'H')]
+    """
+    if cache is None:
+        cache = CacheContraintes(plateau, lexique)
+    compte = vers_compte(chevalet)
+    coups: list[Coup] = []
+    for direc, nombre in (("H", cache.lignes), ("V", cache.colonnes)):
+        for k in range(nombre):
+            _parcourir_ligne(
+                lexique,
+                cache.ligne_de_jeu(direc, k),
+                cache.masques[direc][k] if tour != 1 else None,
+                cache.ancres[direc][k],
+                compte,
+                direc,
+                k,
+                tour,
+                coups,
+                jokers_utiles=jokers_utiles,
+            )
+    return coups
+
+
+def departs_coups(cache: CacheContraintes, chevalet: str, tour: int) -> list[Depart]:
+    """Renvoie toutes les cases d'où un coup accepté peut commencer, dans l'ordre où
+    generer_coups les parcourt.
+    """
+    taille_chevalet = len(chevalet)
+    departs = []
+    for direc, nombre in (("H", cache.lignes), ("V", cache.colonnes)):
+        for k in range(nombre):
+            cellules = cache.ligne_de_jeu(direc, k)
+            ancres = cache.ancres[direc][k]
+            for debut in _departs(cellules, ancres, k, tour, taille_chevalet):
+                departs.append((direc, k, debut))
+    return departs
+
+
+def coups_depuis(
+    cache: CacheContraintes,
+    chevalet: str,
+    tour: int,
+    depart: Depart,
+    jokers_utiles: bool = False,
+) -> list[Coup]:
+    """Renvoie les coups acceptés qui commencent sur une case de départ. Les coups de
+    toutes les cases de departs_coups sont exactement ceux de generer_coups (avec le
+    même jokers_utiles): une recherche peut ainsi être menée case par case, dans
+    l'ordre de son choix.
+    """
+    direc, k, debut = depart
+    coups: list[Coup] = []
+    _parcourir_ligne(
+        cache.lexique,
+        cache.ligne_de_jeu(direc, k),
+        cache.masques[direc][k] if tour != 1 else None,
+        cache.ancres[direc][k],
+        vers_compte(chevalet),
+        direc,
+        k,
+        tour,
+        coups,
+        (debut,),
+        jokers_utiles,
+    )
+    return coups
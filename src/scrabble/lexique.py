@@ -0,0 +1,893 @@
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator
+from multiprocessing.shared_memory import SharedMemory
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+SEPARATEUR = "^"
+
+# Chaque arête de l'automate est codée dans un entier non signé de 32 bits:
+#   - bits 0 à 4 : le code de la lettre (0 à 25, 26 pour le séparateur du GADDAG)
+#   - bit 5 : l'arête est la dernière du bloc d'arêtes de son noeud
+#   - bit 6 : le chemin qui se termine par cette arête forme un mot
+#   - bits 7 à 31 : l'indice de la première arête du noeud cible (0 si aucun enfant)
+# Un noeud est donc identifié par l'indice de sa première arête. L'indice 0 est
+# réservé et représente le noeud sans enfant.
+MASQUE_LETTRE = 0x1F
+DERNIERE = 0x20
+TERMINAL = 0x40
+DECALAGE = 7
+
+CODES: dict[str, int] = {lettre: i for i, lettre in enumerate(ALPHABET)}
+CODES[SEPARATEUR] = len(ALPHABET)
+SYMBOLES = ALPHABET + SEPARATEUR
+
+# Symboles des motifs de Lexique.selon_motif: "?" ou "_" (une case vide du plateau)
+# remplace une lettre, "*" une suite de lettres éventuellement vide.
+UNE_LETTRE = "?_"
+ETOILE = "*"
+
+# Fichier binaire du lexique compilé: un en-tête de taille fixe suivi des arêtes en
+# entiers de 32 bits petit-boutistes. L'en-tête contient le numéro de version du format,
+# le nombre de mots et d'arêtes, la somme de contrôle CRC32 des arêtes et l'empreinte
+# (taille et date de modification) du fichier texte source.
+MAGIQUE = b"SCRL"
+VERSION = 1
+ENTETE = struct.Struct("<4sHHIIIQq")
+TAILLE_ENTETE = 40
+
+
+class LexiqueInvalide(ValueError):
+    """Le fichier binaire du lexique est corrompu ou d'une version incompatible."""
+
+
+class _Noeud:
+    __slots__ = ("enfants", "terminal")
+
+    def __init__(self) -> None:
+        self.terminal = False
+        self.enfants: dict[str, _Noeud] = {}
+
+
+def _minimiser(chemin: list[_Noeud], mot: str, profondeur: int, registre: dict) -> None:
+    """Remplace les noeuds du chemin situés sous la profondeur donnée par leur équivalent
+    déjà enregistré (algorithme de Daciuk pour des mots triés).
+
+    Args:
+        chemin (list[_Noeud]): Les noeuds parcourus par le mot précédent.
+        mot (str): Le mot précédent.
+        profondeur (int): La longueur du préfixe commun avec le mot suivant.
+        registre (dict): Les noeuds déjà minimisés, indexés par leur signature.
+    """
+    for i in range(len(chemin) - 1, profondeur, -1):
+        enfant = chemin[i]
+        signature = (
+            enfant.terminal,
+            tuple((lettre, id(e)) for lettre, e in enfant.enfants.items()),
+        )
+        equivalent = registre.get(signature)
+        if equivalent is None:
+            registre[signature] = enfant
+        else:
+            chemin[i - 1].enfants[mot[i - 1]] = equivalent
+    del chemin[profondeur + 1 :]
+
+
+def construire_automate(chaines: Iterable[str]) -> array:
+    """Construit l'automate minimal (DAWG) reconnaissant les chaines données et le
+    renvoie sous la forme d'un tableau d'arêtes compact.
+
+    Args:
+        chaines (Iterable[str]): Les chaines à reconnaître, composées de symboles de
+            SYMBOLES. L'ordre et les doublons n'ont pas d'importance.
+
+    Returns:
+        array: Le tableau d'arêtes. La première case est réservée, la seconde contient
+            l'indice du bloc d'arêtes de la racine.
+    """
+    registre: dict = {}
+    racine = _Noeud()
+    chemin = [racine]
+    precedent = ""
+    for chaine in sorted(set(chaines)):
+        commun = 0
+        while (
+            commun < len(chaine)
+            and commun < len(precedent)
+            and chaine[commun] == precedent[commun]
+        ):
+            commun += 1
+        _minimiser(chemin, precedent, commun, registre)
+        noeud = chemin[-1]
+        for lettre in chaine[commun:]:
+            suivant = _Noeud()
+            noeud.enfants[lettre] = suivant
+            chemin.append(suivant)
+            noeud = suivant
+        noeud.terminal = True
+        precedent = chaine
+    _minimiser(chemin, precedent, 0, registre)
+
+    # Les indices 0 et 1 sont réservés (noeud vide et indice de la racine).
+    positions: dict[int, int] = {}
+    ordre = [racine]
+    libre = 2
+    for noeud in ordre:
+        if noeud.enfants:
+            positions[id(noeud)] = libre
+            libre += len(noeud.enfants)
+            for enfant in noeud.enfants.values():
+                if enfant.enfants and id(enfant) not in positions:
+                    positions[id(enfant)] = -1
+                    ordre.append(enfant)
+    aretes = array("I", [0]) * libre
+    aretes[1] = positions.get(id(racine), 0)
+    for noeud in ordre:
+        if not noeud.enfants:
+            continue
+        debut = positions[id(noeud)]
+        for i, (lettre, enfant) in enumerate(noeud.enfants.items()):
+            arete = CODES[lettre] | positions.get(id(enfant), 0) << DECALAGE
+            if i == len(noeud.enfants) - 1:
+                arete |= DERNIERE
+            if enfant.terminal:
+                arete |= TERMINAL
+            aretes[debut + i] = arete
+    return aretes
+
+
+class Automate:
+    """Parcours d'un automate codé sous forme de tableau d'arêtes (voir construire_automate)."""
+
+    def __init__(self, aretes) -> None:
+        self._aretes = aretes
+        self.racine: int = aretes[1]
+
+    def arete(self, noeud: int, code: int) -> int:
+        """Renvoie l'arête sortant du noeud avec le symbole donné.
+
+        Args:
+            noeud (int): L'indice du bloc d'arêtes du noeud.
+            code (int): Le code du symbole recherché.
+
+        Returns:
+            int: L'arête trouvée, ou 0 si elle n'existe pas.
+        """
+        if noeud == 0:
+            return 0
+        aretes = self._aretes
+        while True:
+            arete = aretes[noeud]
+            lettre = arete & MASQUE_LETTRE
+            if lettre == code:
+                return arete
+            if lettre > code or arete & DERNIERE:
+                return 0
+            noeud += 1
+
+    def aretes(self, noeud: int) -> Iterator[int]:
+        """Énumère les arêtes sortant d'un noeud, dans l'ordre des symboles."""
+        if noeud == 0:
+            return
+        aretes = self._aretes
+        while True:
+            arete = aretes[noeud]
+            yield arete
+            if arete & DERNIERE:
+                return
+            noeud += 1
+
+    def suivre(self, chaine: str, noeud: int | None = None) -> int:
+        """Suit la chaine depuis un noeud (la racine par défaut).
+
+        Args:
+            chaine (str): Les symboles à suivre.
+            noeud (int | None): Le noeud de départ.
+
+        Returns:
+            int: La dernière arête suivie, ou 0 si le chemin n'existe pas ou si la
+                chaine est vide.
+        """
+        if noeud is None:
+            noeud = self.racine
+        arete = 0
+        for symbole in chaine:
+            code = CODES.get(symbole)
+            if code is None:
+                return 0
+            arete = self.arete(noeud, code)
+            if arete == 0:
+                return 0
+            noeud = arete >> DECALAGE
+        return arete
+
+    def completions(
+        self, noeud: int, prefixe: str = "", exclu: int = -1
+    ) -> Iterator[str]:
+        """Énumère, dans l'ordre lexicographique, les chaines acceptées depuis un noeud.
+
+        Args:
+            noeud (int): Le noeud de départ.
+            prefixe (str): La chaine ajoutée devant chaque résultat.
+            exclu (int): Le code d'un symbole dont les arêtes ne sont pas suivies.
+
+        Returns:
+            Iterator[str]: Les chaines acceptées, préfixe compris.
+        """
+        pile = [(noeud, prefixe)]
+        while pile:
+            noeud, debut = pile.pop()
+            if noeud < 0:
+                yield debut
+                continue
+            for arete in reversed(list(self.aretes(noeud))):
+                if arete & MASQUE_LETTRE == exclu:
+                    continue
+                chaine = debut + SYMBOLES[arete & MASQUE_LETTRE]
+                pile.append((arete >> DECALAGE, chaine))
+                if arete & TERMINAL:
+                    pile.append((-1, chaine))
+
+    def memoire(self) -> int:
+        """Renvoie la taille en octets du tableau d'arêtes."""
+        return len(self._aretes) * self._aretes.itemsize
+
+
+class Gaddag(Automate):
+    """Variante GADDAG du lexique: chaque mot m de longueur n y est enregistré sous les
+    formes inverse(m[:i]) + "^" + m[i:] pour 1 <= i < n, ainsi que inverse(m).
+    Elle permet de retrouver les mots à partir de n'importe laquelle de leurs lettres.
+    """
+
+    @classmethod
+    def depuis_mots(cls, mots: Iterable[str]) -> "Gaddag":
+        """Construit le GADDAG des mots donnés."""
+        chaines = []
+        for mot in mots:
+            for i in range(1, len(mot)):
+                chaines.append(mot[:i][::-1] + SEPARATEUR + mot[i:])
+            chaines.append(mot[::-1])
+        return cls(construire_automate(chaines))
+
+    def finissant_par(self, suffixe: str) -> Iterator[str]:
+        """Énumère les mots qui se terminent par le suffixe donné.
+
+        Examples:
+            >>> list(Gaddag.depuis_mots(["MANGER", "RANGER", "MANGE"]).finissant_par("GER"))
+            ['MANGER', 'RANGER']
+        """
+        if not suffixe:
+            return
+        arete = self.suivre(suffixe[::-1])
+        if arete == 0:
+            return
+        if arete & TERMINAL:
+            yield suffixe
+        for chaine in self.completions(arete >> DECALAGE, exclu=CODES[SEPARATEUR]):
+            yield chaine[::-1] + suffixe
+
+    def contenant(self, fragment: str) -> Iterator[str]:
+        """Énumère les mots qui contiennent le fragment donné. Un mot contenant plusieurs
+        fois le fragment est renvoyé plusieurs fois.
+
+        Examples:
+            >>> sorted(Gaddag.depuis_mots(["MANGER", "RANGER", "AGE"]).contenant("ANG"))
+            ['MANGER', 'RANGER']
+        """
+        if not fragment:
+            return
+        arete = self.suivre(fragment[::-1])
+        if arete == 0:
+            return
+        if arete & TERMINAL:
+            yield fragment
+        for chaine in self.completions(arete >> DECALAGE):
+            gauche, _, droite = chaine.partition(SEPARATEUR)
+            yield gauche[::-1] + fragment + droite
+
+
+class Lexique(Automate):
+    """Lexique compressé sous forme de DAWG minimisé. Il remplace la liste de sets
+    renvoyée par list_dico et répond aux questions d'appartenance, de préfixe et de
+    prolongement d'un préfixe.
+
+    Les arêtes peuvent être lues dans un fichier projeté en mémoire (ouvrir) ou dans
+    un segment de mémoire partagée (partager, attacher).
+    """
+
+    def __init__(
+        self,
+        aretes,
+        nombre_mots: int,
+        carte: mmap.mmap | SharedMemory | None = None,
+    ) -> None:
+        super().__init__(aretes)
+        self.nombre_mots = nombre_mots
+        self._carte = carte
+        # Le processus qui a créé le segment de mémoire partagée le détruit.
+        self._proprietaire = False
+        self._gaddag: Gaddag | None = None
+        # Résumés des noeuds (voir _resume), calculés au premier besoin.
+        self._resumes: array | None = None
+
+    def __reduce_ex__(self, protocole):
+        # Un lexique en mémoire partagée est transmis par le nom de son segment: le
+        # processus qui le reçoit s'y attache au lieu de recevoir une copie des arêtes.
+        if isinstance(self._carte, SharedMemory):
+            return Lexique.attacher, (self._carte.name,)
+        return super().__reduce_ex__(protocole)
+
+    @classmethod
+    def depuis_mots(cls, mots: Iterable[str]) -> "Lexique":
+        """Construit le lexique des mots donnés. Les mots vides ou contenant des
+        caractères hors de ALPHABET sont ignorés.
+        """
+        valides = {mot for mot in mots if mot and all(c in ALPHABET for c in mot)}
+        return cls(construire_automate(valides), len(valides))
+
+    @classmethod
+    def depuis_fichier(cls, nom_fichier_dictionnaire: str) -> "Lexique":
+        """Construit le lexique à partir d'un fichier texte contenant un mot par ligne.
+
+        Args:
+            nom_fichier_dictionnaire (str): Le chemin du fichier dictionnaire.
+
+        Returns:
+            Lexique: Le lexique de tous les mots du fichier.
+        """
+        with open(nom_fichier_dictionnaire, encoding="utf-8") as fichier:
+            return cls.depuis_mots(ligne.strip() for ligne in fichier)
+
+    def __contains__(self, mot: object) -> bool:
+        return isinstance(mot, str) and bool(self.suivre(mot) & TERMINAL)
+
+    def __len__(self) -> int:
+        return self.nombre_mots
+
+    def __iter__(self) -> Iterator[str]:
+        return self.completions(self.racine)
+
+    def verifier_lot(self, mots: Iterable[str]) -> list[bool]:
+        """Indique pour chaque mot s'il appartient au lexique, comme mot in lexique.
+
+        Les mots sont vérifiés une seule fois chacun, dans l'ordre alphabétique: un
+        mot reprend le chemin du précédent là où leurs préfixes communs s'arrêtent,
+        au lieu de repartir de la racine. Quand tous les mots sont valides, la
+        réponse est construite sans repasser par les mots.
+
+        Args:
+            mots (Iterable[str]): Les mots à vérifier.
+
+        Returns:
+            list[bool]: True pour chaque mot du lexique, dans l'ordre des mots.
+
+        Examples:
+            >>> Lexique.depuis_mots(["MON", "MONDE", "MONTER"]).verifier_lot(["MONDE", "MONT", "MON"])
+            [True, False, True]
+        """
+        mots = list(mots)
+        inconnus = set()
+        # suivies[i] est l'arête lue pour la lettre i du mot précédent. Le chemin
+        # s'arrête à la première lettre absente.
+        suivies: list[int] = []
+        precedent = ""
+        for mot in sorted(set(mots)):
+            commun = 0
+            limite = min(len(suivies), len(mot))
+            while commun < limite and mot[commun] == precedent[commun]:
+                commun += 1
+            del suivies[commun:]
+            noeud = suivies[-1] >> DECALAGE if suivies else self.racine
+            for symbole in mot[commun:]:
+                code = CODES.get(symbole)
+                arete = 0 if code is None else self.arete(noeud, code)
+                if arete == 0:
+                    break
+                suivies.append(arete)
+                noeud = arete >> DECALAGE
+            if len(suivies) != len(mot) or not suivies or not suivies[-1] & TERMINAL:
+                inconnus.add(mot)
+            precedent = mot
+        if not inconnus:
+            return [True] * len(mots)
+        return [mot not in inconnus for mot in mots]
+
+    def lettres_possibles(self, gauche: str, droite: str) -> int:
+        """Renvoie l'ensemble des lettres L telles que gauche + L + droite soit un mot
+        du lexique, sous la forme d'un masque de bits (bit i pour ALPHABET[i]).
+
+        Examples:
+            >>> bin(Lexique.depuis_mots(["MAS", "MES", "MIS"]).lettres_possibles("M", "S"))
+            '0b100010001'
+        """
+        if gauche:
+            arete = self.suivre(gauche)
+            if arete == 0:
+                return 0
+            noeud = arete >> DECALAGE
+        else:
+            noeud = self.racine
+        masque = 0
+        for arete in self.aretes(noeud):
+            if droite:
+                trouve = self.suivre(droite, arete >> DECALAGE) & TERMINAL
+            else:
+                trouve = arete & TERMINAL
+            if trouve:
+                masque |= 1 << (arete & MASQUE_LETTRE)
+        return masque
+
+    def est_prefixe(self, prefixe: str) -> bool:
+        """Renvoie True si au moins un mot du lexique commence par le préfixe donné."""
+        return prefixe == "" or self.suivre(prefixe) != 0
+
+    def commencant_par(self, prefixe: str) -> Iterator[str]:
+        """Énumère dans l'ordre alphabétique les mots qui commencent par le préfixe.
+
+        Examples:
+            >>> list(Lexique.depuis_mots(["MON", "MONDE", "MER"]).commencant_par("MON"))
+            ['MON', 'MONDE']
+        """
+        if not prefixe:
+            yield from self
+            return
+        arete = self.suivre(prefixe)
+        if arete == 0:
+            return
+        if arete & TERMINAL:
+            yield prefixe
+        yield from self.completions(arete >> DECALAGE, prefixe)
+
+    def prolongements(self, prefixe: str) -> Iterator[str]:
+        """Énumère les suffixes non vides qui complètent le préfixe en un mot du lexique.
+
+        Examples:
+            >>> list(Lexique.depuis_mots(["MON", "MONDE", "MONTER"]).prolongements("MON"))
+            ['DE', 'TER']
+        """
+        if not prefixe:
+            yield from self
+            return
+        arete = self.suivre(prefixe)
+        if arete != 0:
+            yield from self.completions(arete >> DECALAGE)
+
+    def selon_motif(
+        self,
+        motif: str,
+        chevalet: str | None = None,
+        longueur_min: int = 1,
+        longueur_max: int | None = None,
+    ) -> Iterator[str]:
+        """Énumère dans l'ordre alphabétique les mots qui correspondent à un motif.
+
+        Dans le motif, une lettre est imposée, "?" ou "_" remplace une lettre et "*"
+        une suite de lettres, éventuellement vide: "?A??E", "B*R", ou une ligne du
+        plateau dont les lettres posées avec un joker (en minuscule) sont lues comme
+        les autres.
+
+        Le DAWG n'est parcouru qu'une fois: chaque noeud est atteint avec les positions
+        du motif où peut en être la lecture, et une branche est abandonnée dès
+        qu'aucune position ne la prolonge. Avec une "*", elle l'est aussi quand aucun de
+        ses mots ne finit par la dernière lettre imposée ou n'a la longueur demandée
+        (voir _resume). Les mots sont produits au fil du parcours.
+
+        Args:
+            motif (str): Le motif.
+            chevalet (str | None): Si fourni, les lettres qui remplacent "?", "_" et
+                "*" sont prises sur ce chevalet, dont les "?" sont des jokers. Les
+                lettres imposées, déjà sur le plateau, ne le sont pas.
+            longueur_min (int): La longueur minimum des mots.
+            longueur_max (int | None): La longueur maximum des mots.
+
+        Returns:
+            Iterator[str]: Les mots qui correspondent au motif.
+
+        Raises:
+            ValueError: Si le motif contient un autre symbole.
+
+        Examples:
+            >>> lexique = Lexique.depuis_mots(["BAR", "BEURRE", "BOIRE", "CASSE", "MASSE"])
+            >>> list(lexique.selon_motif("?A??E"))
+            ['CASSE', 'MASSE']
+            >>> list(lexique.selon_motif("B*R"))
+            ['BAR']
+            >>> list(lexique.selon_motif("B*", chevalet="AROI?"))
+            ['BAR', 'BOIRE']
+        """
+        motif = motif.upper()
+        for symbole in motif:
+            if symbole not in CODES and symbole not in UNE_LETTRE + ETOILE:
+                raise ValueError(f"symbole de motif inconnu: {symbole!r}")
+        if longueur_max is None:
+            longueur_max = sys.maxsize if ETOILE in motif else len(motif)
+        fin = len(motif)
+        # Le code de la lettre imposée à chaque position du motif, -1 pour "?" et "_",
+        # -2 pour "*".
+        codes = [CODES.get(s, -2 if s == ETOILE else -1) for s in motif]
+        joker = len(ALPHABET)
+        restant = None
+        if chevalet is not None:
+            restant = [0] * (joker + 1)
+            for lettre in chevalet.upper():
+                restant[joker if lettre == "?" else CODES[lettre]] += 1
+
+        etoiles = ETOILE in motif
+        # Pour chaque position du motif: le nombre de lettres qu'il faut encore lire
+        # au moins, et si une "*" reste à lire (le nombre exact n'est alors pas connu).
+        besoins = [sum(1 for code in codes[p:] if code != -2) for p in range(fin)]
+        ouverts = [-2 in codes[p:] for p in range(fin)]
+        # La lettre imposée en fin de motif: tout mot doit se terminer par elle.
+        derniere = codes[-1] if codes and codes[-1] >= 0 else -1
+
+        def fermer(etats: dict) -> dict:
+            # Une "*" peut ne remplacer aucune lettre.
+            if etoiles:
+                for position in sorted(etats):
+                    while position < fin and codes[position] == -2:
+                        position += 1
+                        etats.setdefault(position, etats[position - 1])
+            return etats
+
+        def avancer(etats: dict, code: int) -> dict:
+            # Toutes les lectures arrivées à la même position ont pris les mêmes
+            # lettres au chevalet (celles du mot moins les lettres imposées déjà lues):
+            # il suffit d'en garder une.
+            suivants: dict = {}
+            for position, lettres in etats.items():
+                if position == fin:
+                    continue
+                attendu = codes[position]
+                if attendu >= 0:
+                    if attendu == code:
+                        suivants.setdefault(position + 1, lettres)
+                    continue
+                cible = position if attendu == -2 else position + 1
+                if cible in suivants:
+                    continue
+                if lettres is not None:
+                    indice = code if lettres[code] else joker
+                    if not lettres[indice]:
+                        continue
+                    lettres = lettres[:]
+                    lettres[indice] -= 1
+                suivants[cible] = lettres
+            return fermer(suivants)
+
+        # Le résumé d'un noeud (voir _resume) écarte une branche quand aucun de ses
+        # mots n'a la longueur ou la dernière lettre que demande le reste du motif:
+        # "B*R" ne lit pas les mots en B qui ne peuvent plus finir par R. Sans "*",
+        # les positions du motif bornent déjà la longueur et le résumé n'est pas lu.
+        elaguer = etoiles and (
+            derniere >= 0 or longueur_min > 1 or longueur_max != sys.maxsize
+        )
+
+        def resume_compatible(noeud: int, longueur: int) -> tuple | None:
+            resume = self._resume(noeud)
+            fins, court, long = resume
+            if longueur + court > longueur_max or longueur + long < longueur_min:
+                return None
+            if derniere >= 0 and not fins >> derniere & 1:
+                return None
+            return resume
+
+        def prolongeable(resume: tuple, etats: dict) -> bool:
+            _, court, long = resume
+            for position in etats:
+                if position == fin:
+                    continue
+                besoin = besoins[position]
+                if long >= besoin and (ouverts[position] or court <= besoin):
+                    return True
+            return False
+
+        pile = [(self.racine, fermer({0: restant}), "")]
+        while pile:
+            noeud, etats, prefixe = pile.pop()
+            if etats is None:
+                yield prefixe
+                continue
+            if len(prefixe) >= longueur_max:
+                continue
+            imposes = {codes[p] for p in etats if p < fin}
+            if min(imposes, default=0) < 0:
+                aretes = list(self.aretes(noeud))
+            else:
+                # Seules des lettres imposées peuvent suivre: elles sont cherchées
+                # directement au lieu de lire toutes les arêtes du noeud.
+                aretes = [
+                    a for code in sorted(imposes) if (a := self.arete(noeud, code))
+                ]
+            longueur = len(prefixe) + 1
+            for arete in reversed(aretes):
+                enfant = arete >> DECALAGE
+                resume = None
+                if elaguer and enfant:
+                    resume = resume_compatible(enfant, longueur)
+                    if resume is None and not arete & TERMINAL:
+                        continue
+                code = arete & MASQUE_LETTRE
+                suivants = avancer(etats, code)
+                if not suivants:
+                    continue
+                mot = prefixe + ALPHABET[code]
+                if enfant and (
+                    not elaguer or resume and prolongeable(resume, suivants)
+                ):
+                    pile.append((enfant, suivants, mot))
+                if arete & TERMINAL and fin in suivants and longueur >= longueur_min:
+                    pile.append((0, None, mot))
+
+    def _resume(self, noeud: int) -> tuple[int, int, int]:
+        """Renvoie, pour les suffixes non vides qui complètent un mot depuis un noeud,
+        le masque de bits de leurs dernières lettres et leurs longueurs minimum et
+        maximum.
+
+        Les résumés sont gardés dans un tableau indexé comme les arêtes, un entier de 64
+        bits par noeud (0 tant que le noeud n'est pas résumé): un noeud n'est résumé
+        qu'une fois.
+        """
+        if self._resumes is None:
+            self._resumes = array("Q", [0]) * len(self._aretes)
+        resume = self._resumes[noeud]
+        if resume == 0:
+            fins, court, long = 0, 0xFF, 0
+            for arete in self.aretes(noeud):
+                if arete & TERMINAL:
+                    fins |= 1 << (arete & MASQUE_LETTRE)
+                    court = 1
+                    long = max(long, 1)
+                if arete >> DECALAGE:
+                    f, c, lg = self._resume(arete >> DECALAGE)
+                    fins |= f
+                    court = min(court, c + 1)
+                    long = max(long, lg + 1)
+            resume = fins | court << 32 | long << 40
+            self._resumes[noeud] = resume
+        return resume & 0xFFFFFFFF, resume >> 32 & 0xFF, resume >> 40
+
+    @property
+    def gaddag(self) -> Gaddag:
+        """Le GADDAG du lexique, construit au premier accès."""
+        if self._gaddag is None:
+            self._gaddag = Gaddag.depuis_mots(self)
+        return self._gaddag
+
+    def enregistrer(self, destination: str, source: str | None = None) -> None:
+        """Écrit le lexique dans un fichier binaire. L'écriture passe par un fichier
+        temporaire pour que les autres processus ne lisent jamais un fichier partiel.
+
+        Args:
+            destination (str): Le chemin du fichier binaire.
+            source (str | None): Le fichier texte dont le lexique est issu. Son empreinte
+                est enregistrée pour détecter qu'il a été modifié.
+        """
+        aretes = array("I", self._aretes)
+        if sys.byteorder == "big":
+            aretes.byteswap()
+        contenu = aretes.tobytes()
+        taille_source, date_source = _empreinte(source) if source else (0, 0)
+        entete = ENTETE.pack(
+            MAGIQUE,
+            VERSION,
+            0,
+            self.nombre_mots,
+            len(aretes),
+            zlib.crc32(contenu),
+            taille_source,
+            date_source,
+        )
+        temporaire = f"{destination}.{os.getpid()}.tmp"
+        with open(temporaire, "wb") as fichier:
+            fichier.write(entete.ljust(TAILLE_ENTETE, b"\0"))
+            fichier.write(contenu)
+        os.replace(temporaire, destination)
+
+    @classmethod
+    def ouvrir(cls, chemin: str, verifier: bool = True) -> "Lexique":
+        """Ouvre un lexique compilé en projetant le fichier en mémoire (mmap). Les
+        recherches lisent directement les pages du fichier, sans phase d'analyse.
+
+        Args:
+            chemin (str): Le chemin du fichier binaire.
+            verifier (bool): Si la somme de contrôle des arêtes doit être vérifiée.
+
+        Returns:
+            Lexique: Le lexique projeté en mémoire.
+
+        Raises:
+            LexiqueInvalide: Si le fichier est tronqué, corrompu ou d'une autre version.
+        """
+        with open(chemin, "rb") as fichier:
+            carte = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            nombre_mots, nombre_aretes, somme = _lire_entete(carte)
+        except LexiqueInvalide:
+            carte.close()
+            raise
+        with memoryview(carte) as vue:
+            contenu = vue[TAILLE_ENTETE:]
+            if len(contenu) != 4 * nombre_aretes:
+                erreur = f"{chemin} est tronqué"
+            elif verifier and zlib.crc32(contenu) != somme:
+                erreur = f"{chemin} est corrompu"
+            elif sys.byteorder == "big":
+                aretes = array("I", contenu.tobytes())
+                aretes.byteswap()
+                erreur = None
+            else:
+                return cls(contenu.cast("I"), nombre_mots, carte)
+            contenu.release()
+        carte.close()
+        if erreur is not None:
+            raise LexiqueInvalide(erreur)
+        return cls(aretes, nombre_mots)
+
+    def partager(self) -> "Lexique":
+        """Copie le lexique dans un segment de mémoire partagée et renvoie le lexique
+        qui le lit.
+
+        Passé à un autre processus (par exemple dans les initargs d'un
+        ProcessPoolExecutor), ce lexique s'y rattache au segment en lecture seule au
+        lieu d'être copié: les arêtes ne sont en mémoire qu'une fois, quel que soit le
+        nombre de processus. Le segment est détruit par fermer, qui doit être appelée
+        sur le lexique renvoyé quand plus aucun processus ne s'en sert.
+
+        Examples:
+            >>> partage = Lexique.depuis_mots(["MON", "MONDE"]).partager()
+            >>> copie = Lexique.attacher(partage.nom_memoire)
+            >>> list(copie)
+            ['MON', 'MONDE']
+            >>> copie.fermer()
+            >>> partage.fermer()
+        """
+        aretes = array("I", self._aretes)
+        contenu = memoryview(aretes).cast("B")
+        entete = ENTETE.pack(
+            MAGIQUE,
+            VERSION,
+            0,
+            self.nombre_mots,
+            len(aretes),
+            zlib.crc32(contenu),
+            0,
+            0,
+        )
+        memoire = SharedMemory(create=True, size=TAILLE_ENTETE + len(contenu))
+        memoire.buf[: len(entete)] = entete
+        memoire.buf[TAILLE_ENTETE : TAILLE_ENTETE + len(contenu)] = contenu
+        lexique = Lexique._depuis_memoire(memoire)
+        lexique._proprietaire = True
+        return lexique
+
+    @classmethod
+    def attacher(cls, nom: str) -> "Lexique":
+        """Ouvre en lecture seule, sans copie, un lexique mis en mémoire partagée par
+        partager dans un autre processus.
+
+        Args:
+            nom (str): Le nom du segment de mémoire partagée (nom_memoire).
+
+        Returns:
+            Lexique: Le lexique lu dans le segment.
+
+        Raises:
+            LexiqueInvalide: Si le segment ne contient pas un lexique.
+        """
+        # Seul le processus qui a créé le segment le suit et le détruit.
+        return cls._depuis_memoire(SharedMemory(name=nom, track=False))
+
+    @classmethod
+    def _depuis_memoire(cls, memoire: SharedMemory) -> "Lexique":
+        try:
+            nombre_mots, nombre_aretes, _ = _lire_entete(memoire.buf)
+        except LexiqueInvalide:
+            memoire.close()
+            raise
+        # Les arêtes sont écrites dans l'ordre des octets de la machine: elles sont
+        # lues telles quelles.
+        fin = TAILLE_ENTETE + 4 * nombre_aretes
+        aretes = memoire.buf[TAILLE_ENTETE:fin].toreadonly().cast("I")
+        return cls(aretes, nombre_mots, memoire)
+
+    @property
+    def nom_memoire(self) -> str | None:
+        """Le nom du segment de mémoire partagée du lexique, s'il en a un."""
+        if isinstance(self._carte, SharedMemory):
+            return self._carte.name
+        return None
+
+    def fermer(self) -> None:
+        """Libère la projection en mémoire du fichier ou le segment de mémoire
+        partagée, s'il y en a un. Le segment est détruit si ce lexique l'a créé.
+        """
+        if self._carte is not None:
+            self._aretes.release()
+            self._carte.close()
+            if self._proprietaire:
+                self._carte.unlink()
+            self._carte = None
+
+
+def _empreinte(chemin: str) -> tuple[int, int]:
+    """Renvoie la taille et la date de modification (en nanosecondes) d'un fichier."""
+    etat = os.stat(chemin)
+    return etat.st_size, etat.st_mtime_ns
+
+
+def _lire_entete(contenu) -> tuple[int, int, int]:
+    """Vérifie l'en-tête d'un lexique compilé et renvoie le nombre de mots, le nombre
+    d'arêtes et la somme de contrôle.
+    """
+    if len(contenu) < TAILLE_ENTETE:
+        raise LexiqueInvalide("en-tête de lexique tronqué")
+    magique, version, _, nombre_mots, nombre_aretes, somme, _, _ = ENTETE.unpack_from(
+        contenu
+    )
+    if magique != MAGIQUE:
+        raise LexiqueInvalide("ce fichier n'est pas un lexique compilé")
+    if version != VERSION:
+        raise LexiqueInvalide(f"version de lexique {version} non supportée")
+    return nombre_mots, nombre_aretes, somme
+
+
+def compiler_lexique(source: str, destination: str) -> Lexique:
+    """Compile le dictionnaire texte en un fichier binaire et renvoie le lexique.
+
+    Args:
+        source (str): Le fichier texte contenant un mot par ligne.
+        destination (str): Le chemin du fichier binaire à écrire.
+
+    Returns:
+        Lexique: Le lexique construit à partir du fichier texte.
+    """
+    lexique = Lexique.depuis_fichier(source)
+    lexique.enregistrer(destination, source)
+    return lexique
+
+
+def est_a_jour(source: str, destination: str) -> bool:
+    """Renvoie True si le fichier binaire existe, est lisible dans cette version du
+    format et a été compilé à partir de la version actuelle du fichier texte.
+    """
+    try:
+        with open(destination, "rb") as fichier:
+            entete = fichier.read(TAILLE_ENTETE)
+        _lire_entete(entete)
+    except (OSError, LexiqueInvalide):
+        return False
+    taille, date = ENTETE.unpack_from(entete)[6:]
+    return (taille, date) == _empreinte(source)
+
+
+def charger_lexique(source: str, destination: str | None = None) -> Lexique:
+    """Charge le lexique compilé correspondant au dictionnaire texte, en le
+    recompilant d'abord si le fichier texte a changé ou si le fichier binaire est
+    absent, d'une autre version ou corrompu.
+
+    Args:
+        source (str): Le fichier texte contenant un mot par ligne.
+        destination (str | None): Le fichier binaire, par défaut le fichier source avec
+            l'extension ".lex".
+
+    Returns:
+        Lexique: Le lexique projeté en mémoire.
+
+    Examples:
+        >>> dico = charger_lexique("resources/dico.txt")
+        >>> "BONJOUR" in dico
+        True
+    """
+    if destination is None:
+        destination = os.path.splitext(source)[0] + ".lex"
+    if est_a_jour(source, destination):
+        try:
+            return Lexique.ouvrir(destination)
+        except LexiqueInvalide:
+            pass
+    compiler_lexique(source, destination)
+    return Lexique.ouvrir(destination)
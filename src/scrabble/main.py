@@ -1,16 +1,26 @@
 import random
+import sys
 from copy import deepcopy
+from dataclasses import dataclass
+from enum import Enum
+
+from .bonus import Bareme
+from .chevalet import INDICES, JOKER, contient, vers_compte
+from .lexique import Lexique
+from .pioche import Pioche
+from .plateau import annuler_coup, appliquer_coup
 
 
 def load_fichier_lettres(
     nom_fichier_lettres: str,
 ) -> tuple[dict[str, int], dict[str, int]]:
     """
-    Cette fonction ouvre et lit un fichier texte dont le nom est fourni en argument. Ce fichier contient 26 lignes
-    (une pour chaque lettre de l'alphabet). Chaque ligne est composée d'une lettre, d'un nombre d'occurrences de cette
-    lettre dans le jeu et des points que la lettre rapporte au joueur s'il la place, chacun séparé par un espace. Elle
-    renvoie ensuite deux dictionnaires dont les clés sont les lettres contenues dans le fichier texte et les valeurs
-    sont respectivement le nombre d'occurrences et les points que la lettre rapporte.
+    Cette fonction ouvre et lit un fichier texte dont le nom est fourni en argument. Ce fichier contient une ligne
+    pour chaque lettre de l'alphabet, et une pour le joker "?" qui ne rapporte aucun point. Chaque ligne est composée
+    d'une lettre, d'un nombre d'occurrences de cette lettre dans le jeu et des points que la lettre rapporte au joueur
+    s'il la place, chacun séparé par un espace. Elle renvoie ensuite deux dictionnaires dont les clés sont les lettres
+    contenues dans le fichier texte et les valeurs sont respectivement le nombre d'occurrences et les points que la
+    lettre rapporte.
 
     Args:
         nom_fichier_lettres (str) : Un chaine de caractère qui représente le nom du fichier texte à ouvrir.
@@ -226,11 +236,12 @@ def jeton_joueur(pioche_jeu, main_joueur):
     """
     Cette fonction choisit aléatoirement des lettre dans la pioche et les rajoute dans le chevalet du joueur jusqu'à ce
     qu'il ait 7 jetons. Elle renvoie ensuite le chevalet du joueur plein et la pioche avec les jetons en moins qui ont
-    été ajouter au chevalet du joueur.
+    été ajouter au chevalet du joueur. Si la pioche est un objet Pioche, les jetons y sont tirés en O(1) chacun avec
+    son propre générateur aléatoire, et la même Pioche est renvoyée.
 
     Args:
-        - pioche_jeu (str) : une chaine de caractère contenant toutes les lettres de la pioche classées dans l'ordre
-        alphabétique.
+        - pioche_jeu (str | Pioche) : une chaine de caractère contenant toutes les lettres de la pioche classées dans
+        l'ordre alphabétique, ou une Pioche.
         - Main_joueur (str) : une chaine de caractère contenant les lettre du chevalet du joueur
 
     Valeur de retour:
@@ -244,6 +255,8 @@ def jeton_joueur(pioche_jeu, main_joueur):
         >>> jeton_joueur(pioche_jeu, main_joueur)
         AKDHCEC AAAAABBBBBCCCDDDDDEEEE
     """
+    if isinstance(pioche_jeu, Pioche):
+        return pioche_jeu, pioche_jeu.completer(main_joueur)
     for _ in range(7 - len(main_joueur)):
         x = random.randint(0, len(pioche_jeu) - 1)
         main_joueur += pioche_jeu[x]
@@ -258,14 +271,15 @@ def verif_lettre_joueur(plateau, lettres_joueur, coup):
     ou
         - Si une ou plusieurs lettres manquent mais sont déjà placées à la place adéquate sur le plateau (plateau).
         Sinon, la fonction renvoie False.
-    On présuppose que le mot ne dépasse pas des bornes du plateau
+    On présuppose que le mot ne dépasse pas des bornes du plateau. Les lettres sont comparées sous forme de vecteurs
+    de 27 comptes (voir chevalet.py): une lettre en minuscule du mot est posée avec un joker ("?") du joueur.
 
     Args :
         - plateau (liste) : une liste de sous-listes qui représentent chacune une ligne du plateau de jeu.
         Elles contiennent chacune, soit un underscore pour indiquer que la case est vide, soit une lettre si elle a déjà
         été placée là auparavant.
         - lettres_joueur (liste) : une liste qui contient chacune des lettres que le joueur possède sur son chevalet.
-        Toutes ces lettres sont en MAJUSCULE.
+        Toutes ces lettres sont en MAJUSCULE, sauf les jokers écrits "?".
         - coup (tuple): un tuple à 3 éléments:
             - mot (str): une chaine de caractère en majuscule qui indique le mot à placer
             - pos (tuple) : un tuple d'entiers (l,c) qui indiquent le numéro de ligne (l), et le numéro de la colonne
@@ -281,22 +295,22 @@ def verif_lettre_joueur(plateau, lettres_joueur, coup):
     """
     mot, pos, direc = coup
     line, column = pos
-    x = lettres_joueur
-    if direc == "V":
-        for i in range(len(mot)):
-            x += plateau[line + i][column]
-    elif direc == "H":
-        for i in range(len(mot)):
-            x += plateau[line][column + i]
-    x = x.replace("_", "")
-    x = "".join(sorted(x))
-    mot = "".join(sorted(mot))
-    j, i = 0, 0
-    while j < len(mot) and i < len(x):
-        if mot[j] == x[i]:
-            j += 1
-        i += 1
-    return j == len(mot)
+    # Un symbole qui n'est ni une lettre ni un joker ne peut pas venir du chevalet.
+    if not all(lettre in INDICES for lettre in mot):
+        return False
+    compte = vers_compte(lettres_joueur)
+    for i in range(len(mot)):
+        if direc == "V":
+            case = plateau[line + i][column]
+        elif direc == "H":
+            case = plateau[line][column + i]
+        else:
+            break
+        if case != "_":
+            # Une lettre du plateau compte pour la lettre du mot qui l'occupe, même si l'une des deux a été posée avec
+            # un joker.
+            compte[INDICES[mot[i] if case.upper() == mot[i].upper() else case]] += 1
+    return contient(compte, vers_compte(mot))
 
 
 def list_dico(nom_fichier_dictionnaire):
@@ -329,12 +343,14 @@ def list_dico(nom_fichier_dictionnaire):
 
 def verif_mot(mot, dico):
     """
-    Cette fonction renvoie True si le mot à placer est bien un mot du dictionnaire. False sinon.
+    Cette fonction renvoie True si le mot à placer est bien un mot du dictionnaire. False sinon. Les lettres posées
+    avec un joker (en minuscule) sont lues comme les autres.
 
     Args :
         - mot (str): une chaine de caractères en majuscule qui indique le mot à placer
-        - dico (list) : une liste dont chaque élément d'indice i, est un set de mots du dictionnaire de longueur (i+1).
-        Par exemple, dico[3] pointe vers un set de tous les mots à 4 lettres.
+        - dico (list | Lexique) : une liste dont chaque élément d'indice i, est un set de mots du dictionnaire de
+        longueur (i+1). Par exemple, dico[3] pointe vers un set de tous les mots à 4 lettres. Un Lexique (DAWG
+        compressé) peut aussi être fourni à la place de cette liste.
 
     Returns :
         - bool (True ou False)
@@ -343,6 +359,9 @@ def verif_mot(mot, dico):
         >>> verif_mot("DES", [{'K', 'C', 'A'}, {'SI', 'DE'}, {'SES', 'MIS', 'DES'}])
         True
     """
+    mot = mot.upper()
+    if isinstance(dico, Lexique):
+        return mot in dico
     res = False
     if len(mot) <= len(dico):
         if mot in dico[len(mot) - 1]:
@@ -352,6 +371,41 @@ def verif_mot(mot, dico):
     return res
 
 
+def verif_mots(mots, dico):
+    """
+    Cette fonction vérifie plusieurs mots en un seul appel, comme autant d'appels à verif_mot. Avec un Lexique, les
+    mots qui partagent un préfixe le lisent une seule fois (Lexique.verifier_lot). Avec la liste de sets, les mots sont
+    regroupés par longueur pour ne lire chaque set qu'une fois. Quand tous les mots sont valides, la liste de réponses
+    est construite directement.
+
+    Args :
+        - mots (iterable) : les mots à vérifier, dans la même forme que pour verif_mot.
+        - dico (list | Lexique) : le dictionnaire, comme pour verif_mot.
+
+    Returns :
+        - list[bool] : True pour chaque mot du dictionnaire, dans l'ordre des mots.
+
+    Examples:
+        >>> verif_mots(["DES", "SI", "SES"], [{'K', 'C', 'A'}, {'SI', 'DE'}, {'SES', 'MIS', 'DES'}])
+        [True, True, True]
+    """
+    mots = [mot.upper() for mot in mots]
+    if isinstance(dico, Lexique):
+        return dico.verifier_lot(mots)
+    par_longueur: dict[int, set[str]] = {}
+    for mot in mots:
+        par_longueur.setdefault(len(mot), set()).add(mot)
+    inconnus = set()
+    for longueur, groupe in par_longueur.items():
+        if 0 < longueur <= len(dico):
+            inconnus |= groupe - dico[longueur - 1]
+        else:
+            inconnus |= groupe
+    if not inconnus:
+        return [True] * len(mots)
+    return [mot not in inconnus for mot in mots]
+
+
 def verif_emplacement(coup, plateau):
     """
     Cette fonction renvoie True si le mot à placer n'entre pas en conflit avec d'autres lettres déjà placées
@@ -386,11 +440,206 @@ def verif_emplacement(coup, plateau):
         for i in range(len(mot)):
             new_mot += plateau[line + i][column]
     for z in range(len(new_mot)):
-        if new_mot[z] == "_" or new_mot[z] == mot[z]:
+        if new_mot[z] == "_" or new_mot[z].upper() == mot[z].upper():
             x += 1
     return x == len(mot)
 
 
+class Refus(Enum):
+    """Raisons pour lesquelles un coup peut être refusé, avec le message affiché au joueur."""
+
+    BORNES = "le mot n'entre pas dans les bornes du plateau. Veuillez réessayer."
+    LETTRES = "Désolé mais vous n'avez pas les lettres pour écrire ce mot. Veuillez réessayer."
+    MOT_INCONNU = "Désolé mais ce mot n'existe pas. Veuillez réessayer."
+    EMPLACEMENT = "Désolé mais votre mot entre en conflit avec des lettre du plateau. Veuillez réessayer."
+    PREMIER_TOUR = "Désolé mais le premier mot doit passer par la case centrale. Veuillez réessayer."
+    ISOLE = "Désolé mais votre mot ne se base sur aucun autre mot du plateau. Veuillez réessayer."
+    PERPENDICULAIRE = (
+        "Le mot créent des mots perpendiculaire qui n'existe pas. Veuillez réessayer."
+    )
+    # Refus ajouté par MoteurPartie (mot_accepte accepte un mot qui ne pose aucune lettre).
+    AUCUNE_LETTRE = "Désolé mais votre mot doit utiliser au moins une lettre de votre chevalet. Veuillez réessayer."
+
+
+@dataclass(frozen=True)
+class EvaluationCoup:
+    """
+    Résultat de evaluer_coup: tout ce qu'il faut savoir d'un coup, calculé en une seule lecture du plateau.
+
+    Attributs:
+        - valide (bool) : si le coup est accepté (même résultat que mot_accepte).
+        - refus (tuple[Refus, ...]) : les raisons du refus, dans l'ordre où mot_accepte les affiche.
+        - mots (tuple[str, ...]) : les mots formés, triés, comme les renvoie mots_perpendiculaires (les lettres posées avec un
+        joker y sont en minuscule).
+        - lettres_posees (str) : les lettres à retirer du chevalet, dans l'ordre du mot (en minuscule pour un joker).
+        - lettres_plateau (str) : les lettres déjà présentes sous le mot, comme les renvoie placer_mot.
+        - nouvelles_cases (tuple) : les positions (l, c) des lettres posées.
+        - points (int) : les points marqués, bonus de 50 points compris.
+        - scrabble (bool) : si le coup utilise les 7 lettres du chevalet.
+    """
+
+    valide: bool
+    refus: tuple[Refus, ...] = ()
+    mots: tuple[str, ...] = ()
+    lettres_posees: str = ""
+    lettres_plateau: str = ""
+    nouvelles_cases: tuple[tuple[int, int], ...] = ()
+    points: int = 0
+    scrabble: bool = False
+
+
+def _mot_croise(lire, j, dernier, lettre):
+    """
+    Cette fonction renvoie l'indice de la première case et le mot perpendiculaire lu comme le fait
+    _lire_mots_perpendiculaires, lorsque la lettre est posée sur la case j d'une ligne (ou d'une colonne) dont lire(k)
+    renvoie la case k. Comme pour cette dernière, la lecture ne prend jamais la première ni la dernière case de la
+    ligne.
+    """
+    debut = j
+    while debut > 0 and lire(debut - 1) != "_":
+        debut -= 1
+    fin = j
+    while fin < dernier and lire(fin + 1) != "_":
+        fin += 1
+    debut = max(debut, 1)
+    return debut, "".join(
+        lettre if k == j else lire(k) for k in range(debut, min(fin, dernier - 1) + 1)
+    )
+
+
+def evaluer_coup(
+    plateau, lettres_joueur, coup, dictionnaire, tour, dimension, points_lettres=None
+):
+    """
+    Cette fonction évalue un coup en une seule lecture du plateau: les cases couvertes par le mot sont lues une fois,
+    puis seules les cases voisines des nouvelles lettres le sont pour les mots perpendiculaires. Le plateau n'est pas
+    modifié. Elle remplace les appels successifs à verif_lettre_joueur, verif_emplacement, mots_perpendiculaires,
+    placer_mot, localisation_lettre_sur_plateau, compte_points et fifty_points, avec exactement les mêmes règles que
+    mot_accepte.
+
+    Une lettre en minuscule du mot est posée avec un joker et ne rapporte aucun point. Sur une case déjà occupée, la
+    lettre du mot peut être écrite dans l'une ou l'autre casse: c'est celle du plateau qui compte.
+
+    Args :
+        - plateau (liste) : une liste de sous-listes qui représentent chacune une ligne du plateau de jeu.
+        - lettres_joueur (str) : les lettres du chevalet du joueur.
+        - coup (tuple): un tuple à 3 éléments (mot, (l, c), direction).
+        - dictionnaire (list | Lexique) : le dictionnaire, comme pour verif_mot.
+        - tour (int) : un entier qui représente le tour du jeu (tour = 1 représente le premier tour).
+        - dimension (tuple) : un tuple d'entiers (nb_l, nb_c) qui indique le nombre de ligne et de colonne du plateau.
+        - points_lettres (Bareme | dict | None) : le barème qui compte les points avec les cases bonus, ou les points
+        de chaque lettre pour les additionner comme compte_points. Sans lui, les points du coup valent 0.
+
+    Valeur de retour :
+        - EvaluationCoup : la légalité du coup, les raisons d'un refus, les mots formés, les lettres prises au
+        chevalet et les points marqués.
+
+    Examples :
+        >>> evaluation = evaluer_coup(init_plateau((15, 15)), "PRDSUET", ("DES", (7, 7), "H"),
+                                      [{'A'}, {'DE'}, {'DES'}], 1, (15, 15), {"D": 2, "E": 1, "S": 1})
+        >>> evaluation.valide, evaluation.mots, evaluation.lettres_posees, evaluation.points
+        (True, ('DES',), 'DES', 4)
+    """
+    mot, pos, direc = coup
+    line, column = pos
+    lignes, colonnes = dimension
+    if direc == "H":
+        dans_plateau = 0 <= line < lignes and column >= 0
+        cases = [(line, column + i) for i in range(len(mot))]
+    else:
+        dans_plateau = 0 <= column < colonnes and line >= 0
+        cases = [(line + i, column) for i in range(len(mot))]
+    if not dans_plateau or not verif_bornes(coup, dimension):
+        return EvaluationCoup(False, (Refus.BORNES,))
+
+    contenu = [plateau[li][c] for li, c in cases]
+    mot = "".join(
+        x if x.upper() == lettre.upper() else lettre
+        for x, lettre in zip(contenu, mot, strict=True)
+    )
+    lettres_plateau = "".join(x for x in contenu if x != "_")
+    ve_emp = all(x in ("_", lettre) for x, lettre in zip(contenu, mot, strict=True))
+    ve_lettre = all(lettre in INDICES for lettre in mot) and contient(
+        vers_compte(lettres_joueur + lettres_plateau), vers_compte(mot)
+    )
+    nouvelles_cases = []
+    lettres_posees = ""
+    perpendiculaires = []
+    couverte = False
+    for (li, c), x, lettre in zip(cases, contenu, mot, strict=True):
+        if x != "_":
+            couverte = True
+            continue
+        nouvelles_cases.append((li, c))
+        lettres_posees += lettre
+        # Comme dans _lire_mots_perpendiculaires, les mots perpendiculaires d'un mot horizontal ne sont plus lus après
+        # sa première lettre déjà présente sur le plateau.
+        if direc == "H" and couverte:
+            continue
+        if direc == "V":
+            debut, nv_mot = _mot_croise(
+                lambda k, li=li: plateau[li][k], c, colonnes - 1, lettre
+            )
+            cases_mot = [(li, debut + k) for k in range(len(nv_mot))]
+        else:
+            debut, nv_mot = _mot_croise(
+                lambda k, c=c: plateau[k][c], li, lignes - 1, lettre
+            )
+            cases_mot = [(debut + k, c) for k in range(len(nv_mot))]
+        if len(nv_mot) > 1:
+            perpendiculaires.append((nv_mot, cases_mot))
+
+    mots = [mot, *(m for m, _ in perpendiculaires)]
+    valides = verif_mots(mots, dictionnaire)
+    ve_mot = valides[0]
+    mots.sort()
+    if perpendiculaires and not all(valides):
+        mots = []
+
+    if tour == 1:
+        controles = [
+            (Refus.LETTRES, ve_lettre),
+            (Refus.MOT_INCONNU, ve_mot),
+            (Refus.EMPLACEMENT, ve_emp),
+            (Refus.PREMIER_TOUR, verif_premier_tour(coup)),
+        ]
+    elif not mots:
+        controles = [(Refus.PERPENDICULAIRE, False)]
+    else:
+        controles = [
+            (Refus.LETTRES, ve_lettre),
+            (Refus.MOT_INCONNU, ve_mot),
+            (Refus.EMPLACEMENT, ve_emp),
+        ]
+        if len(mots) == 1:
+            controles.append((Refus.ISOLE, lettres_plateau != ""))
+    refus = tuple(raison for raison, ok in controles if not ok)
+
+    valide = not refus
+    scrabble = valide and len(mot) > len(lettres_plateau) + 6
+    points = 0
+    if valide and isinstance(points_lettres, Bareme):
+        nouvelles = set(nouvelles_cases)
+        points = points_lettres.points_mot(mot, cases, nouvelles) + sum(
+            points_lettres.points_mot(m, cases_mot, nouvelles)
+            for m, cases_mot in perpendiculaires
+        )
+    elif valide and points_lettres is not None:
+        points = compte_points(mots, points_lettres)
+    if scrabble and points_lettres is not None:
+        points += 50
+    return EvaluationCoup(
+        valide,
+        refus,
+        tuple(mots),
+        lettres_posees,
+        lettres_plateau,
+        tuple(nouvelles_cases),
+        points,
+        scrabble,
+    )
+
+
 def mot_accepte(plateau, lettres_joueur, coup, dictionnaire, tour, dimension):
     """
     Cette fonction renvoie True si chacune des fonctions suivantes renvoient True:
@@ -402,6 +651,8 @@ def mot_accepte(plateau, lettres_joueur, coup, dictionnaire, tour, dimension):
         et en fonction de ce que renvoie la fonction mot_perpendiculaire, on test ou pas la fonction
         utilise_lettre_plateau qui est également un bool.
     Sinon, la fonction renvoie False.
+    Les vérifications sont faites par evaluer_coup, en une seule lecture du plateau; la fonction affiche le message
+    de chaque raison de refus.
 
     Args :
         - lettres_joueur (liste) : une liste contenant les lettres du joueur
@@ -447,76 +698,12 @@ def mot_accepte(plateau, lettres_joueur, coup, dictionnaire, tour, dimension):
         >>> mot_accepte(plateau, lettres_joueur, coup, dictionnaire, tour, dimension)
         True
     """
-    mot, pos, direc = coup
-    ve_borne = verif_bornes((mot, pos, direc), dimension)
-    res = True
-    if ve_borne and tour == 1:
-        ve_prem = verif_premier_tour((mot, pos, direc))
-        ve_lettre = verif_lettre_joueur(plateau, lettres_joueur, (mot, pos, direc))
-        ve_mot = verif_mot(mot, dictionnaire)
-        ve_emp = verif_emplacement((mot, pos, direc), plateau)
-        if not ve_prem or not ve_lettre or not ve_mot or not ve_emp:
-            if not ve_lettre:
-                print(
-                    "Désolé mais vous n'avez pas les lettres pour écrire ce mot. Veuillez réessayer."
-                )
-            if not ve_mot:
-                print("Désolé mais ce mot n'existe pas. Veuillez réessayer.")
-            if not ve_emp:
-                print(
-                    "Désolé mais votre mot entre en conflit avec des lettre du plateau. Veuillez réessayer."
-                )
-            if not ve_prem:
-                print(
-                    "Désolé mais le premier mot doit passer par la case centrale. Veuillez réessayer."
-                )
-            res = False
-    elif ve_borne:
-        ve_lettre = verif_lettre_joueur(plateau, lettres_joueur, (mot, pos, direc))
-        ve_mot = verif_mot(mot, dictionnaire)
-        ve_emp = verif_emplacement((mot, pos, direc), plateau)
-        len_perp = len(mots_perpendiculaires(coup, plateau, dictionnaire))
-        ut_plateau = utilise_lettre_plateau(coup, plateau)
-        if len_perp == 1:
-            if not ve_lettre or not ve_mot or not ve_emp or not ut_plateau:
-                if not ve_lettre:
-                    print(
-                        "Désolé mais vous n'avez pas les lettres pour écrire ce mot. Veuillez réessayer."
-                    )
-                if not ve_mot:
-                    print("Désolé mais ce mot n'existe pas. Veuillez réessayer.")
-                if not ve_emp:
-                    print(
-                        "Désolé mais votre mot entre en conflit avec des lettre du plateau. Veuillez réessayer."
-                    )
-                if not ut_plateau:
-                    print(
-                        "Désolé mais votre mot ne se base sur aucun autre mot du plateau. Veuillez réessayer."
-                    )
-                res = False
-        elif len_perp > 1:
-            if not ve_lettre or not ve_mot or not ve_emp:
-                if not ve_lettre:
-                    print(
-                        "Désolé mais vous n'avez pas les lettres pour écrire ce mot. Veuillez réessayer."
-                    )
-                if not ve_mot:
-                    print("Désolé mais ce mot n'existe pas. Veuillez réessayer.")
-                if not ve_emp:
-                    print(
-                        "Désolé mais votre mot entre en conflit avec des lettre du plateau. Veuillez réessayer."
-                    )
-                res = False
-        elif len_perp == 0:
-            print(
-                "Le mot créent des mots perpendiculaire qui n'existe pas. Veuillez réessayer."
-            )
-            res = False
-    else:
-        if not ve_borne:
-            print("le mot n'entre pas dans les bornes du plateau. Veuillez réessayer.")
-        res = False
-    return res
+    evaluation = evaluer_coup(
+        plateau, lettres_joueur, coup, dictionnaire, tour, dimension
+    )
+    for raison in evaluation.refus:
+        print(raison.value)
+    return evaluation.valide
 
 
 def compte_points(mots: list[str], points_lettres: dict[str, int]):
@@ -525,7 +712,7 @@ def compte_points(mots: list[str], points_lettres: dict[str, int]):
 
     Args :
         - mot (list) : une liste triée dont chaque élément d'indice i, est une chaine de caractère en majuscule
-        représentant les mots créés sur le plateau.
+        représentant les mots créés sur le plateau. Une lettre en minuscule, posée avec un joker, ne rapporte rien.
         - points_lettres (dict) : un dictionnaire contenant comme clés les différentes lettres de l'alphabet,
         en majuscule; et comme valeur, les points associées à chaque lettre.
 
@@ -542,7 +729,8 @@ def compte_points(mots: list[str], points_lettres: dict[str, int]):
     points = 0
     for i in range(len(mots)):
         for x in range(len(mots[i])):
-            points += points_lettres[mots[i][x]]
+            if not mots[i][x].islower():
+                points += points_lettres[mots[i][x]]
     return points
 
 
@@ -606,7 +794,9 @@ def retirer_chevalet(main, mot, lettre_en_trop):
     """
     Cette fonction retire du chevalet les lettres utile pour fabriquer le mot du joueur. elle fait donc également
     attention à ne pas retirer du chevalets des lettres déjà présente sur le plateau. Elle renvoie ce même chevalet mis
-    à jour.
+    à jour, en gardant l'ordre de ses lettres. Les lettres à retirer sont comptées dans un vecteur de 27 entiers: une
+    lettre en minuscule du mot, posée avec un joker, retire un "?" du chevalet. Une lettre du plateau, dans l'une ou
+    l'autre casse, couvre la même lettre du mot, qu'elle y soit écrite en majuscule ou en minuscule.
 
     Args:
         - main (str) : une chaine de caractères en majuscule représentant le chevalet du joueur.
@@ -624,16 +814,28 @@ def retirer_chevalet(main, mot, lettre_en_trop):
         >>> retirer_chevalet(main, mot, lettre_en_trop)
         DBJTE
     """
-    for i in range(len(lettre_en_trop)):
-        mot = mot.replace(lettre_en_trop[i], "", 1)
-    for x in range(len(mot)):
-        main = main.replace(mot[x], "", 1)
-    return main
+    a_retirer = vers_compte(mot)
+    for lettre in lettre_en_trop:
+        code = INDICES[lettre.upper()]
+        if a_retirer[code] > 0:
+            a_retirer[code] -= 1
+        elif a_retirer[JOKER] > 0:
+            a_retirer[JOKER] -= 1
+    reste_main = ""
+    for lettre in main:
+        code = INDICES[lettre]
+        if a_retirer[code] > 0:
+            a_retirer[code] -= 1
+        else:
+            reste_main += lettre
+    return reste_main
 
 
-def mot_sur_plateau(coup, plateau):
+def mot_sur_plateau(coup, plateau, cache=None):
     """
-    Cette fonction met les lettres du mot du joueur sur le plateau et renvoie le plateau mis à jour.
+    Cette fonction met les lettres du mot du joueur sur le plateau et renvoie le plateau mis à jour. Si un cache de
+    contraintes croisées est fourni, seules les lignes et colonnes qui passent par les nouvelles lettres y sont
+    recalculées.
 
     Args:
         - coup (tuple): un tuple à 3 éléments:
@@ -644,6 +846,7 @@ def mot_sur_plateau(coup, plateau):
         - plateau (liste): une liste de sous-listes qui représentent chacune une ligne du plateau de jeu. Elles
         contiennent chacune, soit un underscore pour indiquer que la case est vide, soit une lettre si elle a déjà été
         placée là auparavant.
+        - cache (CacheContraintes | None) : les contraintes croisées et les ancres du plateau à tenir à jour.
 
     Valeur de retour:
         - plateau (liste): une liste de sous-listes qui représentent chacune une ligne du plateau de jeu. Elles
@@ -690,12 +893,21 @@ def mot_sur_plateau(coup, plateau):
     """
     mot, pos, direc = coup
     line, column = pos
+    nouvelles_cases = []
     if direc == "H":
-        for i in range(len(mot)):
-            plateau[line][column + i] = mot[i]
+        cases = [(line, column + i) for i in range(len(mot))]
     elif direc == "V":
-        for i in range(len(mot)):
-            plateau[line + i][column] = mot[i]
+        cases = [(line + i, column) for i in range(len(mot))]
+    else:
+        cases = []
+    for (li, c), lettre in zip(cases, mot):
+        if plateau[li][c] == "_":
+            nouvelles_cases.append((li, c))
+        # Une lettre déjà posée avec un joker (en minuscule) reste un joker.
+        if plateau[li][c].upper() != lettre.upper():
+            plateau[li][c] = lettre
+    if cache is not None:
+        cache.mettre_a_jour(nouvelles_cases)
     return plateau
 
 
@@ -705,6 +917,7 @@ def multijoueur():
         - 0 : le nom du joueur
         - 1 : le chevalet du joueur
         - 2 : les points du joueur
+        - 3 : True si le joueur est joué par l'ordinateur
     Le nombre de sous listes correspond au nombre de joueur.
 
     Args :
@@ -719,29 +932,38 @@ def multijoueur():
         1
         Quel est le nom du joueur n° 1 ?
         Sebastien
-        [["Sebastien", "", 0]]
+        Le joueur n°1 est-il joué par l'ordinateur ? (o/n)
+        n
+        [["Sebastien", "", 0, False]]
     """
     nbr = input("Combien de joueur êtes vous? ")
     while not nbr.isdigit():
         nbr = input("Combien de joueur êtes vous? ")
     nbr = int(nbr)
     list_joueur = []
-    x = ["nom", "", 0]
+    x = ["nom", "", 0, False]
     for i in range(nbr):
         y = deepcopy(x)
         list_joueur.append(y)
         list_joueur[i][0] = input(f"Quel est le nom du joueur n°{i + 1} ? ")
+        ordi = ""
+        while ordi not in ("o", "n"):
+            ordi = input(
+                f"Le joueur n°{i + 1} est-il joué par l'ordinateur ? (o/n) "
+            ).lower()
+        list_joueur[i][3] = ordi == "o"
     return list_joueur
 
 
 def affichage_plateau(plateau):
     """
-    Cette fonction ne sert qu'à imprimer le plateau d'une manière plus esthétique. Elle ne renvoie rien.
+    Cette fonction ne sert qu'à imprimer le plateau d'une manière plus esthétique. Elle ne renvoie rien. Les lettres
+    posées avec un joker sont affichées en minuscule.
 
     Args:
         - plateau (liste): une liste de sous-listes qui représentent chacune une ligne du plateau de jeu. Elles
         contiennent chacune, soit un underscore pour indiquer que la case est vide, soit une lettre si elle a déjà été
-        placée là auparavant.
+        placée là auparavant. Un Plateau s'affiche de la même manière.
 
     valeur de retour:
         /
@@ -787,10 +1009,11 @@ def affichage_plateau(plateau):
         "     0    1    2    3    4    5    6    7    8    9   10   11   12   13   14"
     )
     for x in range(len(plateau)):
+        # Une ligne d'un Plateau s'affiche comme une ligne d'une liste de listes.
         if x > 9:
-            print(x, plateau[x], x)
+            print(x, list(plateau[x]), x)
         else:
-            print(x, "", plateau[x], x)
+            print(x, "", list(plateau[x]), x)
     print(
         "     0    1    2    3    4    5    6    7    8    9   10   11   12   13   14"
     )
@@ -837,7 +1060,9 @@ def utilise_lettre_plateau(coup, plateau):
 def mots_perpendiculaires(coup, plateau, dico):
     """
     Lorsqu'un mot est placé sur le plateau de jeu, il est possible qu'il soit adjacent à des lettres déjà présentes sur
-    le plateau. De nouveaux mots perpendiculaires au mot à placer sont alors formés.
+    le plateau. De nouveaux mots perpendiculaires au mot à placer sont alors formés. Pour les lire, le mot est posé
+    temporairement sur le plateau puis retiré (appliquer_coup / annuler_coup): le plateau n'est jamais copié et il est
+    rendu inchangé.
     3 cas sont possibles:
         - Si aucun mot perpendiculaire n'est formé, cette fonction renvoie une liste contenant un élément : le mot à
         placer.
@@ -857,7 +1082,8 @@ def mots_perpendiculaires(coup, plateau, dico):
         contiennent chacune, soit un underscore pour indiquer que la case est vide, soit une lettre si elle a déjà été
         placée là auparavant.
         - dico (list) : une liste dont chaque élément d'indice i, est un set de mots du dictionnaire de longueur (i+1).
-        Par exemple, dico[3] pointe vers un set de tous les mots à 4 lettres.
+        Par exemple, dico[3] pointe vers un set de tous les mots à 4 lettres. Les mots formés sont vérifiés ensemble
+        avec verif_mots.
 
     Returns:
         - liste de chaine de caractères
@@ -886,15 +1112,35 @@ def mots_perpendiculaires(coup, plateau, dico):
         >>> mots_perpendiculaires(coup, plateau, dico)
         []
     """
+    mot = coup[0]
+    lettre_deja_presente = localisation_lettre_sur_plateau(coup, plateau)
+    modifications = appliquer_coup(coup, plateau)
+    try:
+        liste_mots_perpendiculaire = _lire_mots_perpendiculaires(
+            coup, plateau, lettre_deja_presente
+        )
+    finally:
+        annuler_coup(plateau, modifications)
+    liste_mots_perpendiculaire.append(mot)
+    if len(liste_mots_perpendiculaire) > 1 and not all(
+        verif_mots(liste_mots_perpendiculaire, dico)
+    ):
+        liste_mots_perpendiculaire = []
+    liste_mots_perpendiculaire.sort()
+    return liste_mots_perpendiculaire
+
+
+def _lire_mots_perpendiculaires(coup, plateau_test, lettre_deja_presente):
+    """
+    Cette fonction renvoie les mots perpendiculaires formés par un coup déjà posé sur le plateau (plateau_test).
+    Les cases listées dans lettre_deja_presente étaient occupées avant le coup et ne forment pas de nouveau mot.
+    """
     mot, pos, direc = coup
     line, column = pos
     a, b = pos
     d = 0
     nv_mot = ""
     liste_mots_perpendiculaire = []
-    lettre_deja_presente = localisation_lettre_sur_plateau(coup, plateau)
-    plateau_test = deepcopy(plateau)
-    plateau_test = mot_sur_plateau(coup, plateau_test)
     if direc == "V":
         for i in range(len(mot)):
             for x in range(len(lettre_deja_presente)):
@@ -903,7 +1149,7 @@ def mots_perpendiculaires(coup, plateau, dico):
             while plateau_test[a + i][b] != "_" and b > 0 and d == 0:
                 b -= 1
             b += 1
-            while plateau_test[a + i][b] != "_" and b < 14 and d == 0:
+            while b < 14 and plateau_test[a + i][b] != "_" and d == 0:
                 nv_mot += plateau_test[a + i][b]
                 b += 1
             if len(nv_mot) > 1:
@@ -919,19 +1165,13 @@ def mots_perpendiculaires(coup, plateau, dico):
             while plateau_test[a][b + i] != "_" and a > 0 and d == 0:
                 a -= 1
             a += 1
-            while plateau_test[a][b + i] != "_" and a < 14 and d == 0:
+            while a < 14 and plateau_test[a][b + i] != "_" and d == 0:
                 nv_mot += plateau_test[a][b + i]
                 a += 1
             if len(nv_mot) > 1:
                 liste_mots_perpendiculaire.append(nv_mot)
             nv_mot = ""
             a, b = pos
-    liste_mots_perpendiculaire.append(mot)
-    if len(liste_mots_perpendiculaire) > 1:
-        for test in liste_mots_perpendiculaire:
-            if not verif_mot(test, dico):
-                liste_mots_perpendiculaire = []
-    liste_mots_perpendiculaire.sort()
     return liste_mots_perpendiculaire
 
 
@@ -1021,62 +1261,107 @@ def fifty_points(mot, lettre_en_plus):
     return points
 
 
+def placer_jokers(coup, plateau, lettres_joueur):
+    """
+    Cette fonction renvoie le coup dans lequel les lettres que le joueur n'a pas sur son chevalet sont posées avec ses
+    jokers ("?"), c'est-à-dire écrites en minuscule. Les lettres déjà présentes sur le plateau ne sont pas touchées. Le
+    joueur n'a ainsi qu'à taper son mot: s'il lui manque plus de lettres qu'il n'a de jokers, le coup sera refusé.
+
+    Args:
+        - coup (tuple): un tuple à 3 éléments (mot, (l, c), direction).
+        - plateau (liste) : le plateau de jeu.
+        - lettres_joueur (str) : les lettres du chevalet du joueur.
+
+    Valeur de retour:
+        - tuple : le coup, avec les lettres posées avec un joker en minuscule.
+
+    Examples:
+        >>> placer_jokers(("DES", (7, 7), "H"), init_plateau((15, 15)), "D?SABCF")
+        ('DeS', (7, 7), 'H')
+    """
+    mot, (line, column), direc = coup
+    compte = vers_compte(lettres_joueur)
+    lettres = list(mot)
+    manquantes = []
+    for i, lettre in enumerate(mot):
+        li, c = (line, column + i) if direc == "H" else (line + i, column)
+        if (
+            not (0 <= li < len(plateau) and 0 <= c < len(plateau[0]))
+            or plateau[li][c] != "_"
+            # Un symbole inconnu est laissé tel quel: le coup sera refusé.
+            or lettre not in INDICES
+        ):
+            continue
+        if compte[INDICES[lettre]] > 0:
+            compte[INDICES[lettre]] -= 1
+        else:
+            manquantes.append(i)
+    for i in manquantes[: compte[JOKER]]:
+        lettres[i] = lettres[i].lower()
+    return "".join(lettres), (line, column), direc
+
+
 def main():
     """
-    Cette fonction ne sert qu'à faire tourner tout le jeu
+    Cette fonction ne sert qu'à faire tourner tout le jeu. Les règles sont appliquées par MoteurPartie; cette fonction
+    ne fait que lire les coups des joueurs et afficher la partie. Le dictionnaire et les lettres sont chargés en
+    arrière-plan pendant que les joueurs se présentent; la durée du chargement est affichée sur la sortie d'erreur.
 
     Args:
         /
     Valeur de retour:
         /
     """
+    # Import local: moteur.py et ordinateur.py s'appuient sur les fonctions de ce module.
+    from .moteur import ChargementRessources, MoteurPartie
+    from .ordinateur import choisir_coup
+
+    chargement = ChargementRessources()
     list_joueur = multijoueur()
-    tour = 1
-    dimensions = (15, 15)
-    plateau_de_jeu = init_plateau(dimensions)
-    dico_occu, dico_points = load_fichier_lettres("resources/Lettres.txt")
-    dico_mot = list_dico("resources/dico.txt")
-    pioche = init_pioche(dico_occu)
-    while len(pioche) > 0:
-        for i in range(len(list_joueur)):
-            affichage_plateau(plateau_de_jeu)
-            pioche, list_joueur[i][1] = jeton_joueur(pioche, list_joueur[i][1])
-            print("C'est au tour de", list_joueur[i][0])
-            print("Vous avez dans votre main les jetons suivants:", list_joueur[i][1])
-            mot, pos, direc = propose_mot()
-            while not mot_accepte(
-                plateau_de_jeu,
-                list_joueur[i][1],
-                (mot, pos, direc),
-                dico_mot,
-                tour,
-                dimensions,
-            ):
-                mot, pos, direc = propose_mot()
-            lettre_en_plus = placer_mot((mot, pos, direc), plateau_de_jeu)
-            pts_scrabble_fifty = fifty_points(mot, lettre_en_plus)
-            list_joueur[i][2] = (
-                list_joueur[i][2]
-                + compte_points(
-                    mots_perpendiculaires((mot, pos, direc), plateau_de_jeu, dico_mot),
-                    dico_points,
-                )
-                + pts_scrabble_fifty
+    moteur = MoteurPartie.depuis_chargement(
+        [joueur[0] for joueur in list_joueur], chargement
+    )
+    print(
+        f"Ressources chargées en {chargement.duree:.2f} s "
+        f"(attente {chargement.attente:.2f} s)",
+        file=sys.stderr,
+    )
+    while len(moteur.etat.pioche) > 0 and not moteur.etat.terminee:
+        for _ in range(len(list_joueur)):
+            if moteur.etat.terminee:
+                break
+            joueur = moteur.joueur_courant
+            affichage_plateau(moteur.etat.plateau)
+            print("C'est au tour de", joueur.nom)
+            if list_joueur[moteur.etat.courant][3]:
+                coup = choisir_coup(moteur)
+                if coup is None:
+                    print(joueur.nom, "passe son tour.")
+                    moteur.passer()
+                    continue
+                resultat = moteur.jouer(coup)
+                print(joueur.nom, "joue", coup[0], "en", coup[1], coup[2])
+                print("Tu viens de marquer", resultat.points, "points.")
+                print("Tu as au total", joueur.points, "points.")
+                continue
+            print("Vous avez dans votre main les jetons suivants:", joueur.chevalet)
+            if "?" in joueur.chevalet:
+                print("Vos jokers (?) remplacent les lettres qui vous manquent.")
+            resultat = moteur.jouer(
+                placer_jokers(propose_mot(), moteur.etat.plateau, joueur.chevalet)
             )
-            print(
-                "Tu viens de marquer",
-                compte_points(
-                    mots_perpendiculaires((mot, pos, direc), plateau_de_jeu, dico_mot),
-                    dico_points,
+            while not resultat.valide:
+                for raison in resultat.refus:
+                    print(raison.value)
+                resultat = moteur.jouer(
+                    placer_jokers(propose_mot(), moteur.etat.plateau, joueur.chevalet)
                 )
-                + pts_scrabble_fifty,
-                "points.",
-            )
-            print("Tu as au total", list_joueur[i][2], "points.")
-            list_joueur[i][1] = retirer_chevalet(list_joueur[i][1], mot, lettre_en_plus)
-            plateau_de_jeu = mot_sur_plateau((mot, pos, direc), plateau_de_jeu)
-            tour += 1
+            if resultat.evaluation.scrabble:
+                print("Scrabble !")
+            print("Tu viens de marquer", resultat.points, "points.")
+            print("Tu as au total", joueur.points, "points.")
 
 
+# Le module importe le reste du paquet: il se lance avec python -m src.scrabble.main.
 if __name__ == "__main__":
     main()
@@ -0,0 +1,354 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import cache
+
+from .bonus import Bareme, Multiplicateurs
+from .cache import CacheLRU
+from .chevalet import JETONS, contient, empreinte, vers_compte
+from .generateur import CacheContraintes, Coup, generer_coups
+from .lexique import Lexique, charger_lexique
+from .main import (
+    EvaluationCoup,
+    Refus,
+    evaluer_coup,
+    load_fichier_lettres,
+    mot_sur_plateau,
+    retirer_chevalet,
+)
+from .pioche import TAILLE_CHEVALET, Pioche
+from .plateau import Plateau
+
+DIMENSIONS = (15, 15)
+# Nombre d'évaluations de coups gardées par partie (voir MoteurPartie.evaluer).
+TAILLE_CACHE = 1024
+
+
+def charger_ressources(
+    fichier_lettres: str = "resources/Lettres.txt",
+    fichier_dico: str = "resources/dico.txt",
+    fichier_bonus: str = "resources/bonus.txt",
+) -> tuple[Lexique, dict[str, int], Bareme]:
+    """Charge le dictionnaire, le nombre de jetons de chaque lettre et le barème."""
+    occurence, points = load_fichier_lettres(fichier_lettres)
+    bareme = Bareme(points, Multiplicateurs.depuis_fichier(fichier_bonus))
+    return charger_lexique(fichier_dico), occurence, bareme
+
+
+class ChargementRessources:
+    """Chargement des ressources du jeu (voir charger_ressources) dans un thread en
+    arrière-plan, lancé dès la création: l'interface peut demander le nom des joueurs
+    pendant que le dictionnaire se charge.
+
+    duree est la durée du chargement (None tant qu'il n'est pas fini) et attente le
+    temps passé à l'attendre dans ressources.
+    """
+
+    def __init__(
+        self,
+        fichier_lettres: str = "resources/Lettres.txt",
+        fichier_dico: str = "resources/dico.txt",
+        fichier_bonus: str = "resources/bonus.txt",
+    ) -> None:
+        self.duree: float | None = None
+        self.attente = 0.0
+        executeur = ThreadPoolExecutor(1, thread_name_prefix="chargement")
+        self._futur = executeur.submit(
+            self._charger, fichier_lettres, fichier_dico, fichier_bonus
+        )
+        # Le thread finit le chargement puis s'arrête.
+        executeur.shutdown(wait=False)
+
+    def _charger(self, *fichiers: str) -> tuple[Lexique, dict[str, int], Bareme]:
+        debut = time.perf_counter()
+        try:
+            return charger_ressources(*fichiers)
+        finally:
+            self.duree = time.perf_counter() - debut
+
+    @property
+    def termine(self) -> bool:
+        return self._futur.done()
+
+    def ressources(self) -> tuple[Lexique, dict[str, int], Bareme]:
+        """Renvoie les ressources chargées, en attendant la fin du chargement s'il
+        n'est pas fini. Une erreur du chargement est levée ici.
+        """
+        debut = time.perf_counter()
+        try:
+            return self._futur.result()
+        finally:
+            self.attente += time.perf_counter() - debut
+
+
+@cache
+def _cle_trait(courant: int) -> int:
+    return random.Random(f"trait {courant}").getrandbits(64)
+
+
+@dataclass
+class Joueur:
+    """Un joueur de la partie: son nom, son chevalet et ses points."""
+
+    nom: str
+    chevalet: str = ""
+    points: int = 0
+
+
+@dataclass
+class EtatPartie:
+    """Tout l'état d'une partie en cours.
+
+    tour suit la convention de mot_accepte: il vaut 1 tant qu'aucun mot n'a été posé et
+    augmente à chaque mot posé. passes compte les tours consécutifs sans mot posé.
+    """
+
+    plateau: Plateau
+    joueurs: list[Joueur]
+    pioche: Pioche
+    contraintes: CacheContraintes | None = None
+    tour: int = 1
+    courant: int = 0
+    passes: int = 0
+    terminee: bool = False
+
+
+@dataclass(frozen=True)
+class ResultatCoup:
+    """Résultat d'une action jouée par le moteur.
+
+    evaluation est None pour un tour passé ou un échange. Si valide est False, l'état
+    de la partie n'a pas changé.
+    """
+
+    valide: bool
+    joueur: int
+    evaluation: EvaluationCoup | None = None
+    points: int = 0
+    tirage: str = ""
+    terminee: bool = False
+    refus: tuple[Refus, ...] = ()
+
+
+class MoteurPartie:
+    """Moteur de jeu sans entrée ni sortie: il ne lit jamais stdin et n'écrit jamais sur
+    stdout, et chaque action renvoie un résultat structuré. L'interface en ligne de
+    commande (main) et les parties entre ordinateurs s'appuient dessus.
+
+    Le dictionnaire, les points des lettres et les cases bonus sont fournis déjà
+    chargés, si bien qu'ils peuvent être partagés par toutes les parties d'un même
+    processus.
+    """
+
+    def __init__(
+        self,
+        noms: list[str],
+        dictionnaire: Lexique,
+        occurence_lettres: dict[str, int],
+        bareme: Bareme,
+        graine: int | None = None,
+        dimensions: tuple[int, int] = DIMENSIONS,
+        taille_cache: int = TAILLE_CACHE,
+    ) -> None:
+        """
+        Args:
+            noms (list[str]): Le nom de chaque joueur, dans l'ordre de jeu.
+            dictionnaire (Lexique): Le dictionnaire.
+            occurence_lettres (dict[str, int]): Le nombre de jetons de chaque lettre.
+            bareme (Bareme): Les points des lettres et les cases bonus.
+            graine (int | None): La graine de la pioche, pour une partie reproductible.
+            dimensions (tuple[int, int]): Le nombre de lignes et de colonnes du plateau.
+            taille_cache (int): Le nombre d'évaluations gardées (0 n'en garde aucune).
+        """
+        self.dictionnaire = dictionnaire
+        self.bareme = bareme
+        self.dimensions = dimensions
+        self.evaluations = CacheLRU(taille_cache)
+        plateau = Plateau(dimensions)
+        self.etat = EtatPartie(
+            plateau=plateau,
+            joueurs=[Joueur(nom) for nom in noms],
+            pioche=Pioche(occurence_lettres, graine),
+            contraintes=CacheContraintes(plateau, dictionnaire),
+        )
+        for joueur in self.etat.joueurs:
+            joueur.chevalet = self.etat.pioche.completer(joueur.chevalet)
+
+    @classmethod
+    def depuis_fichiers(
+        cls,
+        noms: list[str],
+        fichier_lettres: str = "resources/Lettres.txt",
+        fichier_dico: str = "resources/dico.txt",
+        fichier_bonus: str = "resources/bonus.txt",
+        graine: int | None = None,
+    ) -> "MoteurPartie":
+        """Crée une partie en chargeant les ressources du jeu."""
+        ressources = charger_ressources(fichier_lettres, fichier_dico, fichier_bonus)
+        return cls(noms, *ressources, graine)
+
+    @classmethod
+    def depuis_chargement(
+        cls,
+        noms: list[str],
+        chargement: ChargementRessources,
+        graine: int | None = None,
+    ) -> "MoteurPartie":
+        """Crée une partie avec les ressources d'un chargement en arrière-plan, en
+        attendant la fin du chargement s'il n'est pas fini.
+        """
+        return cls(noms, *chargement.ressources(), graine)
+
+    @property
+    def joueur_courant(self) -> Joueur:
+        return self.etat.joueurs[self.etat.courant]
+
+    def evaluer(self, coup: Coup) -> EvaluationCoup:
+        """Évalue un coup du joueur courant sans le jouer. Contrairement à mot_accepte, un
+        coup qui ne pose aucune lettre est refusé: sans cela, une partie entre
+        ordinateurs pourrait ne jamais finir.
+
+        Les évaluations sont gardées dans self.evaluations, sous l'empreinte du
+        plateau, le tour, les lettres du chevalet et le coup: un joueur qui propose à
+        nouveau un coup refusé n'est pas réévalué. Elles sont toutes retirées quand
+        jouer modifie le plateau (la clé suffirait à ne plus les lire, mais elles
+        occuperaient le cache pour rien).
+        """
+        etat = self.etat
+        chevalet = self.joueur_courant.chevalet
+        cle = (etat.plateau.empreinte, etat.tour, "".join(sorted(chevalet)), coup)
+        evaluation = self.evaluations.obtenir(cle)
+        if evaluation is not None:
+            return evaluation
+        evaluation = evaluer_coup(
+            etat.plateau,
+            chevalet,
+            coup,
+            self.dictionnaire,
+            etat.tour,
+            self.dimensions,
+            self.bareme,
+        )
+        if evaluation.valide and not evaluation.lettres_posees:
+            evaluation = replace(
+                evaluation, valide=False, refus=(Refus.AUCUNE_LETTRE,), points=0
+            )
+        self.evaluations.ranger(cle, evaluation)
+        return evaluation
+
+    def legal(self, coup: Coup) -> bool:
+        """Renvoie True si le joueur courant peut jouer le coup."""
+        return not self.etat.terminee and self.evaluer(coup).valide
+
+    def coups_legaux(self) -> list[Coup]:
+        """Renvoie tous les coups que le joueur courant peut jouer."""
+        etat = self.etat
+        if etat.terminee:
+            return []
+        coups = generer_coups(
+            etat.plateau,
+            self.joueur_courant.chevalet,
+            self.dictionnaire,
+            etat.tour,
+            etat.contraintes,
+        )
+        return [coup for coup in coups if self._pose_une_lettre(coup)]
+
+    def jouer(self, coup: Coup) -> ResultatCoup:
+        """Joue un coup pour le joueur courant: le mot est posé, les points comptés, le
+        chevalet complété et la main passe au joueur suivant. Un coup refusé ne change
+        rien à la partie.
+        """
+        etat = self.etat
+        joueur = self.joueur_courant
+        indice = etat.courant
+        evaluation = self.evaluer(coup)
+        if etat.terminee or not evaluation.valide:
+            return ResultatCoup(False, indice, evaluation, refus=evaluation.refus)
+        joueur.points += evaluation.points
+        joueur.chevalet = retirer_chevalet(
+            joueur.chevalet, evaluation.lettres_posees, ""
+        )
+        mot_sur_plateau(coup, etat.plateau, etat.contraintes)
+        self.evaluations.vider()
+        tirage = self.piocher()
+        etat.tour += 1
+        etat.passes = 0
+        if not joueur.chevalet:
+            etat.terminee = True
+        self._joueur_suivant()
+        return ResultatCoup(
+            True, indice, evaluation, evaluation.points, tirage, etat.terminee
+        )
+
+    def piocher(self) -> str:
+        """Complète le chevalet du joueur courant et renvoie les lettres tirées."""
+        joueur = self.joueur_courant
+        avant = len(joueur.chevalet)
+        joueur.chevalet = self.etat.pioche.completer(joueur.chevalet)
+        return joueur.chevalet[avant:]
+
+    def passer(self) -> ResultatCoup:
+        """Le joueur courant passe son tour. La partie s'arrête quand tous les joueurs
+        ont passé deux fois de suite.
+        """
+        etat = self.etat
+        indice = etat.courant
+        if etat.terminee:
+            return ResultatCoup(False, indice)
+        etat.passes += 1
+        if etat.passes >= 2 * len(etat.joueurs):
+            etat.terminee = True
+        self._joueur_suivant()
+        return ResultatCoup(True, indice, terminee=etat.terminee)
+
+    def echanger(self, lettres: str) -> ResultatCoup:
+        """Le joueur courant échange des lettres de son chevalet contre des lettres de
+        la pioche. L'échange est refusé si le joueur n'a pas ces lettres ou si la pioche
+        en contient moins que TAILLE_CHEVALET.
+        """
+        etat = self.etat
+        joueur = self.joueur_courant
+        indice = etat.courant
+        if (
+            etat.terminee
+            or not lettres
+            or not all(lettre in JETONS for lettre in lettres)
+            or not contient(vers_compte(joueur.chevalet), vers_compte(lettres))
+            or len(etat.pioche) < TAILLE_CHEVALET
+        ):
+            return ResultatCoup(False, indice)
+        reste = retirer_chevalet(joueur.chevalet, lettres, "")
+        tirage = etat.pioche.echanger(lettres)
+        joueur.chevalet = reste + tirage
+        etat.passes += 1
+        if etat.passes >= 2 * len(etat.joueurs):
+            etat.terminee = True
+        self._joueur_suivant()
+        return ResultatCoup(True, indice, tirage=tirage, terminee=etat.terminee)
+
+    def empreinte(self) -> int:
+        """Renvoie l'empreinte de Zobrist (64 bits) de la position: le plateau, le
+        chevalet de chaque joueur et le joueur qui a la main. Les points, la pioche et
+        les tours passés n'en font pas partie.
+        """
+        etat = self.etat
+        resultat = etat.plateau.empreinte ^ _cle_trait(etat.courant)
+        for indice, joueur in enumerate(etat.joueurs):
+            resultat ^= empreinte(vers_compte(joueur.chevalet), indice)
+        return resultat
+
+    def scores(self) -> list[tuple[str, int]]:
+        """Renvoie le nom et les points de chaque joueur, dans l'ordre de jeu."""
+        return [(joueur.nom, joueur.points) for joueur in self.etat.joueurs]
+
+    def _pose_une_lettre(self, coup: Coup) -> bool:
+        mot, (li, c), direc = coup
+        plateau = self.etat.plateau
+        if direc == "H":
+            return "_" in plateau.ligne(li)[c : c + len(mot)]
+        return "_" in plateau.colonne(c)[li : li + len(mot)]
+
+    def _joueur_suivant(self) -> None:
+        self.etat.courant = (self.etat.courant + 1) % len(self.etat.joueurs)
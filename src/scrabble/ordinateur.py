@@ -0,0 +1,351 @@
+import heapq
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .bonus import Bareme, Multiplicateurs
+from .generateur import (
+    CacheContraintes,
+    Coup,
+    Depart,
+    coups_depuis,
+    departs_coups,
+    generer_coups,
+)
+from .lexique import Lexique
+from .moteur import MoteurPartie
+
+
+class ScoreurCoups:
+    """Compte les points des coups légaux d'un même plateau sans relire le plateau pour
+    chaque coup. Pour chaque case vide, la somme des lettres du mot perpendiculaire qui
+    s'y croise est calculée à la première demande puis gardée: compter un coup ne
+    coûte ensuite qu'un passage sur les lettres du mot.
+
+    Les points sont ceux de evaluer_coup avec un Bareme (les mots perpendiculaires
+    comptés sont ceux que lit mots_perpendiculaires). Le plateau ne doit pas changer
+    tant que le scoreur est utilisé.
+    """
+
+    def __init__(self, plateau, bareme: Bareme) -> None:
+        self.plateau = plateau
+        self.bareme = bareme
+        self.lignes, self.colonnes = len(plateau), len(plateau[0])
+        self._croisements: dict[tuple[str, int, int], tuple[int, bool] | None] = {}
+
+    def _croisement(self, direc: str, li: int, c: int) -> tuple[int, bool] | None:
+        """Renvoie, pour une lettre posée en (li, c) par un mot de direction direc, la
+        somme des lettres déjà posées du mot perpendiculaire et si la nouvelle lettre
+        en fait partie, ou None si aucun mot perpendiculaire n'est formé. La lecture
+        suit _mot_croise: ni la première ni la dernière case de la ligne.
+        """
+        cle = (direc, li, c)
+        if cle in self._croisements:
+            return self._croisements[cle]
+        plateau = self.plateau
+        if direc == "V":
+            j, dernier = c, self.colonnes - 1
+
+            def lire(k: int) -> str:
+                return plateau[li][k]
+        else:
+            j, dernier = li, self.lignes - 1
+
+            def lire(k: int) -> str:
+                return plateau[k][c]
+
+        debut = j
+        while debut > 0 and lire(debut - 1) != "_":
+            debut -= 1
+        fin = j
+        while fin < dernier and lire(fin + 1) != "_":
+            fin += 1
+        debut, fin = max(debut, 1), min(fin, dernier - 1)
+        resultat = None
+        if fin - debut >= 1:
+            valeurs = self.bareme.valeurs
+            somme = sum(valeurs[lire(k)] for k in range(debut, fin + 1) if k != j)
+            resultat = (somme, debut <= j <= fin)
+        self._croisements[cle] = resultat
+        return resultat
+
+    def points(self, coup: Coup) -> tuple[int, int]:
+        """Renvoie les points d'un coup légal et le nombre de lettres qu'il pose.
+
+        Args:
+            coup (Coup): Un coup légal (mot, (ligne, colonne), direction).
+
+        Returns:
+            tuple[int, int]: Les points du coup, bonus de 50 points compris, et le
+                nombre de lettres prises au chevalet.
+        """
+        mot, (li, c), direc = coup
+        plateau = self.plateau
+        valeurs = self.bareme.valeurs
+        multiplicateurs = self.bareme.multiplicateurs
+        lettre_fois, mot_fois = multiplicateurs.lettre, multiplicateurs.mot
+        largeur = multiplicateurs.colonnes
+        total = croises = 0
+        facteur = 1
+        posees = 0
+        couverte = False
+        for i, lettre in enumerate(mot):
+            ligne, colonne = (li, c + i) if direc == "H" else (li + i, c)
+            cellule = plateau[ligne][colonne]
+            if cellule != "_":
+                # La lettre du plateau, qui ne vaut rien si elle a été posée avec un joker.
+                total += valeurs[cellule]
+                couverte = True
+                continue
+            valeur = valeurs[lettre]
+            posees += 1
+            indice = ligne * largeur + colonne
+            valeur *= lettre_fois[indice]
+            total += valeur
+            facteur *= mot_fois[indice]
+            if direc == "H" and couverte:
+                continue
+            croisement = self._croisement(direc, ligne, colonne)
+            if croisement is not None:
+                somme, inclus = croisement
+                if inclus:
+                    croises += (somme + valeur) * mot_fois[indice]
+                else:
+                    croises += somme
+        points = total * facteur + croises
+        if posees >= 7:
+            points += 50
+        return points, posees
+
+
+def classer(
+    plateau, coups: Iterable[Coup], bareme: Bareme, k: int = 10
+) -> list[tuple[int, Coup]]:
+    """Renvoie les k coups qui rapportent le plus de points parmi des coups légaux, du
+    meilleur au moins bon, avec leurs points. Les coups qui ne posent aucune lettre
+    sont écartés.
+    """
+    scoreur = ScoreurCoups(plateau, bareme)
+    candidats = []
+    for coup in coups:
+        points, posees = scoreur.points(coup)
+        if posees:
+            candidats.append((points, coup))
+    return heapq.nlargest(k, candidats, key=lambda candidat: candidat[0])
+
+
+def meilleurs_coups(
+    plateau,
+    chevalet: str,
+    lexique: Lexique,
+    tour: int,
+    bareme: Bareme,
+    k: int = 10,
+    cache: CacheContraintes | None = None,
+) -> list[tuple[int, Coup]]:
+    """Renvoie les k coups qui rapportent le plus de points, du meilleur au moins bon.
+
+    Les coups sont énumérés par generer_coups puis classés par classer. Les coups où
+    un joker remplace une lettre restée sur le chevalet ne sont pas énumérés (voir
+    generer_coups): ils ne rapportent jamais plus que le même coup avec la lettre.
+
+    Args:
+        plateau (Plateau | list[list[str]]): Le plateau de jeu.
+        chevalet (str): Les lettres du joueur.
+        lexique (Lexique): Le dictionnaire.
+        tour (int): Le numéro du tour (1 pour le premier tour).
+        bareme (Bareme): Les points des lettres et les cases bonus.
+        k (int): Le nombre de coups à renvoyer.
+        cache (CacheContraintes | None): Les contraintes croisées du plateau.
+
+    Returns:
+        list[tuple[int, Coup]]: Les coups et leurs points.
+    """
+    coups = generer_coups(plateau, chevalet, lexique, tour, cache, jokers_utiles=True)
+    return classer(plateau, coups, bareme, k)
+
+
+@dataclass(frozen=True)
+class Recherche:
+    """Résultat d'une recherche de coups bornée dans le temps.
+
+    coups contient les meilleurs coups trouvés avant l'échéance et leurs points, du
+    meilleur au moins bon. La recherche est complete si toutes les cases de départ ont
+    été parcourues: coups a alors les mêmes points que le classement de classer (seul
+    l'ordre des coups à égalité peut changer).
+    """
+
+    coups: list[tuple[int, Coup]]
+    departs_explores: int
+    departs_total: int
+    coups_evalues: int
+    duree: float
+
+    @property
+    def complete(self) -> bool:
+        return self.departs_explores == self.departs_total
+
+    @property
+    def couverture(self) -> float:
+        """La part des cases de départ parcourues, entre 0 et 1."""
+        if not self.departs_total:
+            return 1.0
+        return self.departs_explores / self.departs_total
+
+
+# Nombre de cases vides, à partir de la case de départ, dont les bonus comptent pour
+# classer les cases de départ (voir _priorites).
+CASES_ESTIMEES = 4
+
+
+def _priorites(
+    cache: CacheContraintes,
+    multiplicateurs: Multiplicateurs,
+    taille_chevalet: int,
+    departs: list[Depart],
+) -> dict[Depart, float]:
+    """Estime, pour chaque case de départ, ce que ses coups peuvent rapporter par
+    rapport à ce qu'ils coûtent à énumérer: le produit des multiplicateurs de mot des
+    premières cases vides que le mot peut couvrir, divisé par le nombre de lettres à
+    poser avant d'atteindre une ancre (les préfixes posés sans contrainte sont ce qui
+    rend un parcours long).
+    """
+    priorites = {}
+    lignes: dict[tuple[str, int], tuple[list[int], list[int], list[int]]] = {}
+    largeur = multiplicateurs.colonnes
+    estimees = min(taille_chevalet, CASES_ESTIMEES)
+    for depart in departs:
+        direc, k, debut = depart
+        if (direc, k) not in lignes:
+            cellules = cache.ligne_de_jeu(direc, k)
+            ancres = cache.ancres[direc][k]
+            vides, avant, suivante = [], [], [len(cellules)] * (len(cellules) + 1)
+            for j, cellule in enumerate(cellules):
+                avant.append(len(vides))
+                if cellule == "_":
+                    indice = k * largeur + j if direc == "H" else j * largeur + k
+                    vides.append(multiplicateurs.mot[indice])
+            avant.append(len(vides))
+            for j in range(len(cellules) - 1, -1, -1):
+                suivante[j] = j if ancres >> j & 1 else suivante[j + 1]
+            lignes[direc, k] = (vides, avant, suivante)
+        vides, avant, suivante = lignes[direc, k]
+        facteur = 1
+        for mot in vides[avant[debut] : avant[debut] + estimees]:
+            facteur *= mot
+        # Sans ancre (au premier tour), tous les départs ont le même coût.
+        ancre = suivante[debut]
+        a_poser = (
+            avant[ancre] - avant[debut] if ancre < len(avant) - 1 else taille_chevalet
+        )
+        priorites[depart] = facteur / (1 + a_poser)
+    return priorites
+
+
+def rechercher_coups(
+    plateau,
+    chevalet: str,
+    lexique: Lexique,
+    tour: int,
+    bareme: Bareme,
+    delai: float,
+    k: int = 10,
+    cache: CacheContraintes | None = None,
+) -> Recherche:
+    """Cherche les k meilleurs coups sans dépasser un délai, et renvoie les meilleurs
+    trouvés quand le délai est écoulé.
+
+    Les coups sont énumérés case de départ par case de départ (voir coups_depuis), en
+    commençant par celles d'où un mot atteint vite une ancre et des cases bonus (voir
+    _priorites): les premiers coups trouvés sont ceux qui ont le plus de chances de
+    rapporter beaucoup. L'échéance est vérifiée entre deux cases de départ, et la
+    première case est toujours parcourue.
+
+    Args:
+        plateau (Plateau | list[list[str]]): Le plateau de jeu.
+        chevalet (str): Les lettres du joueur.
+        lexique (Lexique): Le dictionnaire.
+        tour (int): Le numéro du tour (1 pour le premier tour).
+        bareme (Bareme): Les points des lettres et les cases bonus.
+        delai (float): Le temps accordé à la recherche, en secondes.
+        k (int): Le nombre de coups à renvoyer.
+        cache (CacheContraintes | None): Les contraintes croisées du plateau.
+
+    Returns:
+        Recherche: Les coups trouvés et la part de la recherche menée à bien.
+    """
+    debut = time.perf_counter()
+    echeance = debut + delai
+    if cache is None:
+        cache = CacheContraintes(plateau, lexique)
+    departs = departs_coups(cache, chevalet, tour)
+    priorites = _priorites(cache, bareme.multiplicateurs, len(chevalet), departs)
+    departs.sort(key=priorites.__getitem__, reverse=True)
+    scoreur = ScoreurCoups(plateau, bareme)
+    candidats = []
+    explores = evalues = 0
+    for depart in departs:
+        if explores and time.perf_counter() >= echeance:
+            break
+        for coup in coups_depuis(cache, chevalet, tour, depart, jokers_utiles=True):
+            points, posees = scoreur.points(coup)
+            if posees:
+                candidats.append((points, coup))
+            evalues += 1
+        explores += 1
+    return Recherche(
+        heapq.nlargest(k, candidats, key=lambda candidat: candidat[0]),
+        explores,
+        len(departs),
+        evalues,
+        time.perf_counter() - debut,
+    )
+
+
+def chercher_coups(moteur: MoteurPartie, delai: float, k: int = 10) -> Recherche:
+    """Cherche les k meilleurs coups du joueur courant d'une partie sans dépasser un
+    délai (voir rechercher_coups).
+    """
+    etat = moteur.etat
+    if etat.terminee:
+        return Recherche([], 0, 0, 0, 0.0)
+    return rechercher_coups(
+        etat.plateau,
+        moteur.joueur_courant.chevalet,
+        moteur.dictionnaire,
+        etat.tour,
+        moteur.bareme,
+        delai,
+        k,
+        etat.contraintes,
+    )
+
+
+def classer_coups(moteur: MoteurPartie, k: int = 10) -> list[tuple[int, Coup]]:
+    """Renvoie les k meilleurs coups du joueur courant d'une partie et leurs points
+    (une liste vide si le joueur ne peut pas jouer).
+    """
+    etat = moteur.etat
+    if etat.terminee:
+        return []
+    return meilleurs_coups(
+        etat.plateau,
+        moteur.joueur_courant.chevalet,
+        moteur.dictionnaire,
+        etat.tour,
+        moteur.bareme,
+        k,
+        etat.contraintes,
+    )
+
+
+def choisir_coup(moteur: MoteurPartie, delai: float | None = None) -> Coup | None:
+    """Renvoie le coup qui rapporte le plus de points au joueur courant, ou None s'il
+    ne peut pas jouer. Avec un délai (en secondes), renvoie le meilleur coup trouvé
+    quand il est écoulé.
+    """
+    if delai is None:
+        meilleurs = classer_coups(moteur, 1)
+    else:
+        meilleurs = chercher_coups(moteur, delai, 1).coups
+    return meilleurs[0][1] if meilleurs else None
@@ -0,0 +1,112 @@
+import random
+from collections.abc import Iterable
+
+from .chevalet import INDICES, JETONS, JOKER, NB_JETONS, SYMBOLE_JOKER
+from .lexique import ALPHABET
+
+TAILLE_CHEVALET = 7
+
+
+class Pioche:
+    """Sac de jetons. Les jetons sont rangés dans une liste dont on retire un élément au
+    hasard en l'échangeant avec le dernier: un tirage coûte O(1), quelle que soit la
+    taille du sac, et chaque jeton a la même probabilité d'être tiré. Le nombre de
+    jetons de chaque sorte (les 26 lettres et le joker "?") est tenu à jour à côté.
+
+    Le tirage utilise son propre générateur aléatoire: à graine égale, une partie
+    simulée est reproductible, et deux processus ne partagent jamais leur état.
+    """
+
+    __slots__ = ("_jetons", "compte", "rng")
+
+    def __init__(
+        self,
+        occurence_lettres: dict[str, int] | None = None,
+        graine: int | None = None,
+    ) -> None:
+        """
+        Args:
+            occurence_lettres (dict[str, int] | None): Le nombre de jetons de chaque
+                lettre, comme le renvoie load_fichier_lettres.
+            graine (int | None): La graine du générateur aléatoire.
+        """
+        self.rng = random.Random(graine)
+        self._jetons: list[str] = []
+        self.compte = [0] * NB_JETONS
+        if occurence_lettres:
+            self.remettre(
+                "".join(lettre * n for lettre, n in occurence_lettres.items())
+            )
+
+    @classmethod
+    def depuis_chaine(cls, pioche_jeu: str, graine: int | None = None) -> "Pioche":
+        """Construit une pioche à partir de la chaine renvoyée par init_pioche."""
+        pioche = cls(graine=graine)
+        pioche.remettre(pioche_jeu)
+        return pioche
+
+    def __len__(self) -> int:
+        return len(self._jetons)
+
+    def __str__(self) -> str:
+        # Même ordre que init_pioche: les jokers avant les lettres.
+        lettres = "".join(lettre * n for lettre, n in zip(ALPHABET, self.compte))
+        return SYMBOLE_JOKER * self.compte[JOKER] + lettres
+
+    def __repr__(self) -> str:
+        return f"Pioche({str(self)!r})"
+
+    def piocher(self, nombre: int) -> str:
+        """Tire au hasard au plus nombre jetons (moins si le sac ne les contient plus).
+
+        Examples:
+            >>> pioche = Pioche({"A": 2, "B": 1}, graine=3)
+            >>> sorted(pioche.piocher(5))
+            ['A', 'A', 'B']
+        """
+        jetons = self._jetons
+        tirage = []
+        for _ in range(min(nombre, len(jetons))):
+            i = self.rng.randrange(len(jetons))
+            jetons[i], jetons[-1] = jetons[-1], jetons[i]
+            lettre = jetons.pop()
+            self.compte[INDICES[lettre]] -= 1
+            tirage.append(lettre)
+        return "".join(tirage)
+
+    def completer(self, chevalet: str) -> str:
+        """Complète le chevalet jusqu'à TAILLE_CHEVALET jetons et le renvoie."""
+        return chevalet + self.piocher(TAILLE_CHEVALET - len(chevalet))
+
+    def remettre(self, lettres: str) -> None:
+        """Remet des jetons dans le sac."""
+        for lettre in lettres:
+            self.compte[INDICES[lettre]] += 1
+        self._jetons.extend(lettres)
+
+    def echanger(self, lettres: str) -> str:
+        """Tire autant de nouveaux jetons que de lettres rendues, puis remet les lettres
+        rendues dans le sac: elles ne peuvent pas être tirées de nouveau.
+
+        Raises:
+            ValueError: Si le sac contient moins de jetons que de lettres rendues.
+        """
+        if len(lettres) > len(self._jetons):
+            raise ValueError("pas assez de jetons dans la pioche pour cet échange")
+        tirage = self.piocher(len(lettres))
+        self.remettre(lettres)
+        return tirage
+
+    def restantes(self, lettre: str) -> int:
+        """Renvoie le nombre de jetons d'une lettre encore dans le sac."""
+        return self.compte[INDICES[lettre]]
+
+    def non_vues(self, chevalets_adverses: Iterable[str] = ()) -> dict[str, int]:
+        """Renvoie, du point de vue d'un joueur, le nombre de jetons de chaque lettre
+        qu'il ne voit pas: ceux du sac et ceux des chevalets adverses.
+        """
+        compte = self.compte[:]
+        for chevalet in chevalets_adverses:
+            for lettre in chevalet:
+                compte[INDICES[lettre]] += 1
+        return {lettre: n for lettre, n in zip(JETONS, compte) if n}
@@ -0,0 +1,285 @@
+import random
+from collections.abc import Iterator
+from functools import cache
+
+VIDE = "_"
+_VIDE = ord(VIDE)
+# Nombre de valeurs d'octet possibles dans une case (les cases sont en ASCII).
+_OCTETS = 128
+
+
+@cache
+def cles_zobrist(cases: int) -> list[int]:
+    """Renvoie les clés de Zobrist d'un plateau de cases cases: la clé de la valeur
+    d'octet v dans la case i est cles[i * 128 + v], et celle d'une case vide vaut 0.
+    Les clés sont tirées avec une graine fixe: deux plateaux de même taille ont les
+    mêmes clés, dans tous les processus.
+    """
+    rng = random.Random(cases)
+    cles = [rng.getrandbits(64) for _ in range(cases * _OCTETS)]
+    for indice in range(cases):
+        cles[indice * _OCTETS + _VIDE] = 0
+    return cles
+
+
+class Ligne:
+    """Vue sur une ligne d'un Plateau. Elle s'indexe comme les sous-listes du plateau
+    renvoyé par init_plateau: plateau[ligne][colonne] lit ou écrit une case.
+    """
+
+    __slots__ = ("_debut", "_indice", "_plateau")
+
+    def __init__(self, plateau: "Plateau", indice: int) -> None:
+        self._plateau = plateau
+        self._indice = indice
+        self._debut = indice * plateau.colonnes
+
+    def __len__(self) -> int:
+        return self._plateau.colonnes
+
+    def __getitem__(self, colonne):
+        if isinstance(colonne, slice):
+            return list(str(self))[colonne]
+        if colonne < 0:
+            colonne += self._plateau.colonnes
+        if not 0 <= colonne < self._plateau.colonnes:
+            raise IndexError("colonne hors du plateau")
+        return chr(self._plateau._cases[self._debut + colonne])
+
+    def __setitem__(self, colonne: int, lettre: str) -> None:
+        if colonne < 0:
+            colonne += self._plateau.colonnes
+        if not 0 <= colonne < self._plateau.colonnes:
+            raise IndexError("colonne hors du plateau")
+        self._plateau.poser(self._indice, colonne, lettre)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(str(self))
+
+    def __str__(self) -> str:
+        return self._plateau.ligne(self._indice)
+
+    def __repr__(self) -> str:
+        return repr(list(str(self)))
+
+    def __eq__(self, autre: object) -> bool:
+        if isinstance(autre, Ligne):
+            return str(self) == str(autre)
+        if isinstance(autre, list):
+            return list(str(self)) == autre
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class Plateau:
+    """Plateau de jeu rangé dans un bytearray (une case par octet, ligne par ligne),
+    avec le masque de bits des cases occupées de chaque ligne et de chaque colonne.
+
+    Il s'utilise comme la liste de sous-listes renvoyée par init_plateau
+    (plateau[ligne][colonne]), si bien que verif_emplacement, placer_mot,
+    localisation_lettre_sur_plateau ou mot_sur_plateau l'acceptent tels quels. Une
+    copie ne coûte qu'une copie du bytearray, savoir si le plateau est vide est
+    immédiat et une ligne ou une colonne se lit en une seule tranche. Une lettre posée
+    avec un joker y est rangée en minuscule.
+
+    empreinte est l'empreinte de Zobrist (64 bits) du contenu du plateau: le ou
+    exclusif des clés de ses cases occupées (voir cles_zobrist). Elle est tenue à jour
+    par poser, donc par mot_sur_plateau, appliquer_coup et annuler_coup, et identifie
+    une position en O(1) pour les caches et les tables de transposition. Deux plateaux
+    de même contenu ont la même empreinte, quel que soit l'ordre des coups joués.
+    """
+
+    __slots__ = (
+        "_cases",
+        "_cles",
+        "_lignes",
+        "colonnes",
+        "empreinte",
+        "lignes",
+        "occupation_colonnes",
+        "occupation_lignes",
+        "occupees",
+    )
+
+    def __init__(self, dimensions: tuple[int, int]) -> None:
+        self.lignes, self.colonnes = dimensions
+        self._cases = bytearray(VIDE * (self.lignes * self.colonnes), "ascii")
+        self.occupation_lignes = [0] * self.lignes
+        self.occupation_colonnes = [0] * self.colonnes
+        self.occupees = 0
+        self.empreinte = 0
+        self._cles = cles_zobrist(self.lignes * self.colonnes)
+        self._lignes: list[Ligne | None] = [None] * self.lignes
+
+    @classmethod
+    def depuis_listes(cls, plateau: list[list[str]]) -> "Plateau":
+        """Construit un Plateau à partir d'un plateau renvoyé par init_plateau."""
+        resultat = cls((len(plateau), len(plateau[0])))
+        for li, ligne in enumerate(plateau):
+            for c, case in enumerate(ligne):
+                if case != VIDE:
+                    resultat.poser(li, c, case)
+        return resultat
+
+    def vers_listes(self) -> list[list[str]]:
+        """Renvoie le plateau sous la forme d'une liste de sous-listes."""
+        return [list(self.ligne(li)) for li in range(self.lignes)]
+
+    def __len__(self) -> int:
+        return self.lignes
+
+    def __getitem__(self, ligne: int) -> Ligne:
+        if ligne < 0:
+            ligne += self.lignes
+        vue = self._lignes[ligne]
+        if vue is None:
+            vue = self._lignes[ligne] = Ligne(self, ligne)
+        return vue
+
+    def __iter__(self) -> Iterator[Ligne]:
+        return (self[li] for li in range(self.lignes))
+
+    def __eq__(self, autre: object) -> bool:
+        if isinstance(autre, Plateau):
+            return self.colonnes == autre.colonnes and self._cases == autre._cases
+        if isinstance(autre, list):
+            return self.vers_listes() == autre
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Plateau({self.vers_listes()!r})"
+
+    def case(self, ligne: int, colonne: int) -> str:
+        """Renvoie le contenu d'une case ("_" si elle est vide)."""
+        return chr(self._cases[ligne * self.colonnes + colonne])
+
+    def poser(self, ligne: int, colonne: int, lettre: str) -> None:
+        """Écrit une lettre (ou "_" pour vider la case) et met à jour les masques
+        d'occupation.
+        """
+        indice = ligne * self.colonnes + colonne
+        ancienne = self._cases[indice]
+        nouvelle = ord(lettre)
+        self._cases[indice] = nouvelle
+        base = indice * _OCTETS
+        self.empreinte ^= self._cles[base + ancienne] ^ self._cles[base + nouvelle]
+        if nouvelle != _VIDE:
+            self.occupation_lignes[ligne] |= 1 << colonne
+            self.occupation_colonnes[colonne] |= 1 << ligne
+            if ancienne == _VIDE:
+                self.occupees += 1
+        else:
+            self.occupation_lignes[ligne] &= ~(1 << colonne)
+            self.occupation_colonnes[colonne] &= ~(1 << ligne)
+            if ancienne != _VIDE:
+                self.occupees -= 1
+
+    def est_vide(self) -> bool:
+        """Renvoie True si aucune lettre n'est posée sur le plateau."""
+        return self.occupees == 0
+
+    def ligne(self, ligne: int) -> str:
+        """Renvoie le contenu d'une ligne sous la forme d'une chaine."""
+        debut = ligne * self.colonnes
+        return self._cases[debut : debut + self.colonnes].decode("ascii")
+
+    def colonne(self, colonne: int) -> str:
+        """Renvoie le contenu d'une colonne sous la forme d'une chaine."""
+        return self._cases[colonne :: self.colonnes].decode("ascii")
+
+    def copie(self) -> "Plateau":
+        """Renvoie une copie indépendante du plateau."""
+        resultat = Plateau.__new__(Plateau)
+        resultat.lignes, resultat.colonnes = self.lignes, self.colonnes
+        resultat._cases = self._cases[:]
+        resultat.occupation_lignes = self.occupation_lignes[:]
+        resultat.occupation_colonnes = self.occupation_colonnes[:]
+        resultat.occupees = self.occupees
+        resultat.empreinte = self.empreinte
+        resultat._cles = self._cles
+        resultat._lignes = [None] * self.lignes
+        return resultat
+
+    def __getstate__(self) -> tuple[int, int, bytes]:
+        # Les clés de Zobrist ne sont pas copiées: elles sont retrouvées à partir de
+        # la taille du plateau.
+        return self.lignes, self.colonnes, bytes(self._cases)
+
+    def __setstate__(self, etat: tuple[int, int, bytes]) -> None:
+        lignes, colonnes, cases = etat
+        self.__init__((lignes, colonnes))
+        for indice, octet in enumerate(cases):
+            if octet != _VIDE:
+                self.poser(*divmod(indice, colonnes), chr(octet))
+
+    def __copy__(self) -> "Plateau":
+        return self.copie()
+
+    def __deepcopy__(self, memo: dict) -> "Plateau":
+        return self.copie()
+
+    def appliquer(self, coup: tuple[str, tuple[int, int], str]) -> list:
+        """Pose le mot du coup sur le plateau (voir appliquer_coup)."""
+        return appliquer_coup(coup, self)
+
+    def annuler(self, modifications: list) -> None:
+        """Annule un coup posé avec appliquer (voir annuler_coup)."""
+        annuler_coup(self, modifications)
+
+
+def appliquer_coup(coup: tuple[str, tuple[int, int], str], plateau) -> list:
+    """Pose le mot du coup sur le plateau comme mot_sur_plateau, mais renvoie la liste
+    des seules cases dont le contenu a changé, avec leur ancien contenu. Passée à
+    annuler_coup, elle remet le plateau dans son état d'origine: on peut ainsi tester
+    autant de placements que l'on veut sans jamais copier le plateau. Si le mot sort
+    du plateau, IndexError est levée et le plateau est laissé inchangé.
+
+    Args:
+        coup (tuple): Le coup (mot, (ligne, colonne), direction) à poser.
+        plateau (Plateau | list[list[str]]): Le plateau de jeu, modifié en place.
+
+    Returns:
+        list[tuple[int, int, str]]: Les cases modifiées (ligne, colonne, ancien contenu).
+
+    Examples:
+        >>> plateau = init_plateau((15, 15))
+        >>> modifications = appliquer_coup(("DES", (7, 7), "H"), plateau)
+        >>> modifications
+        [(7, 7, '_'), (7, 8, '_'), (7, 9, '_')]
+        >>> annuler_coup(plateau, modifications)
+    """
+    mot, (line, column), direc = coup
+    if direc == "H":
+        cases = [(line, column + i) for i in range(len(mot))]
+    elif direc == "V":
+        cases = [(line + i, column) for i in range(len(mot))]
+    else:
+        return []
+    modifications = []
+    try:
+        for (li, c), lettre in zip(cases, mot, strict=True):
+            ancienne = plateau[li][c]
+            # Une lettre déjà posée avec un joker (en minuscule) reste un joker.
+            if ancienne.upper() != lettre.upper():
+                modifications.append((li, c, ancienne))
+                plateau[li][c] = lettre
+    except IndexError:
+        # Un mot qui sort du plateau n'y laisse aucune lettre.
+        annuler_coup(plateau, modifications)
+        raise
+    return modifications
+
+
+def annuler_coup(plateau, modifications: list) -> None:
+    """Remet dans leur état d'origine les cases modifiées par appliquer_coup.
+
+    Args:
+        plateau (Plateau | list[list[str]]): Le plateau de jeu, modifié en place.
+        modifications (list[tuple[int, int, str]]): Les cases renvoyées par
+            appliquer_coup.
+    """
+    for li, c, ancienne in reversed(modifications):
+        plateau[li][c] = ancienne
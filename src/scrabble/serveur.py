@@ -0,0 +1,386 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Self
+
+from .bonus import Bareme
+from .generateur import Coup
+from .lexique import ALPHABET, Lexique
+from .moteur import MoteurPartie, ResultatCoup, charger_ressources
+from .ordinateur import meilleurs_coups
+from .plateau import Plateau
+
+# Protocole: chaque message, dans un sens comme dans l'autre, est un objet JSON écrit
+# sur une ligne. Le client choisit l'action avec "type":
+#   - rejoindre: {"partie", "nom"} et, pour créer la partie, "joueurs" (2 par défaut),
+#     "ordinateurs" (0 par défaut) et "graine". Prend la première place libre.
+#   - proposer: {"mot", "ligne", "colonne", "direction"}, joue un coup.
+#   - passer: passe son tour.
+#   - plateau: l'état de la partie et le chevalet du joueur.
+#   - scores: les points de chaque joueur.
+# Une réponse a le type de la demande, ou "erreur" avec un message.
+TYPES = ("rejoindre", "proposer", "passer", "plateau", "scores")
+# Les lettres d'un mot proposé: les minuscules sont posées avec un joker.
+LETTRES_MOT = frozenset(ALPHABET + ALPHABET.lower())
+
+# Ressources chargées une seule fois par processus (voir initialiser).
+_ressources: tuple[Lexique, Bareme] | None = None
+
+
+def initialiser(dictionnaire: Lexique, bareme: Bareme) -> None:
+    """Garde le dictionnaire et le barème utilisés par chercher_coup dans le processus
+    courant. Appelée une fois au démarrage de chaque processus du serveur.
+    """
+    global _ressources
+    _ressources = (dictionnaire, bareme)
+
+
+def chercher_coup(
+    plateau: Plateau,
+    chevalet: str,
+    tour: int,
+    ressources: tuple[Lexique, Bareme] | None = None,
+) -> Coup | None:
+    """Renvoie le coup qui rapporte le plus de points (comme choisir_coup), ou None
+    s'il n'y en a pas. Seule la position est transmise: le coup est calculé dans un
+    processus du serveur et joué par la boucle d'événements sur la vraie partie.
+
+    Args:
+        plateau (Plateau): Le plateau de la partie.
+        chevalet (str): Le chevalet de l'ordinateur.
+        tour (int): Le tour de jeu, comme pour mot_accepte.
+        ressources (tuple | None): Le dictionnaire et le barème, ceux donnés à
+            initialiser par défaut.
+    """
+    dictionnaire, bareme = ressources or _ressources
+    meilleurs = meilleurs_coups(plateau, chevalet, dictionnaire, tour, bareme, 1)
+    return meilleurs[0][1] if meilleurs else None
+
+
+class ErreurProtocole(ValueError):
+    """Message invalide ou action impossible: renvoyée au client, la connexion reste
+    ouverte.
+    """
+
+
+@dataclass
+class PartieEnLigne:
+    """Une partie hébergée par le serveur: son moteur, les places des ordinateurs et
+    celles déjà prises par des clients.
+    """
+
+    moteur: MoteurPartie
+    ordinateurs: frozenset[int]
+    prises: set[int] = field(default_factory=set)
+    # Les actions d'une partie sont jouées une à une, tours des ordinateurs compris.
+    verrou: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def complete(self) -> bool:
+        return len(self.prises) + len(self.ordinateurs) == len(self.moteur.etat.joueurs)
+
+
+@dataclass
+class Session:
+    """La partie et la place d'une connexion, une fois qu'elle a rejoint une partie."""
+
+    partie: str | None = None
+    joueur: int | None = None
+
+
+class ServeurParties:
+    """Héberge autant de parties indépendantes que l'on veut dans un seul processus.
+    Chaque partie a son plateau et sa pioche; le dictionnaire et le barème, chargés une
+    fois, sont partagés par toutes et jamais modifiés.
+
+    Les coups sont validés par MoteurPartie (les règles de mot_accepte). Le coup d'un
+    ordinateur est cherché dans un ProcessPoolExecutor, qui ne reçoit que le plateau,
+    le chevalet et le tour (le dictionnaire y est en mémoire partagée, voir
+    Lexique.partager), puis joué par la boucle d'événements: elle continue de
+    répondre aux autres parties pendant la recherche. Avec processus=0, la recherche
+    est faite dans un thread, qui garde le GIL: la boucle répond alors bien plus
+    lentement pendant un tour d'ordinateur.
+    """
+
+    def __init__(
+        self,
+        dictionnaire: Lexique,
+        occurence_lettres: dict[str, int],
+        bareme: Bareme,
+        processus: int | None = None,
+    ) -> None:
+        """
+        Args:
+            dictionnaire (Lexique): Le dictionnaire de toutes les parties.
+            occurence_lettres (dict[str, int]): Le nombre de jetons de chaque lettre.
+            bareme (Bareme): Les points des lettres et les cases bonus.
+            processus (int | None): Le nombre de processus qui cherchent les coups
+                des ordinateurs, le nombre de processeurs par défaut.
+        """
+        self.dictionnaire = dictionnaire
+        self.occurence_lettres = occurence_lettres
+        self.bareme = bareme
+        self.parties: dict[str, PartieEnLigne] = {}
+        self.processus = processus if processus is not None else os.cpu_count() or 1
+        self._executeur: ProcessPoolExecutor | None = None
+        self._partage: Lexique | None = None
+        if self.processus:
+            self._partage = dictionnaire.partager()
+            self._executeur = ProcessPoolExecutor(
+                max_workers=self.processus,
+                initializer=initialiser,
+                initargs=(self._partage, bareme),
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+    def fermer(self) -> None:
+        """Arrête les processus du serveur et libère le dictionnaire partagé."""
+        if self._executeur is not None:
+            self._executeur.shutdown()
+            self._executeur = None
+        if self._partage is not None:
+            self._partage.fermer()
+            self._partage = None
+
+    async def servir(self, hote: str = "127.0.0.1", port: int = 8765) -> asyncio.Server:
+        """Ouvre le serveur TCP et renvoie le serveur asyncio qui accepte les clients."""
+        return await asyncio.start_server(self._client, hote, port)
+
+    async def _client(
+        self, lecteur: asyncio.StreamReader, ecrivain: asyncio.StreamWriter
+    ) -> None:
+        session = Session()
+        try:
+            while ligne := await lecteur.readline():
+                if not ligne.strip():
+                    continue
+                try:
+                    message = json.loads(ligne)
+                    if not isinstance(message, dict):
+                        raise ErreurProtocole("un message est un objet JSON")
+                    reponse = await self.traiter(message, session)
+                except (ErreurProtocole, json.JSONDecodeError) as erreur:
+                    reponse = {"type": "erreur", "message": str(erreur)}
+                except Exception:
+                    # Un message qui fait échouer le serveur ne coupe pas la session.
+                    logging.getLogger(__name__).exception(
+                        "message non traité: %r", ligne
+                    )
+                    reponse = {"type": "erreur", "message": "erreur interne"}
+                ecrivain.write(json.dumps(reponse).encode() + b"\n")
+                await ecrivain.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._quitter(session)
+            ecrivain.close()
+
+    def _quitter(self, session: Session) -> None:
+        """Libère la place d'un client déconnecté. Une partie sans client est retirée."""
+        partie = self.parties.get(session.partie) if session.partie else None
+        if partie is None:
+            return
+        partie.prises.discard(session.joueur)
+        if not partie.prises:
+            del self.parties[session.partie]
+
+    async def traiter(self, message: dict, session: Session) -> dict:
+        """Répond à un message d'un client (voir TYPES).
+
+        Raises:
+            ErreurProtocole: Si le message est invalide ou l'action impossible.
+        """
+        genre = message.get("type")
+        if genre not in TYPES:
+            raise ErreurProtocole(f"type de message inconnu: {genre!r}")
+        if genre == "rejoindre":
+            return await self._rejoindre(message, session)
+        if session.partie is None:
+            raise ErreurProtocole("rejoignez d'abord une partie")
+        partie = self.parties[session.partie]
+        moteur = partie.moteur
+        async with partie.verrou:
+            if genre == "plateau":
+                return self._etat(partie, session)
+            if genre == "scores":
+                return {
+                    "type": "scores",
+                    "scores": moteur.scores(),
+                    "terminee": moteur.etat.terminee,
+                }
+            if not partie.complete:
+                raise ErreurProtocole("la partie attend encore des joueurs")
+            if moteur.etat.courant != session.joueur:
+                raise ErreurProtocole("ce n'est pas votre tour")
+            if genre == "passer":
+                resultat = moteur.passer()
+            else:
+                resultat = moteur.jouer(_coup(message))
+            reponse = {"type": genre} | _resultat(resultat)
+            reponse["ordinateurs"] = await self._tours_ordinateurs(partie)
+            reponse["chevalet"] = moteur.etat.joueurs[session.joueur].chevalet
+        return reponse
+
+    async def _rejoindre(self, message: dict, session: Session) -> dict:
+        if session.partie is not None:
+            raise ErreurProtocole("cette connexion a déjà rejoint une partie")
+        nom_partie = str(message.get("partie", ""))
+        nom = str(message.get("nom", ""))
+        if not nom_partie or not nom:
+            raise ErreurProtocole("rejoindre demande une partie et un nom")
+        partie = self.parties.get(nom_partie)
+        if partie is None:
+            partie = self._creer(message)
+            self.parties[nom_partie] = partie
+        libres = [
+            i
+            for i in range(len(partie.moteur.etat.joueurs))
+            if i not in partie.prises and i not in partie.ordinateurs
+        ]
+        if not libres:
+            raise ErreurProtocole(f"la partie {nom_partie} est complète")
+        joueur = libres[0]
+        partie.prises.add(joueur)
+        partie.moteur.etat.joueurs[joueur].nom = nom
+        session.partie, session.joueur = nom_partie, joueur
+        return {
+            "type": "rejoindre",
+            "partie": nom_partie,
+            "joueur": joueur,
+            "complete": partie.complete,
+            "chevalet": partie.moteur.etat.joueurs[joueur].chevalet,
+        }
+
+    def _creer(self, message: dict) -> PartieEnLigne:
+        try:
+            nb_joueurs = int(message.get("joueurs", 2))
+            nb_ordinateurs = int(message.get("ordinateurs", 0))
+            graine = message.get("graine")
+            graine = None if graine is None else int(graine)
+        except (TypeError, ValueError) as erreur:
+            raise ErreurProtocole(f"paramètres de partie invalides: {erreur}") from None
+        if not 0 <= nb_ordinateurs < nb_joueurs:
+            raise ErreurProtocole(
+                "il faut au moins un joueur qui ne soit pas un ordinateur"
+            )
+        # Les ordinateurs prennent les dernières places.
+        noms = [f"joueur{i + 1}" for i in range(nb_joueurs - nb_ordinateurs)]
+        noms += [f"ordi{i + 1}" for i in range(nb_ordinateurs)]
+        moteur = MoteurPartie(
+            noms, self.dictionnaire, self.occurence_lettres, self.bareme, graine
+        )
+        return PartieEnLigne(
+            moteur, frozenset(range(nb_joueurs - nb_ordinateurs, nb_joueurs))
+        )
+
+    async def _tours_ordinateurs(self, partie: PartieEnLigne) -> list[dict]:
+        """Joue les tours des ordinateurs jusqu'au tour d'un client ou la fin de la
+        partie et renvoie leurs coups. Le verrou de la partie doit être pris.
+        """
+        boucle = asyncio.get_running_loop()
+        moteur = partie.moteur
+        etat = moteur.etat
+        joues = []
+        while not etat.terminee and etat.courant in partie.ordinateurs:
+            position = (etat.plateau, moteur.joueur_courant.chevalet, etat.tour)
+            if self._executeur is not None:
+                coup = await boucle.run_in_executor(
+                    self._executeur, chercher_coup, *position
+                )
+            else:
+                coup = await boucle.run_in_executor(
+                    None, chercher_coup, *position, (self.dictionnaire, self.bareme)
+                )
+            resultat = moteur.passer() if coup is None else moteur.jouer(coup)
+            joue = _resultat(resultat)
+            if coup is not None:
+                mot, (ligne, colonne), direction = coup
+                joue |= {
+                    "mot": mot,
+                    "ligne": ligne,
+                    "colonne": colonne,
+                    "direction": direction,
+                }
+            joues.append(joue)
+        return joues
+
+    def _etat(self, partie: PartieEnLigne, session: Session) -> dict:
+        etat = partie.moteur.etat
+        return {
+            "type": "plateau",
+            "lignes": [etat.plateau.ligne(li) for li in range(etat.plateau.lignes)],
+            "tour": etat.tour,
+            "courant": etat.courant,
+            "joueurs": [joueur.nom for joueur in etat.joueurs],
+            "pioche": len(etat.pioche),
+            "complete": partie.complete,
+            "terminee": etat.terminee,
+            "chevalet": etat.joueurs[session.joueur].chevalet,
+        }
+
+
+def _coup(message: dict) -> tuple[str, tuple[int, int], str]:
+    """Lit le coup d'un message proposer. Le coup est rendu sous forme de tuples, comme
+    ceux de propose_mot: il sert de clé au cache des évaluations du moteur.
+    """
+    try:
+        mot = message["mot"]
+        ligne, colonne = int(message["ligne"]), int(message["colonne"])
+        direction = str(message["direction"]).upper()
+    except (KeyError, TypeError, ValueError) as erreur:
+        raise ErreurProtocole(f"coup invalide: {erreur}") from None
+    if not isinstance(mot, str) or not mot or not LETTRES_MOT.issuperset(mot):
+        raise ErreurProtocole(
+            "coup invalide: le mot ne doit contenir que des lettres de A à Z "
+            "(en minuscule pour un joker)"
+        )
+    return mot, (ligne, colonne), direction
+
+
+def _resultat(resultat: ResultatCoup) -> dict:
+    reponse = {
+        "valide": resultat.valide,
+        "joueur": resultat.joueur,
+        "points": resultat.points,
+        "terminee": resultat.terminee,
+        "refus": [refus.name for refus in resultat.refus],
+    }
+    if resultat.evaluation is not None and resultat.valide:
+        reponse["mots"] = list(resultat.evaluation.mots)
+    return reponse
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Lance le serveur de parties: un client par connexion TCP, un message JSON par
+    ligne.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--hote", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--lettres", default="resources/Lettres.txt")
+    parser.add_argument("--dico", default="resources/dico.txt")
+    parser.add_argument("--bonus", default="resources/bonus.txt")
+    parser.add_argument("-p", "--processus", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    async def lancer() -> None:
+        ressources = charger_ressources(args.lettres, args.dico, args.bonus)
+        with ServeurParties(*ressources, args.processus) as parties:
+            serveur = await parties.servir(args.hote, args.port)
+            async with serveur:
+                await serveur.serve_forever()
+
+    asyncio.run(lancer())
+
+
+if __name__ == "__main__":
+    main()
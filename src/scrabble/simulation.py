@@ -0,0 +1,259 @@
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Self
+
+from .bonus import Bareme
+from .generateur import CacheContraintes, Coup
+from .lexique import Lexique, charger_lexique
+from .main import retirer_chevalet
+from .moteur import MoteurPartie
+from .ordinateur import ScoreurCoups, classer_coups, meilleurs_coups
+from .pioche import Pioche
+from .plateau import Plateau, annuler_coup, appliquer_coup
+
+# Nombre de demi-coups joués par simulation, le coup candidat compris: le coup, la
+# réponse de l'adversaire puis notre coup suivant.
+PLIS = 3
+
+# Ressources chargées une seule fois par processus (voir initialiser).
+_ressources: tuple[Lexique, Bareme] | None = None
+
+
+def initialiser(dictionnaire: Lexique | str, bareme: Bareme) -> None:
+    """Charge le dictionnaire et le barème utilisés par les simulations du processus
+    courant. Appelée une fois au démarrage de chaque processus du simulateur.
+
+    Args:
+        dictionnaire (Lexique | str): Le lexique, ou le dictionnaire texte dont le
+            lexique compilé est projeté en mémoire (ses pages sont alors partagées
+            par tous les processus).
+        bareme (Bareme): Les points des lettres et les cases bonus.
+    """
+    global _ressources
+    if isinstance(dictionnaire, str):
+        dictionnaire = charger_lexique(dictionnaire)
+    _ressources = (dictionnaire, bareme)
+
+
+@dataclass(frozen=True)
+class Position:
+    """Ce que le joueur courant sait d'une partie: le plateau, son chevalet, les
+    lettres qu'il ne voit pas (celles du sac et des chevalets adverses, voir
+    Pioche.non_vues) et le nombre de lettres du chevalet de l'adversaire suivant.
+    """
+
+    plateau: Plateau
+    chevalet: str
+    non_vues: str
+    taille_adverse: int
+    tour: int
+
+    @classmethod
+    def depuis_moteur(cls, moteur: MoteurPartie) -> "Position":
+        etat = moteur.etat
+        adverses = [j.chevalet for j in etat.joueurs if j is not moteur.joueur_courant]
+        suivant = etat.joueurs[(etat.courant + 1) % len(etat.joueurs)]
+        non_vues = etat.pioche.non_vues(adverses)
+        return cls(
+            etat.plateau.copie(),
+            moteur.joueur_courant.chevalet,
+            "".join(lettre * n for lettre, n in non_vues.items()),
+            len(suivant.chevalet),
+            etat.tour,
+        )
+
+
+def simuler(
+    position: Position, coup: Coup, graines: range, plis: int = PLIS
+) -> list[int]:
+    """Joue des simulations d'un coup candidat et renvoie l'écart de points obtenu par
+    chacune.
+
+    Pour chaque graine, le chevalet de l'adversaire est tiré parmi les lettres non
+    vues, puis chaque joueur joue à son tour son meilleur coup (voir meilleurs_coups)
+    en complétant son chevalet avec les lettres restantes, jusqu'à plis demi-coups.
+    L'écart compte nos points moins ceux de l'adversaire. La fin de partie n'est pas
+    simulée.
+
+    Args:
+        position (Position): La position avant le coup candidat.
+        coup (Coup): Le coup candidat, légal dans cette position.
+        graines (range): Une graine par simulation.
+        plis (int): Le nombre de demi-coups joués, le coup candidat compris.
+
+    Returns:
+        list[int]: L'écart de points de chaque simulation.
+    """
+    lexique, bareme = _ressources
+    plateau = position.plateau.copie()
+    cache = CacheContraintes(plateau, lexique)
+    points, _ = ScoreurCoups(plateau, bareme).points(coup)
+    modifications = appliquer_coup(coup, plateau)
+    cache.mettre_a_jour((li, c) for li, c, _ in modifications)
+    posees = "".join(plateau[li][c] for li, c, _ in modifications)
+    reste = retirer_chevalet(position.chevalet, posees, "")
+    ecarts = []
+    for graine in graines:
+        pioche = Pioche.depuis_chaine(position.non_vues, graine)
+        chevalets = [reste, pioche.piocher(position.taille_adverse)]
+        chevalets[0] = pioche.completer(chevalets[0])
+        ecart, tour, joues = points, position.tour + 1, []
+        for pli in range(1, plis):
+            joueur = pli % 2
+            meilleurs = meilleurs_coups(
+                plateau, chevalets[joueur], lexique, tour, bareme, 1, cache
+            )
+            if not meilleurs:
+                continue
+            points_pli, reponse = meilleurs[0]
+            ecart += -points_pli if joueur else points_pli
+            if pli == plis - 1:
+                break
+            joues.append(appliquer_coup(reponse, plateau))
+            cache.mettre_a_jour((li, c) for li, c, _ in joues[-1])
+            posees = "".join(plateau[li][c] for li, c, _ in joues[-1])
+            chevalets[joueur] = pioche.completer(
+                retirer_chevalet(chevalets[joueur], posees, "")
+            )
+            tour += 1
+        for modifications_pli in reversed(joues):
+            annuler_coup(plateau, modifications_pli)
+            cache.mettre_a_jour((li, c) for li, c, _ in modifications_pli)
+        ecarts.append(ecart)
+    return ecarts
+
+
+@dataclass(frozen=True)
+class Simulation:
+    """Résultat d'un choix de coup par simulation.
+
+    coups contient, du meilleur au moins bon, l'écart moyen de chaque coup candidat
+    sur ses simulations, ses points immédiats et le coup.
+    """
+
+    coups: list[tuple[float, int, Coup]]
+    simulations: int
+    duree: float
+
+    @property
+    def simulations_par_seconde(self) -> float:
+        return self.simulations / self.duree if self.duree else 0.0
+
+
+class Simulateur:
+    """Choisit les coups en simulant la suite de la partie plutôt qu'en prenant le coup
+    qui rapporte le plus de points tout de suite.
+
+    Les simulations sont réparties sur un ProcessPoolExecutor gardé ouvert d'un coup à
+    l'autre. Chaque processus charge le dictionnaire une seule fois: passé comme
+    fichier texte, le lexique compilé est projeté en mémoire et partagé; passé comme
+    Lexique, il est copié une fois dans un segment de mémoire partagée auquel les
+    processus s'attachent (voir Lexique.partager). Avec processus=0, les simulations
+    sont jouées dans le processus courant.
+    """
+
+    def __init__(
+        self,
+        dictionnaire: Lexique | str,
+        bareme: Bareme,
+        processus: int | None = None,
+    ) -> None:
+        self.processus = processus if processus is not None else os.cpu_count() or 1
+        self._executeur: Executor | None = None
+        self._partage: Lexique | None = None
+        if self.processus:
+            if isinstance(dictionnaire, str):
+                # Compile le lexique au besoin avant de lancer les processus.
+                charger_lexique(dictionnaire).fermer()
+            else:
+                dictionnaire = self._partage = dictionnaire.partager()
+            self._executeur = ProcessPoolExecutor(
+                max_workers=self.processus,
+                initializer=initialiser,
+                initargs=(dictionnaire, bareme),
+            )
+        else:
+            initialiser(dictionnaire, bareme)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fermer()
+
+    def fermer(self) -> None:
+        if self._executeur is not None:
+            self._executeur.shutdown()
+            self._executeur = None
+        if self._partage is not None:
+            self._partage.fermer()
+            self._partage = None
+
+    def evaluer(
+        self,
+        moteur: MoteurPartie,
+        candidats: int = 10,
+        simulations: int = 20,
+        plis: int = PLIS,
+        graine: int = 0,
+    ) -> Simulation:
+        """Simule les meilleurs coups du joueur courant et les classe par écart moyen.
+
+        Tous les candidats sont simulés avec les mêmes graines, donc face aux mêmes
+        tirages: la comparaison entre deux coups n'est pas brouillée par la chance.
+
+        Args:
+            moteur (MoteurPartie): La partie en cours.
+            candidats (int): Le nombre de coups simulés, pris parmi ceux qui
+                rapportent le plus de points (voir classer_coups).
+            simulations (int): Le nombre de simulations de chaque coup.
+            plis (int): Le nombre de demi-coups de chaque simulation.
+            graine (int): La graine de la première simulation.
+
+        Returns:
+            Simulation: Les coups classés et le débit des simulations.
+        """
+        debut = time.perf_counter()
+        meilleurs = classer_coups(moteur, candidats)
+        position = Position.depuis_moteur(moteur)
+        graines = range(graine, graine + simulations)
+        paquet = max(
+            1, -(-simulations * len(meilleurs) // (max(1, self.processus) * 4))
+        )
+        paquets = [graines[i : i + paquet] for i in range(0, simulations, paquet)]
+        taches = [(coup, g) for _, coup in meilleurs for g in paquets]
+        if self._executeur is None:
+            ecarts = [simuler(position, coup, g, plis) for coup, g in taches]
+        else:
+            ecarts = list(
+                self._executeur.map(
+                    simuler,
+                    [position] * len(taches),
+                    [coup for coup, _ in taches],
+                    [g for _, g in taches],
+                    [plis] * len(taches),
+                )
+            )
+        totaux = {coup: [] for _, coup in meilleurs}
+        for (coup, _), resultat in zip(taches, ecarts, strict=True):
+            totaux[coup].extend(resultat)
+        coups = sorted(
+            (
+                (sum(totaux[coup]) / len(totaux[coup]), points, coup)
+                for points, coup in meilleurs
+            ),
+            key=lambda candidat: candidat[0],
+            reverse=True,
+        )
+        return Simulation(
+            coups, simulations * len(meilleurs), time.perf_counter() - debut
+        )
+
+    def choisir_coup(self, moteur: MoteurPartie, **options) -> Coup | None:
+        """Renvoie le coup dont l'écart moyen est le meilleur, ou None si le joueur
+        courant ne peut pas jouer. Les options sont celles de evaluer.
+        """
+        coups = self.evaluer(moteur, **options).coups
+        return coups[0][2] if coups else None
@@ -0,0 +1,184 @@
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+from .bonus import Bareme, Multiplicateurs
+from .lexique import Lexique, charger_lexique
+from .main import load_fichier_lettres
+from .moteur import MoteurPartie
+from .ordinateur import classer
+
+PHASES = ("generation", "choix", "jeu")
+
+# Ressources chargées une seule fois par processus (voir initialiser).
+_ressources: tuple | None = None
+
+
+def initialiser(
+    fichier_lettres: str, dictionnaire: Lexique | str, fichier_bonus: str
+) -> None:
+    """Charge le dictionnaire, les lettres et les cases bonus du processus courant.
+    Appelée une fois au démarrage de chaque processus du tournoi. Le dictionnaire est
+    un fichier texte ou un lexique déjà chargé, par exemple en mémoire partagée.
+    """
+    global _ressources
+    occurence, points = load_fichier_lettres(fichier_lettres)
+    bareme = Bareme(points, Multiplicateurs.depuis_fichier(fichier_bonus))
+    if isinstance(dictionnaire, str):
+        dictionnaire = charger_lexique(dictionnaire)
+    _ressources = (dictionnaire, occurence, bareme)
+
+
+def jouer_partie(numero: int, graine: int, nb_joueurs: int = 2) -> dict:
+    """Joue une partie entre ordinateurs et renvoie son résultat.
+
+    La pioche de la partie est tirée avec la graine graine + numero: une partie se
+    rejoue à l'identique quel que soit le processus qui la joue.
+
+    Args:
+        numero (int): Le numéro de la partie dans le tournoi.
+        graine (int): La graine du tournoi.
+        nb_joueurs (int): Le nombre de joueurs.
+
+    Returns:
+        dict: Le numéro et la graine de la partie, les scores, le nombre de coups
+            joués et la durée de chaque phase (en secondes).
+    """
+    debut = time.perf_counter()
+    dictionnaire, occurence, bareme = _ressources
+    noms = [f"ordi{i + 1}" for i in range(nb_joueurs)]
+    moteur = MoteurPartie(noms, dictionnaire, occurence, bareme, graine + numero)
+    durees = dict.fromkeys(PHASES, 0.0)
+    coups_joues = 0
+    while not moteur.etat.terminee:
+        t0 = time.perf_counter()
+        coups = moteur.coups_legaux()
+        t1 = time.perf_counter()
+        meilleurs = classer(moteur.etat.plateau, coups, bareme, 1)
+        t2 = time.perf_counter()
+        if meilleurs:
+            moteur.jouer(meilleurs[0][1])
+            coups_joues += 1
+        else:
+            moteur.passer()
+        t3 = time.perf_counter()
+        durees["generation"] += t1 - t0
+        durees["choix"] += t2 - t1
+        durees["jeu"] += t3 - t2
+    return {
+        "partie": numero,
+        "graine": graine + numero,
+        "scores": [points for _, points in moteur.scores()],
+        "coups": coups_joues,
+        "durees": durees,
+        "duree": time.perf_counter() - debut,
+    }
+
+
+def tournoi(
+    nb_parties: int,
+    processus: int | None = None,
+    graine: int = 0,
+    fichier_lettres: str = "resources/Lettres.txt",
+    fichier_dico: str = "resources/dico.txt",
+    fichier_bonus: str = "resources/bonus.txt",
+    memoire_partagee: bool = False,
+) -> Iterator[dict]:
+    """Joue nb_parties parties réparties sur un ProcessPoolExecutor et renvoie leurs
+    résultats au fur et à mesure, dans l'ordre des parties.
+
+    Chaque processus charge les ressources une seule fois (le lexique compilé est
+    ouvert avec mmap, si bien que sa mémoire est partagée) et les parties sont
+    distribuées par paquets pour limiter les échanges entre processus. Avec
+    memoire_partagee, le lexique est chargé une seule fois dans un segment de
+    mémoire partagée auquel les processus s'attachent (voir Lexique.partager).
+    """
+    processus = processus or os.cpu_count() or 1
+    # Compile le lexique au besoin avant de lancer les processus, pour qu'ils ne le
+    # compilent pas tous en même temps.
+    lexique = charger_lexique(fichier_dico)
+    dictionnaire: Lexique | str = fichier_dico
+    if memoire_partagee:
+        dictionnaire = lexique.partager()
+    lexique.fermer()
+    paquet = max(1, nb_parties // (processus * 8))
+    try:
+        with ProcessPoolExecutor(
+            max_workers=processus,
+            initializer=initialiser,
+            initargs=(fichier_lettres, dictionnaire, fichier_bonus),
+        ) as executeur:
+            yield from executeur.map(
+                jouer_partie,
+                range(nb_parties),
+                [graine] * nb_parties,
+                chunksize=paquet,
+            )
+    finally:
+        if isinstance(dictionnaire, Lexique):
+            dictionnaire.fermer()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Lance un tournoi entre ordinateurs depuis la ligne de commande. Les résultats
+    sont écrits en JSONL (un objet JSON par partie) et les statistiques de débit sur
+    la sortie d'erreur.
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("-n", "--parties", type=int, default=100)
+    parser.add_argument("-p", "--processus", type=int, default=None)
+    parser.add_argument("-g", "--graine", type=int, default=0)
+    parser.add_argument("-o", "--sortie", default="-", help="fichier JSONL ou -")
+    parser.add_argument("--lettres", default="resources/Lettres.txt")
+    parser.add_argument("--dico", default="resources/dico.txt")
+    parser.add_argument("--bonus", default="resources/bonus.txt")
+    parser.add_argument(
+        "--memoire-partagee",
+        action="store_true",
+        help="charger le lexique une seule fois en mémoire partagée",
+    )
+    args = parser.parse_args(argv)
+
+    debut = time.perf_counter()
+    parties = coups = 0
+    durees = dict.fromkeys(PHASES, 0.0)
+    with contextlib.ExitStack() as pile:
+        sortie = sys.stdout
+        if args.sortie != "-":
+            sortie = pile.enter_context(open(args.sortie, "w", encoding="utf-8"))
+        for resultat in tournoi(
+            args.parties,
+            args.processus,
+            args.graine,
+            args.lettres,
+            args.dico,
+            args.bonus,
+            args.memoire_partagee,
+        ):
+            sortie.write(json.dumps(resultat) + "\n")
+            sortie.flush()
+            parties += 1
+            coups += resultat["coups"]
+            for phase in PHASES:
+                durees[phase] += resultat["durees"][phase]
+    ecoule = time.perf_counter() - debut
+    total = sum(durees.values()) or 1.0
+    print(
+        f"{parties} parties, {coups} coups en {ecoule:.2f} s: "
+        f"{parties / ecoule:.1f} parties/s, {coups / ecoule:.1f} coups/s",
+        file=sys.stderr,
+    )
+    for phase in PHASES:
+        print(
+            f"  {phase}: {durees[phase]:.2f} s ({100 * durees[phase] / total:.0f} %)",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import pytest
+
+from src.scrabble.bonus import Bareme
+from src.scrabble.lexique import Lexique
+from src.scrabble.main import load_fichier_lettres
+from src.scrabble.moteur import MoteurPartie
+
+MOTS = ["DES", "SES", "MIS", "DE", "SI", "RE", "AN", "PI", "DENI", "RAPEE", "ES", "EN"]
+MOTS += ["LA", "LE", "TA", "TE", "ET", "IL", "UN", "NU", "OU", "AU", "EU", "TU", "AS"]
+MOTS += ["ON", "NE", "SA", "ME", "MA", "TON", "SON", "NIE", "RAT", "TAS", "NET", "LIT"]
+
+
+@pytest.fixture
+def mots():
+    """Le petit dictionnaire des parties de test."""
+    return list(MOTS)
+
+
+@pytest.fixture
+def lexique(mots):
+    return Lexique.depuis_mots(mots)
+
+
+@pytest.fixture
+def fichier_dico(tmp_path, mots):
+    """Le chemin d'un fichier dictionnaire qui contient les mots de test."""
+    chemin = tmp_path / "dico.txt"
+    chemin.write_text("\n".join(sorted(mots)) + "\n", encoding="utf-8")
+    return str(chemin)
+
+
+@pytest.fixture
+def lettres():
+    """L'occurence des lettres et le barème lus dans resources/Lettres.txt."""
+    occurence, points = load_fichier_lettres("resources/Lettres.txt")
+    return occurence, Bareme(points)
+
+
+@pytest.fixture
+def bareme(lettres):
+    return lettres[1]
+
+
+@pytest.fixture
+def nouvelle_partie(lexique, lettres):
+    """Fabrique une partie entre Ada et Bob sur le dictionnaire de test."""
+    occurence, bareme = lettres
+
+    def fabriquer(graine=None):
+        return MoteurPartie(["Ada", "Bob"], lexique, occurence, bareme, graine)
+
+    return fabriquer
@@ -0,0 +1,45 @@
+from src.scrabble.anagrammes import IndexAnagrammes, signature
+from src.scrabble.lexique import Lexique
+
+MOTS = ["DES", "MES", "SES", "DEMONS", "MONDE", "DEMON", "ON", "NE"]
+
+
+def test_signature():
+    assert signature("MONDE") == "DEMNO"
+
+
+def test_anagrammes():
+    index = IndexAnagrammes.depuis_mots(MOTS)
+    assert index.anagrammes("NOMED") == ["MONDE", "DEMON"]
+    assert index.anagrammes("XYZ") == []
+
+
+def test_sous_ensembles_sans_doublon():
+    index = IndexAnagrammes()
+    sous_ensembles = list(index.sous_ensembles("AAB"))
+    assert sorted(sous_ensembles) == ["A", "AA", "AAB", "AB", "B"]
+
+
+def test_mots_formables_avec_lettres_plateau():
+    index = IndexAnagrammes.depuis_mots(Lexique.depuis_mots(MOTS))
+    assert index.mots_formables("SEDXONM") == [
+        "DEMONS",
+        "DEMON",
+        "MONDE",
+        "DES",
+        "MES",
+        "NE",
+        "ON",
+    ]
+    assert index.mots_formables("SEDX", "MON") == ["DEMONS", "DEMON", "MONDE"]
+    assert index.mots_formables("SEDX", longueur_min=4) == []
+
+
+def test_jokers():
+    index = IndexAnagrammes.depuis_mots(MOTS)
+    assert index.anagrammes("NO?ED") == ["MONDE", "DEMON"]
+    assert index.anagrammes("??") == ["NE", "ON"]
+    assert index.mots_formables("SD") == []
+    assert index.mots_formables("S?D") == ["DES"]
+    assert index.mots_formables("?E", "MON") == ["DEMON", "MONDE"]
+    assert len(set(index.sous_ensembles("A?"))) == len(list(index.sous_ensembles("A?")))
@@ -0,0 +1,66 @@
+import pytest
+
+from src.scrabble.bonus import DISPOSITION_STANDARD, Bareme, Multiplicateurs
+from src.scrabble.lexique import Lexique
+from src.scrabble.main import (
+    evaluer_coup,
+    init_plateau,
+    load_fichier_lettres,
+    mot_sur_plateau,
+)
+
+MOTS = ["RAPEE", "PIE", "DE", "RD", "AE"]
+
+
+def test_disposition_standard():
+    multiplicateurs = Multiplicateurs()
+    assert (multiplicateurs.lignes, multiplicateurs.colonnes) == (15, 15)
+    assert multiplicateurs.case(7, 7) == (1, 2)
+    assert multiplicateurs.case(0, 0) == (1, 3)
+    assert multiplicateurs.case(1, 5) == (3, 1)
+    assert multiplicateurs.case(14, 11) == (2, 1)
+    for li in range(15):
+        for c in range(15):
+            assert multiplicateurs.case(li, c) == multiplicateurs.case(c, li)
+            assert multiplicateurs.case(li, c) == multiplicateurs.case(14 - li, c)
+
+
+def test_disposition_depuis_fichier():
+    multiplicateurs = Multiplicateurs.depuis_fichier("resources/bonus.txt")
+    standard = Multiplicateurs(DISPOSITION_STANDARD)
+    assert multiplicateurs.lettre == standard.lettre
+    assert multiplicateurs.mot == standard.mot
+
+
+def test_disposition_invalide():
+    with pytest.raises(ValueError):
+        Multiplicateurs(["..", "."])
+    with pytest.raises(ValueError):
+        Multiplicateurs(["..", ".x"])
+
+
+def test_les_bonus_ne_comptent_qu_une_fois():
+    _, points_lettres = load_fichier_lettres("resources/Lettres.txt")
+    bareme = Bareme(points_lettres)
+    dico = Lexique.depuis_mots(MOTS)
+    plateau = init_plateau((15, 15))
+    coup = ("RAPEE", (7, 5), "H")
+    evaluation = evaluer_coup(plateau, "RAPEEXZ", coup, dico, 1, (15, 15), bareme)
+    assert evaluation.points == (1 + 1 + 3 + 1 + 1) * 2
+    mot_sur_plateau(coup, plateau)
+    coup = ("PIE", (7, 7), "V")
+    evaluation = evaluer_coup(plateau, "IE", coup, dico, 2, (15, 15), bareme)
+    assert evaluation.points == 3 + 1 + 1
+
+
+def test_points_des_mots_perpendiculaires():
+    _, points_lettres = load_fichier_lettres("resources/Lettres.txt")
+    bareme = Bareme(points_lettres)
+    dico = Lexique.depuis_mots(MOTS)
+    plateau = init_plateau((15, 15))
+    mot_sur_plateau(("RAPEE", (7, 5), "H"), plateau)
+    evaluation = evaluer_coup(
+        plateau, "DE", ("DE", (8, 5), "H"), dico, 2, (15, 15), bareme
+    )
+    assert evaluation.mots == ("AE", "DE", "RD")
+    assert evaluation.points == (2 + 1 * 2) + (1 + 2) + (1 + 1 * 2)
@@ -0,0 +1,22 @@
+from src.scrabble.cache import CacheLRU
+
+
+def test_cache_lru():
+    cache = CacheLRU(2)
+    assert cache.obtenir("a") is None
+    cache.ranger("a", 1)
+    cache.ranger("b", 2)
+    assert cache.obtenir("a") == 1
+    cache.ranger("c", 3)
+    assert len(cache) == 2
+    assert "a" in cache and "b" not in cache
+    assert (cache.succes, cache.echecs) == (1, 1)
+    assert cache.taux_succes == 0.5
+    cache.vider()
+    assert len(cache) == 0 and cache.obtenir("a", 0) == 0
+
+
+def test_cache_desactive():
+    cache = CacheLRU(0)
+    cache.ranger("a", 1)
+    assert len(cache) == 0
@@ -0,0 +1,49 @@
+from src.scrabble.chevalet import (
+    ajouter,
+    contient,
+    empreinte,
+    reste,
+    retirer,
+    vers_chaine,
+    vers_compte,
+)
+from src.scrabble.main import init_plateau, retirer_chevalet, verif_lettre_joueur
+
+
+def test_conversion_chevalet():
+    compte = vers_compte("ZEBRE")
+    assert len(compte) == 27
+    assert compte[4] == 2
+    assert vers_chaine(compte) == "BEERZ"
+    assert vers_chaine(vers_compte("?ZeBRE")) == "BERZ??"
+
+
+def test_empreinte_chevalet():
+    assert empreinte(vers_compte("")) == 0
+    assert empreinte(vers_compte("ZEBRE")) == empreinte(vers_compte("REZEB"))
+    assert empreinte(vers_compte("ZEBRE")) != empreinte(vers_compte("ZEBRES"))
+    assert empreinte(vers_compte("ZEBRE")) != empreinte(vers_compte("ZEBRE"), 1)
+
+
+def test_operations_chevalet():
+    chevalet = vers_compte("SEDXAE")
+    assert contient(chevalet, vers_compte("DES"))
+    assert not contient(chevalet, vers_compte("DESS"))
+    assert vers_chaine(reste(chevalet, vers_compte("DESS"))) == "AEX"
+    assert vers_chaine(chevalet) == "ADEESX"
+    retirer(chevalet, vers_compte("EE"))
+    assert vers_chaine(chevalet) == "ADSX"
+    ajouter(chevalet, vers_compte("E"))
+    assert vers_chaine(chevalet) == "ADESX"
+
+
+def test_verif_lettre_joueur_avec_le_plateau():
+    plateau = init_plateau((3, 3))
+    plateau[1][1] = "O"
+    assert verif_lettre_joueur(plateau, "PRMNUT", ("MON", (1, 0), "H"))
+    assert not verif_lettre_joueur(plateau, "PRMNUT", ("MON", (0, 0), "H"))
+
+
+def test_retirer_chevalet_garde_l_ordre():
+    assert retirer_chevalet("AHDBJTE", "BAH", "B") == "DBJTE"
+    assert retirer_chevalet("EAEBE", "BEE", "") == "AE"
@@ -0,0 +1,76 @@
+import pytest
+
+from src.scrabble.finale import SolveurFinale, resoudre_finale
+from src.scrabble.generateur import generer_coups
+from src.scrabble.main import retirer_chevalet
+from src.scrabble.ordinateur import ScoreurCoups
+from src.scrabble.plateau import Plateau, annuler_coup, appliquer_coup
+
+
+def minimax(plateau, chevalets, lexique, bareme, passes=0, memo=None):
+    """Valeur exacte d'une fin de partie, sans élagage ni ordre des coups."""
+    memo = {} if memo is None else memo
+    cle = (tuple(plateau.ligne(li) for li in range(15)), chevalets, passes)
+    if cle in memo:
+        return memo[cle]
+    chevalet, adverse = chevalets
+    scoreur = ScoreurCoups(plateau, bareme)
+    meilleur = (
+        0
+        if passes == 3
+        else -minimax(plateau, (adverse, chevalet), lexique, bareme, passes + 1, memo)
+    )
+    tour = 1 if plateau.est_vide() else 2
+    for coup in generer_coups(plateau, chevalet, lexique, tour):
+        points, posees = scoreur.points(coup)
+        if not posees:
+            continue
+        modifications = appliquer_coup(coup, plateau)
+        lettres = "".join(plateau[li][c] for li, c, _ in modifications)
+        reste = retirer_chevalet(chevalet, lettres, "")
+        if reste:
+            points -= minimax(plateau, (adverse, reste), lexique, bareme, 0, memo)
+        annuler_coup(plateau, modifications)
+        meilleur = max(meilleur, points)
+    memo[cle] = meilleur
+    return meilleur
+
+
+# ("LUL", "AD") coupe la recherche d'un coup qui rapporte des points: la fenêtre de
+# l'adversaire doit en tenir compte.
+@pytest.mark.parametrize("chevalets", [("SI", "NE"), ("TE", "UA"), ("LUL", "AD")])
+def test_solution_exacte(chevalets, lexique, bareme):
+    plateau = Plateau((15, 15))
+    appliquer_coup(("RAPEE", (7, 5), "H"), plateau)
+    appliquer_coup(("NIE", (5, 7), "V"), plateau)
+    attendu = minimax(plateau.copie(), chevalets, lexique, bareme)
+    # Avec 2000 octets, la table ne garde que quelques entrées.
+    for memoire in (2000, 2**20):
+        solveur = SolveurFinale(lexique, bareme, memoire)
+        solution = solveur.resoudre(plateau, chevalets)
+        assert solution.exacte and solution.valeur == attendu
+        assert solution.entrees <= solveur.entrees_max
+    # Rejouer la suite de coups trouvée redonne sa valeur (elle peut manquer dans une
+    # petite table: seule celle de la plus grande est rejouée).
+    scoreur_plateau, valeur, signe = plateau.copie(), 0, 1
+    for coup in solution.coups:
+        if coup is not None:
+            valeur += signe * ScoreurCoups(scoreur_plateau, bareme).points(coup)[0]
+            appliquer_coup(coup, scoreur_plateau)
+        signe = -signe
+    assert valeur == attendu
+
+
+def test_resoudre_finale(nouvelle_partie):
+    moteur = nouvelle_partie()
+    with pytest.raises(ValueError):
+        resoudre_finale(moteur)
+    moteur.etat.pioche.piocher(len(moteur.etat.pioche))
+    moteur.etat.joueurs[0].chevalet = "DES"
+    moteur.etat.joueurs[1].chevalet = "XZ"
+    solution = resoudre_finale(moteur, delai=5)
+    attendu = minimax(
+        moteur.etat.plateau.copie(), ("DES", "XZ"), moteur.dictionnaire, moteur.bareme
+    )
+    assert solution.exacte and solution.valeur == attendu
+    assert moteur.legal(solution.coups[0])
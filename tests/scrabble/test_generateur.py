@@ -0,0 +1,164 @@
+from src.scrabble.generateur import (
+    FORME,
+    TOUTES,
+    CacheContraintes,
+    contraintes_ligne,
+    generer_coups,
+)
+from src.scrabble.lexique import Lexique
+from src.scrabble.main import init_plateau, mot_accepte, mot_sur_plateau
+
+MOTS = ["DES", "SES", "MIS", "DE", "SI", "RE", "AN", "PI", "DENI", "RAPEE", "ES", "EN"]
+
+
+def coups_acceptes(plateau, chevalet, dico, tour):
+    return {
+        (mot, (li, c), direc)
+        for mot in MOTS
+        for li in range(15)
+        for c in range(15)
+        for direc in "HV"
+        if mot_accepte(plateau, chevalet, (mot, (li, c), direc), dico, tour, (15, 15))
+    }
+
+
+def test_contraintes_ligne():
+    lexique = Lexique.depuis_mots(["MAS", "MES", "ME"])
+    contraintes = contraintes_ligne(["_", "M", "_", "S", "_", "_"], lexique)
+    assert contraintes[2] == FORME | 1 << 0 | 1 << 4
+    assert contraintes[4] == FORME
+    assert contraintes[5] == TOUTES
+
+
+def test_contraintes_ligne_ignore_les_bords():
+    lexique = Lexique.depuis_mots(["ME"])
+    contraintes = contraintes_ligne(["_", "M", "E", "_"], lexique)
+    assert contraintes[0] == TOUTES | FORME
+    assert contraintes[3] == TOUTES | FORME
+    assert contraintes_ligne(["_", "X", "E", "_"], lexique)[0] == FORME
+
+
+def test_generer_coups_premier_tour():
+    lexique = Lexique.depuis_mots(MOTS)
+    plateau = init_plateau((15, 15))
+    coups = generer_coups(plateau, "DESXZ", lexique, 1)
+    assert set(coups) == coups_acceptes(plateau, "DESXZ", lexique, 1)
+
+
+def test_generer_coups_identique_a_mot_accepte():
+    lexique = Lexique.depuis_mots(MOTS)
+    plateau = init_plateau((15, 15))
+    mot_sur_plateau(("RAPEE", (7, 7), "H"), plateau)
+    mot_sur_plateau(("DENI", (7, 10), "V"), plateau)
+    mot_sur_plateau(("SES", (0, 3), "H"), plateau)
+    mot_sur_plateau(("MIS", (12, 14), "V"), plateau)
+    cache = CacheContraintes(plateau, lexique)
+    for chevalet in ["DESNIPA", "SIMRE"]:
+        coups = generer_coups(plateau, chevalet, lexique, 2, cache)
+        assert len(coups) == len(set(coups))
+        assert set(coups) == coups_acceptes(plateau, chevalet, lexique, 2)
+
+
+def test_cache_contraintes_mis_a_jour_par_mot_sur_plateau():
+    lexique = Lexique.depuis_mots(MOTS)
+    plateau = init_plateau((15, 15))
+    cache = CacheContraintes(plateau, lexique)
+    for coup in [
+        ("RAPEE", (7, 7), "H"),
+        ("DENI", (7, 10), "V"),
+        ("PI", (6, 9), "V"),
+        ("SES", (14, 0), "H"),
+    ]:
+        mot_sur_plateau(coup, plateau, cache)
+        complet = CacheContraintes(plateau, lexique)
+        assert cache.masques == complet.masques
+        assert cache.ancres == complet.ancres
+
+
+def test_cache_contraintes_accepte_comme_mot_accepte():
+    lexique = Lexique.depuis_mots(MOTS)
+    plateau = init_plateau((15, 15))
+    mot_sur_plateau(("RAPEE", (7, 7), "H"), plateau)
+    mot_sur_plateau(("DENI", (7, 10), "V"), plateau)
+    cache = CacheContraintes(plateau, lexique)
+    for mot in MOTS + ["XYZ"]:
+        for li in range(4, 12):
+            for c in range(4, 15):
+                for direc in "HV":
+                    coup = (mot, (li, c), direc)
+                    attendu = mot_accepte(
+                        plateau, "DESNIPA", coup, lexique, 2, (15, 15)
+                    )
+                    assert cache.accepte(coup, "DESNIPA", 2) == attendu
+
+
+def test_generer_coups_avec_jokers():
+    lexique = Lexique.depuis_mots(MOTS)
+    plateau = init_plateau((15, 15))
+    mot_sur_plateau(("RApEE", (7, 7), "H"), plateau)
+    mot_sur_plateau(("DENI", (7, 10), "V"), plateau)
+    cache = CacheContraintes(plateau, lexique)
+    chevalet = "S?I?"
+    attendus = set()
+    for mot in MOTS:
+        for masque in range(1 << len(mot)):
+            ecrit = "".join(
+                lettre.lower() if masque >> i & 1 else lettre
+                for i, lettre in enumerate(mot)
+            )
+            for li in range(15):
+                for c in range(15):
+                    for direc in "HV":
+                        coup = (ecrit, (li, c), direc)
+                        if not mot_accepte(
+                            plateau, chevalet, coup, lexique, 2, (15, 15)
+                        ):
+                            continue
+                        assert cache.accepte(coup, chevalet, 2)
+                        # Les lettres déjà sur le plateau sont émises en majuscule.
+                        cases = [
+                            (li, c + i) if direc == "H" else (li + i, c)
+                            for i in range(len(mot))
+                        ]
+                        attendus.add(
+                            (
+                                "".join(
+                                    lettre.upper() if plateau[x][y] != "_" else lettre
+                                    for lettre, (x, y) in zip(ecrit, cases)
+                                ),
+                                (li, c),
+                                direc,
+                            )
+                        )
+    coups = generer_coups(plateau, chevalet, lexique, 2, cache)
+    assert len(coups) == len(set(coups))
+    assert set(coups) == attendus
+    assert any(mot.islower() for mot, _, _ in coups)
+
+
+def test_generer_coups_sans_jokers_inutiles():
+    lexique = Lexique.depuis_mots(MOTS)
+    plateau = init_plateau((15, 15))
+    mot_sur_plateau(("RApEE", (7, 7), "H"), plateau)
+    cache = CacheContraintes(plateau, lexique)
+    chevalet = "SE?I?"
+
+    def joker_inutile(coup):
+        mot, (li, c), direc = coup
+        reste = list(chevalet)
+        jokers = []
+        for i, lettre in enumerate(mot):
+            x, y = (li, c + i) if direc == "H" else (li + i, c)
+            if plateau[x][y] != "_":
+                continue
+            if lettre.islower():
+                reste.remove("?")
+                jokers.append(lettre.upper())
+            else:
+                reste.remove(lettre)
+        return any(lettre in reste for lettre in jokers)
+
+    tous = generer_coups(plateau, chevalet, lexique, 2, cache)
+    utiles = generer_coups(plateau, chevalet, lexique, 2, cache, jokers_utiles=True)
+    inutiles = [coup for coup in tous if joker_inutile(coup)]
+    assert inutiles and set(utiles) == set(tous) - set(inutiles)
@@ -0,0 +1,155 @@
+import pickle
+
+import pytest
+
+from src.scrabble.lexique import (
+    Gaddag,
+    Lexique,
+    LexiqueInvalide,
+    charger_lexique,
+    compiler_lexique,
+    est_a_jour,
+)
+from src.scrabble.main import list_dico, verif_mot
+
+MOTS = ["MON", "MONDE", "MONTER", "MER", "MERE", "DES", "SES", "MANGER", "RANGER"]
+
+
+def test_lexique_appartenance():
+    lexique = Lexique.depuis_mots(MOTS)
+    assert "MONDE" in lexique
+    assert "MOND" not in lexique
+    assert "MONDES" not in lexique
+    assert "" not in lexique
+    assert len(lexique) == len(MOTS)
+    assert list(lexique) == sorted(MOTS)
+
+
+def test_lexique_ignore_mots_invalides():
+    lexique = Lexique.depuis_mots(["MON", "", "ÉTÉ", "mon"])
+    assert list(lexique) == ["MON"]
+
+
+def test_lexique_prefixes():
+    lexique = Lexique.depuis_mots(MOTS)
+    assert lexique.est_prefixe("MON")
+    assert not lexique.est_prefixe("MOX")
+    assert list(lexique.commencant_par("MON")) == ["MON", "MONDE", "MONTER"]
+    assert list(lexique.prolongements("MON")) == ["DE", "TER"]
+    assert list(lexique.commencant_par("X")) == []
+
+
+def test_verifier_lot():
+    lexique = Lexique.depuis_mots(["MON", "MONDE", "MONTER", "SI"])
+    mots = ["MONTER", "MONT", "MON", "", "SI", "MONDES", "MO1", "MONTER"]
+    assert lexique.verifier_lot(mots) == [mot in lexique for mot in mots]
+    assert lexique.verifier_lot(iter(["SI", "MON"])) == [True, True]
+
+
+def test_gaddag_suffixes_et_fragments():
+    gaddag = Gaddag.depuis_mots(MOTS)
+    assert sorted(gaddag.finissant_par("GER")) == ["MANGER", "RANGER"]
+    assert sorted(gaddag.finissant_par("ES")) == ["DES", "SES"]
+    assert sorted(gaddag.contenant("ON")) == ["MON", "MONDE", "MONTER"]
+    assert sorted(Lexique.depuis_mots(MOTS).gaddag.contenant("ANGE")) == [
+        "MANGER",
+        "RANGER",
+    ]
+
+
+def test_lexique_identique_a_list_dico(tmp_path):
+    fichier = tmp_path / "dico.txt"
+    fichier.write_text("\n".join(MOTS) + "\n", encoding="utf-8")
+    dico = list_dico(fichier)
+    lexique = Lexique.depuis_fichier(fichier)
+    for mot in MOTS + ["MO", "MONDES", "RANGE", "Z"]:
+        assert verif_mot(mot, lexique) == verif_mot(mot, dico)
+
+
+def test_lexique_compile_et_projete(tmp_path):
+    source = tmp_path / "dico.txt"
+    source.write_text("\n".join(MOTS) + "\n", encoding="utf-8")
+    destination = tmp_path / "dico.lex"
+    compiler_lexique(source, destination)
+    lexique = Lexique.ouvrir(destination)
+    assert list(lexique) == sorted(MOTS)
+    assert "MONDE" in lexique
+    lexique.fermer()
+
+
+def test_charger_lexique_recompile_si_source_modifiee(tmp_path):
+    source = tmp_path / "dico.txt"
+    source.write_text("MON\n", encoding="utf-8")
+    assert list(charger_lexique(source)) == ["MON"]
+    assert est_a_jour(source, tmp_path / "dico.lex")
+    source.write_text("MON\nMONDE\n", encoding="utf-8")
+    assert not est_a_jour(source, tmp_path / "dico.lex")
+    assert list(charger_lexique(source)) == ["MON", "MONDE"]
+
+
+def test_lexique_corrompu_detecte(tmp_path):
+    source = tmp_path / "dico.txt"
+    source.write_text("MON\nMONDE\n", encoding="utf-8")
+    destination = tmp_path / "dico.lex"
+    compiler_lexique(source, destination)
+    contenu = bytearray(destination.read_bytes())
+    contenu[-1] ^= 1
+    destination.write_bytes(bytes(contenu))
+    with pytest.raises(LexiqueInvalide):
+        Lexique.ouvrir(destination)
+    assert list(charger_lexique(source, destination)) == ["MON", "MONDE"]
+
+
+def test_selon_motif():
+    lexique = Lexique.depuis_mots(["BAR", "BARRE", "BEURRE", "BOIRE", "CASSE", "MASSE"])
+    assert list(lexique.selon_motif("?a??e")) == ["BARRE", "CASSE", "MASSE"]
+    assert list(lexique.selon_motif("_A_SE")) == ["CASSE", "MASSE"]
+    assert list(lexique.selon_motif("B*E")) == ["BARRE", "BEURRE", "BOIRE"]
+    assert list(lexique.selon_motif("*", longueur_min=5, longueur_max=5)) == [
+        "BARRE",
+        "BOIRE",
+        "CASSE",
+        "MASSE",
+    ]
+    assert list(lexique.selon_motif("B*", chevalet="ARE")) == ["BAR"]
+    assert list(lexique.selon_motif("B*", chevalet="ARE?")) == ["BAR", "BARRE"]
+    assert list(lexique.selon_motif("M*", chevalet="")) == []
+    with pytest.raises(ValueError):
+        list(lexique.selon_motif("B.R"))
+
+
+def noeuds_lus(lexique, motif, **options):
+    """Renvoie les mots du motif et le nombre de noeuds dont les arêtes ont été lues."""
+    lus = []
+    aretes = lexique.aretes
+    lexique.aretes = lambda noeud: lus.append(noeud) or aretes(noeud)
+    try:
+        return list(lexique.selon_motif(motif, **options)), len(lus)
+    finally:
+        del lexique.aretes
+
+
+def test_selon_motif_elague_les_branches_sans_la_fin():
+    mots = ["BAR", "BOIRE"] + [f"B{a}{b}ES" for a in "CDFGHJKLMN" for b in "AEIOU"]
+    lexique = Lexique.depuis_mots(mots)
+    # Une fois les noeuds résumés, seules les arêtes de B et de BA sont lues: les mots
+    # en BC... à BN ne peuvent pas finir par R ni avoir trois lettres.
+    for motif, options in (("B*R", {}), ("B*", {"longueur_max": 3})):
+        noeuds_lus(lexique, motif, **options)
+        assert noeuds_lus(lexique, motif, **options) == (["BAR"], 2)
+
+
+def test_lexique_en_memoire_partagee():
+    partage = Lexique.depuis_mots(["MON", "MONDE", "SI"]).partager()
+    nom = partage.nom_memoire
+    copie = pickle.loads(pickle.dumps(partage))
+    assert copie.nom_memoire == nom
+    assert list(copie) == ["MON", "MONDE", "SI"]
+    assert copie.verifier_lot(["MONDE", "MONT"]) == [True, False]
+    with pytest.raises(TypeError):
+        copie._aretes[2] = 0
+    copie.fermer()
+    assert "SI" in partage
+    partage.fermer()
+    with pytest.raises(FileNotFoundError):
+        Lexique.attacher(nom)
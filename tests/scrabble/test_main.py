@@ -1,16 +1,27 @@
-from pytest import MonkeyPatch
+from pytest import CaptureFixture, MonkeyPatch
 
 from src.scrabble.main import (
+    Refus,
+    affichage_plateau,
+    evaluer_coup,
     get_direction,
     get_mot,
     get_position,
     init_pioche,
     init_plateau,
     load_fichier_lettres,
+    mot_accepte,
+    mot_sur_plateau,
+    placer_jokers,
+    placer_mot,
     propose_mot,
+    retirer_chevalet,
     verif_bornes,
+    verif_lettre_joueur,
+    verif_mots,
     verif_premier_tour,
 )
+from src.scrabble.plateau import Plateau
 
 
 def test_load_fichier_lettres():
@@ -42,6 +53,7 @@ def test_load_fichier_lettres():
         "X": 1,
         "Y": 1,
         "Z": 1,
+        "?": 2,
     }
     expected_points = {
         "A": 1,
@@ -70,6 +82,7 @@ def test_load_fichier_lettres():
         "X": 10,
         "Y": 10,
         "Z": 10,
+        "?": 0,
     }
 
     occurence, points = load_fichier_lettres(file_name)
@@ -176,3 +189,120 @@ def test_verif_premier_tour_horizontally():
 def test_verif_premier_tour_fails():
     coup = ("BONJOUR", (5, 5), "H")
     assert verif_premier_tour(coup) is False
+
+
+DICO = [set(), {"DE", "RE", "PI", "AE"}, {"DES", "PIE"}, {"DENI"}, {"RAPEE"}]
+POINTS = {lettre: 1 for lettre in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"} | {"D": 2, "P": 3}
+
+
+def test_verif_mots():
+    dico = [{"A"}, {"DE", "SI"}, {"DES", "MIS", "SES"}]
+    assert verif_mots(["DES", "si", "DES"], dico) == [True, True, True]
+    assert verif_mots(["DES", "XYZ", "", "DESSINE"], dico) == [
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert verif_mots([], dico) == []
+
+
+def test_evaluer_coup_premier_tour():
+    evaluation = evaluer_coup(
+        init_plateau((15, 15)),
+        "RAPEEXS",
+        ("RAPEE", (7, 5), "H"),
+        DICO,
+        1,
+        (15, 15),
+        POINTS,
+    )
+    assert evaluation.valide
+    assert evaluation.refus == ()
+    assert evaluation.mots == ("RAPEE",)
+    assert evaluation.lettres_posees == "RAPEE"
+    assert evaluation.nouvelles_cases == ((7, 5), (7, 6), (7, 7), (7, 8), (7, 9))
+    assert evaluation.points == 7
+    assert not evaluation.scrabble
+
+
+def test_evaluer_coup_lit_les_mots_perpendiculaires():
+    plateau = init_plateau((15, 15))
+    mot_sur_plateau(("RAPEE", (7, 7), "H"), plateau)
+    evaluation = evaluer_coup(
+        plateau, "IEX", ("PIE", (7, 9), "V"), DICO, 2, (15, 15), POINTS
+    )
+    assert evaluation.valide
+    assert evaluation.mots == ("PIE",)
+    assert evaluation.lettres_plateau == "P"
+    assert evaluation.lettres_posees == "IE"
+    assert evaluation.points == 5
+    evaluation = evaluer_coup(plateau, "DENI", ("DENI", (8, 7), "H"), DICO, 2, (15, 15))
+    assert evaluation.refus == (Refus.PERPENDICULAIRE,)
+    evaluation = evaluer_coup(plateau, "DE", ("DE", (1, 1), "H"), DICO, 2, (15, 15))
+    assert evaluation.refus == (Refus.ISOLE,)
+    evaluation = evaluer_coup(
+        plateau, "DENI", ("DENI", (12, 1), "V"), DICO, 2, (15, 15)
+    )
+    assert evaluation.refus == (Refus.BORNES,)
+    assert plateau[8] == ["_"] * 15
+
+
+def test_evaluer_coup_avec_jokers():
+    plateau = init_plateau((15, 15))
+    mot_sur_plateau(("RApEE", (7, 7), "H"), plateau)
+    assert plateau[7][9] == "p"
+    coup = placer_jokers(("PIE", (7, 9), "V"), plateau, "?EX")
+    assert coup == ("PiE", (7, 9), "V")
+    evaluation = evaluer_coup(plateau, "?EX", coup, DICO, 2, (15, 15), POINTS)
+    assert evaluation.valide
+    assert evaluation.mots == ("piE",)
+    assert evaluation.lettres_posees == "iE"
+    assert evaluation.points == 1
+    assert not evaluer_coup(plateau, "IEX", coup, DICO, 2, (15, 15)).valide
+    mot_sur_plateau(coup, plateau)
+    assert [plateau[li][9] for li in range(7, 10)] == ["p", "i", "E"]
+
+
+def test_retirer_chevalet_avec_joker_sur_le_plateau():
+    # Le P de RAPEE a été posé avec un joker: le mot qui le reprend ne prend ni P ni
+    # joker au chevalet, qu'il l'écrive en majuscule ou en minuscule.
+    for mot in ("PIE", "piE", "pIE"):
+        plateau = init_plateau((15, 15))
+        mot_sur_plateau(("RApEE", (7, 7), "H"), plateau)
+        lettres_plateau = placer_mot((mot, (7, 9), "V"), plateau)
+        assert lettres_plateau == "p"
+        reste = retirer_chevalet("P?IE", mot, lettres_plateau)
+        assert reste == ("P?" if mot[1] == "I" else "PI")
+    assert retirer_chevalet("AHDBJTE", "BAH", "B") == "DBJTE"
+
+
+def test_symboles_inconnus_refuses():
+    plateau = init_plateau((15, 15))
+    for mot in ("ÉTÉ", "A1"):
+        coup = placer_jokers((mot, (7, 7), "H"), plateau, "ETA?")
+        evaluation = evaluer_coup(plateau, "ETA?", coup, DICO, 1, (15, 15))
+        assert Refus.LETTRES in evaluation.refus
+        assert Refus.MOT_INCONNU in evaluation.refus
+        assert not verif_lettre_joueur(plateau, "ETA?", coup)
+        assert not mot_accepte(plateau, "ETA?", coup, DICO, 1, (15, 15))
+
+
+def test_mot_accepte_affiche_les_refus(capsys: CaptureFixture[str]):
+    coup = ("DES", (0, 0), "H")
+    assert not mot_accepte(init_plateau((15, 15)), "DEX", coup, DICO, 1, (15, 15))
+    assert capsys.readouterr().out.splitlines() == [
+        Refus.LETTRES.value,
+        Refus.PREMIER_TOUR.value,
+    ]
+
+
+def test_affichage_plateau_identique_pour_un_plateau(capsys: CaptureFixture[str]):
+    listes = init_plateau((15, 15))
+    mot_sur_plateau(("DeS", (7, 7), "H"), listes)
+    affichage_plateau(listes)
+    attendu = capsys.readouterr().out
+    affichage_plateau(Plateau.depuis_listes(listes))
+    sortie = capsys.readouterr().out
+    assert sortie == attendu
+    assert "7  ['_', '_', '_', '_', '_', '_', '_', 'D', 'e', 'S'," in sortie
@@ -0,0 +1,123 @@
+import pytest
+
+from src.scrabble.main import Refus
+from src.scrabble.moteur import ChargementRessources, MoteurPartie
+
+
+def jouer_partie(moteur):
+    while not moteur.etat.terminee:
+        coups = moteur.coups_legaux()
+        if coups:
+            meilleur = max(coups, key=lambda coup: moteur.evaluer(coup).points)
+            assert moteur.jouer(meilleur).valide
+        else:
+            moteur.passer()
+    return moteur.scores()
+
+
+def test_partie_sans_entree_ni_sortie(nouvelle_partie, capsys):
+    moteur = nouvelle_partie(3)
+    assert all(len(joueur.chevalet) == 7 for joueur in moteur.etat.joueurs)
+    scores = jouer_partie(moteur)
+    assert capsys.readouterr().out == ""
+    assert [nom for nom, _ in scores] == ["Ada", "Bob"]
+    assert sum(points for _, points in scores) > 0
+    assert moteur.coups_legaux() == []
+
+
+def test_partie_reproductible(nouvelle_partie):
+    assert jouer_partie(nouvelle_partie(11)) == jouer_partie(nouvelle_partie(11))
+
+
+def test_coup_refuse_ne_change_rien(nouvelle_partie):
+    moteur = nouvelle_partie(0)
+    chevalet = moteur.joueur_courant.chevalet
+    resultat = moteur.jouer(("DENI", (0, 0), "H"))
+    assert not resultat.valide
+    assert Refus.PREMIER_TOUR in resultat.refus
+    assert moteur.etat.courant == 0
+    assert moteur.joueur_courant.chevalet == chevalet
+    assert moteur.etat.plateau.est_vide()
+
+
+def test_coup_joue(nouvelle_partie):
+    moteur = nouvelle_partie(0)
+    moteur.etat.joueurs[0].chevalet = "DESXZWK"
+    assert moteur.legal(("DES", (7, 7), "H"))
+    resultat = moteur.jouer(("DES", (7, 7), "H"))
+    assert resultat.valide
+    assert resultat.points == (2 + 1 + 1) * 2
+    assert len(resultat.tirage) == 3
+    assert moteur.etat.joueurs[0].chevalet == "XZWK" + resultat.tirage
+    assert moteur.etat.tour == 2
+    assert moteur.etat.courant == 1
+    assert moteur.scores() == [("Ada", 8), ("Bob", 0)]
+
+
+def test_echanger_et_passer(nouvelle_partie):
+    moteur = nouvelle_partie(0)
+    chevalet = moteur.joueur_courant.chevalet
+    resultat = moteur.echanger(chevalet[:3])
+    assert resultat.valide
+    assert moteur.etat.joueurs[0].chevalet == chevalet[3:] + resultat.tirage
+    assert not moteur.echanger(chevalet[3:] + "@").valide
+    for _ in range(2):
+        assert not moteur.passer().terminee
+    assert moteur.passer().terminee
+    assert not moteur.passer().valide
+
+
+def test_empreinte_position(nouvelle_partie):
+    moteur = nouvelle_partie(0)
+    moteur.etat.joueurs[0].chevalet = "DESXZWK"
+    depart = moteur.empreinte()
+    moteur.etat.joueurs[0].chevalet = "KWZXSED"
+    assert moteur.empreinte() == depart
+    moteur.jouer(("DES", (7, 7), "H"))
+    assert moteur.empreinte() != depart
+    apres_coup = moteur.empreinte()
+    moteur.passer()
+    assert moteur.empreinte() != apres_coup
+    moteur.passer()
+    assert moteur.empreinte() == apres_coup
+
+
+def test_evaluations_gardees(nouvelle_partie):
+    moteur = nouvelle_partie(0)
+    moteur.etat.joueurs[0].chevalet = "DESXZWK"
+    refuse = ("DENI", (0, 0), "H")
+    assert moteur.evaluer(refuse) is moteur.evaluer(refuse)
+    assert (moteur.evaluations.succes, moteur.evaluations.echecs) == (1, 1)
+    moteur.etat.joueurs[0].chevalet = "KWZXSED"
+    assert not moteur.jouer(refuse).valide
+    assert moteur.evaluations.succes == 2
+    assert moteur.jouer(("DES", (7, 7), "H")).valide
+    assert len(moteur.evaluations) == 0
+    echecs = moteur.evaluations.echecs
+    moteur.evaluer(("DES", (7, 7), "H"))
+    assert moteur.evaluations.echecs == echecs + 1
+
+
+def test_coup_avec_joker(nouvelle_partie):
+    moteur = nouvelle_partie(0)
+    moteur.etat.joueurs[0].chevalet = "D?SXZWK"
+    assert not moteur.legal(("DES", (7, 7), "H"))
+    resultat = moteur.jouer(("DeS", (7, 7), "H"))
+    assert resultat.valide
+    assert resultat.points == (2 + 0 + 1) * 2
+    assert moteur.etat.joueurs[0].chevalet == "XZWK" + resultat.tirage
+    assert moteur.etat.plateau[7][8] == "e"
+
+
+def test_chargement_en_arriere_plan(nouvelle_partie, mots, fichier_dico, tmp_path):
+    chargement = ChargementRessources(fichier_dico=fichier_dico)
+    moteur = MoteurPartie.depuis_chargement(["Ada", "Bob"], chargement, 3)
+    assert chargement.termine
+    assert chargement.duree is not None and chargement.attente >= 0
+    assert list(moteur.dictionnaire) == sorted(mots)
+    assert (
+        moteur.etat.joueurs[0].chevalet == nouvelle_partie(3).etat.joueurs[0].chevalet
+    )
+    manquant = ChargementRessources(fichier_dico=str(tmp_path / "absent.txt"))
+    with pytest.raises(FileNotFoundError):
+        manquant.ressources()
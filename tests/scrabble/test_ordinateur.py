@@ -0,0 +1,59 @@
+from src.scrabble.main import multijoueur
+from src.scrabble.ordinateur import (
+    ScoreurCoups,
+    chercher_coups,
+    choisir_coup,
+    classer_coups,
+)
+
+
+def test_scoreur_identique_a_evaluer_coup(nouvelle_partie):
+    for graine in range(3):
+        moteur = nouvelle_partie(graine)
+        while not moteur.etat.terminee:
+            coups = moteur.coups_legaux()
+            scoreur = ScoreurCoups(moteur.etat.plateau, moteur.bareme)
+            for coup in coups:
+                assert scoreur.points(coup)[0] == moteur.evaluer(coup).points
+            coup = choisir_coup(moteur)
+            if coup is None:
+                moteur.passer()
+            else:
+                moteur.jouer(coup)
+
+
+def test_classer_coups(nouvelle_partie):
+    moteur = nouvelle_partie(0)
+    moteur.etat.joueurs[0].chevalet = "RAPEESD"
+    meilleurs = classer_coups(moteur, 5)
+    assert len(meilleurs) == 5
+    assert [points for points, _ in meilleurs] == sorted(
+        (points for points, _ in meilleurs), reverse=True
+    )
+    points, coup = meilleurs[0]
+    assert coup[0] == "RAPEE"
+    assert points == max(moteur.evaluer(c).points for c in moteur.coups_legaux())
+    moteur.etat.joueurs[0].chevalet = "XXXXXXX"
+    assert choisir_coup(moteur) is None
+
+
+def test_recherche_bornee(nouvelle_partie):
+    moteur = nouvelle_partie(1)
+    for _ in range(4):
+        moteur.jouer(choisir_coup(moteur))
+    complete = chercher_coups(moteur, 60, 5)
+    assert complete.complete and complete.couverture == 1
+    meilleurs = classer_coups(moteur, 5)
+    assert [points for points, _ in complete.coups] == [p for p, _ in meilleurs]
+    assert complete.coups_evalues >= len(moteur.coups_legaux())
+    partielle = chercher_coups(moteur, 0, 5)
+    assert partielle.departs_explores == 1 < partielle.departs_total
+    assert 0 < partielle.couverture < 1 and not partielle.complete
+    assert all(coup in moteur.coups_legaux() for _, coup in partielle.coups)
+    assert moteur.legal(choisir_coup(moteur, 0.01))
+
+
+def test_multijoueur_avec_ordinateur(monkeypatch):
+    reponses = ["x", "2", "Ada", "peut-etre", "n", "Bob", "O"]
+    monkeypatch.setattr("builtins.input", lambda _: reponses.pop(0))
+    assert multijoueur() == [["Ada", "", 0, False], ["Bob", "", 0, True]]
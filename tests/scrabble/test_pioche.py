@@ -0,0 +1,48 @@
+from collections import Counter
+
+import pytest
+
+from src.scrabble.main import init_pioche, jeton_joueur, load_fichier_lettres
+from src.scrabble.pioche import Pioche
+
+
+def test_pioche_reproductible():
+    occurence, _ = load_fichier_lettres("resources/Lettres.txt")
+    tirages = [Pioche(occurence, graine=42).piocher(20) for _ in range(2)]
+    assert tirages[0] == tirages[1]
+    assert Pioche(occurence, graine=1).piocher(20) != tirages[0]
+
+
+def test_pioche_compte_les_jetons():
+    occurence, _ = load_fichier_lettres("resources/Lettres.txt")
+    pioche = Pioche(occurence, graine=0)
+    assert len(pioche) == sum(occurence.values())
+    assert str(pioche) == init_pioche(occurence)
+    tirage = pioche.piocher(30)
+    assert len(pioche) == sum(occurence.values()) - 30
+    assert Counter(str(pioche)) + Counter(tirage) == Counter(occurence)
+    for lettre, n in occurence.items():
+        assert pioche.restantes(lettre) == n - tirage.count(lettre)
+    tout = pioche.piocher(1000)
+    assert len(tout) == sum(occurence.values()) - 30
+    assert len(pioche) == 0
+    assert pioche.piocher(3) == ""
+
+
+def test_pioche_echange_et_non_vues():
+    pioche = Pioche({"A": 3, "B": 2}, graine=7)
+    tirage = pioche.echanger("ZZ")
+    assert len(tirage) == 2
+    assert Counter(str(pioche)) == Counter({"A": 3, "B": 2, "Z": 2}) - Counter(tirage)
+    assert pioche.non_vues(["QA"]) == dict(Counter(str(pioche)) + Counter("QA"))
+    with pytest.raises(ValueError):
+        pioche.echanger("ABCDEFG")
+
+
+def test_jeton_joueur_avec_une_pioche():
+    pioche = Pioche.depuis_chaine("AAAAABBBBBCCCCCDDDDDEEEEE", graine=5)
+    pioche_jeu, main_joueur = jeton_joueur(pioche, "AKDH")
+    assert pioche_jeu is pioche
+    assert main_joueur.startswith("AKDH")
+    assert len(main_joueur) == 7
+    assert len(pioche) == 22
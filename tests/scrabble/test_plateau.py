@@ -0,0 +1,147 @@
+import pickle
+from copy import deepcopy
+
+import pytest
+
+from src.scrabble.generateur import CacheContraintes, generer_coups
+from src.scrabble.lexique import Lexique
+from src.scrabble.main import (
+    init_plateau,
+    localisation_lettre_sur_plateau,
+    mot_sur_plateau,
+    mots_perpendiculaires,
+    placer_mot,
+    verif_emplacement,
+)
+from src.scrabble.plateau import Plateau, annuler_coup, appliquer_coup
+
+
+def test_plateau_vide():
+    plateau = Plateau((3, 4))
+    assert plateau.est_vide()
+    assert plateau == init_plateau((3, 4))
+    assert plateau[2] == ["_", "_", "_", "_"]
+    assert len(plateau) == 3
+    assert len(plateau[0]) == 4
+
+
+def test_plateau_occupation():
+    plateau = Plateau((15, 15))
+    mot_sur_plateau(("DES", (7, 7), "H"), plateau)
+    assert not plateau.est_vide()
+    assert plateau.occupees == 3
+    assert plateau.occupation_lignes[7] == 0b111 << 7
+    assert plateau.occupation_colonnes[8] == 1 << 7
+    assert plateau.ligne(7) == "_______DES_____"
+    assert plateau.colonne(9) == "_______S_______"
+    plateau[7][9] = "_"
+    assert plateau.occupees == 2
+    assert plateau.occupation_colonnes[9] == 0
+
+
+def test_plateau_copie_independante():
+    plateau = Plateau((15, 15))
+    mot_sur_plateau(("DES", (7, 7), "H"), plateau)
+    copie = deepcopy(plateau)
+    copie[0][0] = "A"
+    assert copie.case(0, 0) == "A"
+    assert plateau.case(0, 0) == "_"
+    assert copie.occupees == 4
+    assert plateau.occupees == 3
+
+
+def test_empreinte_zobrist():
+    plateau = Plateau((15, 15))
+    assert plateau.empreinte == 0
+    mot_sur_plateau(("DES", (7, 7), "H"), plateau)
+    empreinte = plateau.empreinte
+    modifications = appliquer_coup(("DENI", (7, 7), "V"), plateau)
+    assert plateau.empreinte not in (0, empreinte)
+    annuler_coup(plateau, modifications)
+    assert plateau.empreinte == empreinte
+    # Même contenu, autre ordre de pose: même empreinte.
+    autre = Plateau((15, 15))
+    for c, lettre in reversed(list(enumerate("DES", 7))):
+        autre[7][c] = lettre
+    assert autre.empreinte == empreinte
+    assert Plateau.depuis_listes(plateau.vers_listes()).empreinte == empreinte
+    assert deepcopy(plateau).empreinte == empreinte
+    copie = pickle.loads(pickle.dumps(plateau))
+    assert copie == plateau and copie.empreinte == empreinte
+    autre[7][9] = "E"
+    assert autre.empreinte != empreinte
+
+
+def test_plateau_compatible_avec_les_fonctions_existantes():
+    listes = init_plateau((15, 15))
+    plateau = Plateau((15, 15))
+    for coup in [("RAPEE", (7, 7), "H"), ("PI", (7, 9), "V")]:
+        mot_sur_plateau(coup, listes)
+        mot_sur_plateau(coup, plateau)
+    assert plateau == listes
+    assert Plateau.depuis_listes(listes) == plateau
+    dico = Lexique.depuis_mots(["DENI", "PI", "RE", "DE", "RAPEE"])
+    for coup in [("DENI", (8, 7), "H"), ("PIE", (7, 9), "V"), ("RE", (6, 7), "V")]:
+        assert verif_emplacement(coup, plateau) == verif_emplacement(coup, listes)
+        assert placer_mot(coup, plateau) == placer_mot(coup, listes)
+        assert localisation_lettre_sur_plateau(
+            coup, plateau
+        ) == localisation_lettre_sur_plateau(coup, listes)
+        assert mots_perpendiculaires(coup, plateau, dico) == mots_perpendiculaires(
+            coup, listes, dico
+        )
+    assert set(generer_coups(plateau, "DENI", dico, 2)) == set(
+        generer_coups(listes, "DENI", dico, 2)
+    )
+    assert CacheContraintes(plateau, dico).masques == (
+        CacheContraintes(listes, dico).masques
+    )
+
+
+def test_appliquer_annuler_ne_garde_que_les_cases_modifiees():
+    plateau = Plateau((15, 15))
+    mot_sur_plateau(("RAPEE", (7, 7), "H"), plateau)
+    avant = plateau.copie()
+    modifications = plateau.appliquer(("SPIE", (6, 9), "V"))
+    assert modifications == [(6, 9, "_"), (8, 9, "_"), (9, 9, "_")]
+    assert plateau.colonne(9) == "______SPIE_____"
+    plateau.annuler(modifications)
+    assert plateau == avant
+    assert plateau.occupation_colonnes == avant.occupation_colonnes
+    assert plateau.occupees == avant.occupees
+
+
+def test_appliquer_annuler_sur_liste_avec_conflit():
+    plateau = init_plateau((15, 15))
+    mot_sur_plateau(("RAPEE", (7, 7), "H"), plateau)
+    avant = deepcopy(plateau)
+    modifications = appliquer_coup(("MOT", (7, 6), "H"), plateau)
+    assert plateau[7][6:10] == ["M", "O", "T", "P"]
+    annuler_coup(plateau, modifications)
+    assert plateau == avant
+
+
+def test_mots_perpendiculaires_rend_le_plateau_intact():
+    plateau = Plateau((15, 15))
+    mot_sur_plateau(("RAPEE", (7, 7), "H"), plateau)
+    avant = plateau.copie()
+    dico = Lexique.depuis_mots(["DENI", "RAPEE", "RD", "AE", "PN", "EI"])
+    assert mots_perpendiculaires(("DENI", (8, 7), "H"), plateau, dico) == [
+        "AE",
+        "DENI",
+        "EI",
+        "PN",
+        "RD",
+    ]
+    assert plateau == avant
+
+
+def test_coup_hors_du_plateau_ne_laisse_rien():
+    dico = Lexique.depuis_mots(["DENI", "RAPEE"])
+    for plateau in (init_plateau((15, 15)), Plateau((15, 15))):
+        mot_sur_plateau(("RAPEE", (7, 7), "H"), plateau)
+        avant = deepcopy(plateau)
+        for coup in (("DENIS", (8, 12), "H"), ("DENIS", (12, 7), "V")):
+            with pytest.raises(IndexError):
+                mots_perpendiculaires(coup, plateau, dico)
+            assert plateau == avant
@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+import pytest
+
+from src.scrabble.ordinateur import choisir_coup
+from src.scrabble.serveur import ServeurParties, Session
+
+
+@pytest.fixture
+def nouveau_serveur(lexique, lettres):
+    occurence, bareme = lettres
+
+    def fabriquer(processus=0):
+        return ServeurParties(lexique, occurence, bareme, processus)
+
+    return fabriquer
+
+
+class Client:
+    def __init__(self, lecteur, ecrivain):
+        self.lecteur, self.ecrivain = lecteur, ecrivain
+
+    async def envoyer(self, **message):
+        self.ecrivain.write(json.dumps(message).encode() + b"\n")
+        await self.ecrivain.drain()
+        return json.loads(await self.lecteur.readline())
+
+
+async def partie_a_deux(serveur, temoin):
+    tcp = await serveur.servir(port=0)
+    port = tcp.sockets[0].getsockname()[1]
+    ada = Client(*await asyncio.open_connection("127.0.0.1", port))
+    bob = Client(*await asyncio.open_connection("127.0.0.1", port))
+    reponse = await ada.envoyer(type="rejoindre", partie="p1", nom="Ada", graine=4)
+    assert (reponse["joueur"], reponse["complete"]) == (0, False)
+    assert (await ada.envoyer(type="passer"))["type"] == "erreur"
+    reponse = await bob.envoyer(type="rejoindre", partie="p1", nom="Bob")
+    assert (reponse["joueur"], reponse["complete"]) == (1, True)
+    assert (await bob.envoyer(type="passer"))["message"] == "ce n'est pas votre tour"
+    refuse = await ada.envoyer(
+        type="proposer", mot="DENI", ligne=0, colonne=0, direction="H"
+    )
+    assert not refuse["valide"] and "PREMIER_TOUR" in refuse["refus"]
+    assert (await ada.envoyer(type="plateau"))["courant"] == 0
+
+    # Le coup proposé est celui que l'ordinateur jouerait dans la même partie.
+    mot, (ligne, colonne), direction = choisir_coup(temoin)
+    joue = await ada.envoyer(
+        type="proposer", mot=mot, ligne=ligne, colonne=colonne, direction=direction
+    )
+    assert (
+        joue["valide"]
+        and joue["points"] == temoin.jouer((mot, (ligne, colonne), direction)).points
+    )
+    etat = await bob.envoyer(type="plateau")
+    assert etat["courant"] == 1 and etat["lignes"] == [
+        temoin.etat.plateau.ligne(li) for li in range(15)
+    ]
+    assert etat["chevalet"] == temoin.etat.joueurs[1].chevalet
+    scores = await bob.envoyer(type="scores")
+    assert scores["scores"] == [["Ada", joue["points"]], ["Bob", 0]]
+    assert (await bob.envoyer(type="inconnu"))["type"] == "erreur"
+    mauvais = await bob.envoyer(
+        type="proposer", mot="1A", ligne=7, colonne=7, direction="V"
+    )
+    assert mauvais["type"] == "erreur" and "A à Z" in mauvais["message"]
+    assert (await bob.envoyer(type="scores"))["type"] == "scores"
+    for client in (ada, bob):
+        client.ecrivain.close()
+        await client.ecrivain.wait_closed()
+    await asyncio.sleep(0.05)
+    assert serveur.parties == {}
+    tcp.close()
+    await tcp.wait_closed()
+
+
+async def partie_contre_ordinateur(serveur):
+    parties = [Session() for _ in range(20)]
+    for i, session in enumerate(parties):
+        message = {
+            "type": "rejoindre",
+            "partie": f"p{i}",
+            "nom": "Ada",
+            "ordinateurs": 1,
+            "graine": i,
+        }
+        await serveur.traiter(message, session)
+    reponses = await asyncio.gather(
+        *(serveur.traiter({"type": "passer"}, session) for session in parties)
+    )
+    assert len(serveur.parties) == 20
+    for reponse in reponses:
+        assert reponse["valide"] and len(reponse["ordinateurs"]) == 1
+        assert reponse["ordinateurs"][0]["joueur"] == 1
+    serveur.fermer()
+    return [reponse["ordinateurs"] for reponse in reponses]
+
+
+def test_partie_a_deux_par_tcp(nouveau_serveur, nouvelle_partie):
+    asyncio.run(partie_a_deux(nouveau_serveur(), nouvelle_partie(4)))
+
+
+def test_tours_des_ordinateurs(nouveau_serveur):
+    # Les coups cherchés dans les processus du serveur sont ceux cherchés sur place.
+    sur_place = asyncio.run(partie_contre_ordinateur(nouveau_serveur(0)))
+    assert asyncio.run(partie_contre_ordinateur(nouveau_serveur(2))) == sur_place
+    assert any(joues[0].get("mot") for joues in sur_place)
+
+
+async def erreur_interne(serveur):
+    traiter = serveur.traiter
+
+    async def defaillant(message, session):
+        if message["type"] == "passer":
+            raise RuntimeError("panne")
+        return await traiter(message, session)
+
+    serveur.traiter = defaillant
+    tcp = await serveur.servir(port=0)
+    client = Client(*await asyncio.open_connection(*tcp.sockets[0].getsockname()))
+    await client.envoyer(type="rejoindre", partie="p", nom="Ada", ordinateurs=1)
+    assert (await client.envoyer(type="passer"))["message"] == "erreur interne"
+    assert (await client.envoyer(type="scores"))["type"] == "scores"
+    client.ecrivain.close()
+    await client.ecrivain.wait_closed()
+    tcp.close()
+    await tcp.wait_closed()
+
+
+def test_erreur_interne_garde_la_session(nouveau_serveur):
+    asyncio.run(erreur_interne(nouveau_serveur()))
@@ -0,0 +1,51 @@
+import pytest
+
+from src.scrabble.lexique import Lexique
+from src.scrabble.ordinateur import choisir_coup, classer_coups
+from src.scrabble.simulation import Position, Simulateur, simuler
+
+
+@pytest.fixture
+def moteur(nouvelle_partie):
+    """Une partie de test arrivée au quatrième tour."""
+    moteur = nouvelle_partie(5)
+    while moteur.etat.tour < 4:
+        coup = choisir_coup(moteur)
+        if coup is None:
+            moteur.passer()
+        else:
+            moteur.jouer(coup)
+    return moteur
+
+
+def test_position_ne_voit_pas_le_chevalet_adverse(moteur):
+    position = Position.depuis_moteur(moteur)
+    adverse = moteur.etat.joueurs[0].chevalet
+    assert position.chevalet == moteur.joueur_courant.chevalet
+    assert position.taille_adverse == len(adverse)
+    assert len(position.non_vues) == len(moteur.etat.pioche) + len(adverse)
+    assert position.plateau == moteur.etat.plateau
+
+
+def test_simulations(moteur, lexique, fichier_dico):
+    plateau = moteur.etat.plateau.copie()
+    with Simulateur(lexique, moteur.bareme, 0) as simulateur:
+        points, coup = classer_coups(moteur, 1)[0]
+        position = Position.depuis_moteur(moteur)
+        assert simuler(position, coup, range(3), plis=1) == [points] * 3
+        locale = simulateur.evaluer(moteur, candidats=4, simulations=6)
+    assert moteur.etat.plateau == plateau
+    assert locale.simulations == 6 * len(locale.coups)
+    assert locale.simulations_par_seconde > 0
+    ecarts = [ecart for ecart, _, _ in locale.coups]
+    assert ecarts == sorted(ecarts, reverse=True)
+    with Simulateur(fichier_dico, moteur.bareme, 2) as simulateur:
+        repartie = simulateur.evaluer(moteur, candidats=4, simulations=6)
+        assert simulateur.choisir_coup(moteur, candidats=4) in moteur.coups_legaux()
+    assert repartie.coups == locale.coups
+    with Simulateur(lexique, moteur.bareme, 2) as simulateur:
+        partagee = simulateur.evaluer(moteur, candidats=4, simulations=6)
+        nom = simulateur._partage.nom_memoire
+    assert partagee.coups == locale.coups
+    with pytest.raises(FileNotFoundError):
+        Lexique.attacher(nom)
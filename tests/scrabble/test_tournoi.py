@@ -0,0 +1,33 @@
+import json
+
+from src.scrabble import tournoi
+
+
+def test_jouer_partie_reproductible(fichier_dico):
+    tournoi.initialiser("resources/Lettres.txt", fichier_dico, "resources/bonus.txt")
+    premiere = tournoi.jouer_partie(3, 10)
+    seconde = tournoi.jouer_partie(3, 10)
+    assert premiere["graine"] == 13
+    assert premiere["scores"] == seconde["scores"]
+    assert premiere["coups"] == seconde["coups"] > 0
+    assert set(premiere["durees"]) == set(tournoi.PHASES)
+
+
+def test_tournoi_jsonl(fichier_dico, tmp_path, capsys):
+    sortie = tmp_path / "resultats.jsonl"
+    tournoi.main(
+        ["-n", "6", "-p", "2", "-g", "10", "--dico", fichier_dico, "-o", str(sortie)]
+    )
+    resultats = [json.loads(ligne) for ligne in sortie.read_text().splitlines()]
+    assert [resultat["partie"] for resultat in resultats] == list(range(6))
+    tournoi.initialiser("resources/Lettres.txt", fichier_dico, "resources/bonus.txt")
+    assert resultats[3]["scores"] == tournoi.jouer_partie(3, 10)["scores"]
+    assert "parties/s" in capsys.readouterr().err
+
+
+def test_tournoi_memoire_partagee(fichier_dico):
+    resultats = list(tournoi.tournoi(4, 2, 10, fichier_dico=fichier_dico))
+    partages = list(
+        tournoi.tournoi(4, 2, 10, fichier_dico=fichier_dico, memoire_partagee=True)
+    )
+    assert [r["scores"] for r in partages] == [r["scores"] for r in resultats]